@@ -0,0 +1,202 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from classes.Config import Config
+from classes.Invoice import Invoice
+from classes.Menu import Menu
+from classes.OrderHistory import OrderHistory
+from classes.OrderService import OrderService
+from classes.ReservationService import ReservationService
+from classes.SQLiteDatabase import SQLiteDatabase
+
+DATA_FILES = ["./menu.json", "./tables.json"]
+ORDER_TYPES = ["Dine-In", "Takeaway", "Delivery"]
+CARD_DETAILS = {
+    "card_number": "4111111111111111",
+    "expiration_date": "12/40",
+    "cvv": "123",
+    "cardholder_name": "Bench Mark"
+}
+
+
+def order_request(service: OrderService, number: int) -> tuple:
+    """
+    Creates the order type, items and details of a sample order.
+
+    Parameters
+    ----------
+    service : OrderService
+        The service the order will be placed through.
+    number : int
+        The sequence number of the order, used to vary it.
+
+    Returns
+    -------
+    tuple
+        The order type, the quantity of each menu item id and the details.
+    """
+    item_ids = [item.id for item in service.menu.menu_items]
+    order_type = ORDER_TYPES[number % len(ORDER_TYPES)]
+    details = dict(CARD_DETAILS)
+    if order_type == "Dine-In":
+        details["table_number"] = "1"
+    else:
+        details.update(name="Bench Mark", mobile_number=f"04{number % 100000000:08d}", email=f"guest{number}@example.com")
+    if order_type == "Delivery":
+        details.update(address="1 Main Street", suburb="Hawthorn", postal_code="3122")
+    items = {item_ids[(number + offset) % len(item_ids)]: 1 + offset for offset in range(3)}
+    return order_type, items, details
+
+
+def benchmark_orders(count: int) -> None:
+    """
+    Places orders through the OrderService and prints the throughput.
+
+    Parameters
+    ----------
+    count : int
+        The number of orders to place.
+    """
+    service = OrderService()
+    started = time.perf_counter()
+    for number in range(count):
+        order_type, items, details = order_request(service, number)
+        service.place_order(order_type, items, **details)
+    elapsed = time.perf_counter() - started
+    Invoice.commit_queue.flush()
+    committed = time.perf_counter() - started
+    print(
+        f"[BENCHMARK] Placed {count} orders in {elapsed:.2f}s ({count / elapsed:.0f} orders/s, "
+        f"{Config.COMMIT_DURABILITY} durability), all committed after {committed:.2f}s"
+    )
+
+
+def benchmark_reservations(count: int) -> None:
+    """
+    Makes reservations through the ReservationService and prints the throughput.
+
+    Requests for fully booked slots are counted as rejected.
+
+    Parameters
+    ----------
+    count : int
+        The number of reservations to request.
+    """
+    service = ReservationService()
+    first_day = date.today() + timedelta(days=1)
+    rejected = 0
+    started = time.perf_counter()
+    for number in range(count):
+        details = {
+            "date": (first_day + timedelta(days=number % 30)).strftime("%d/%m/%Y"),
+            "time": f"{12 + number % 9:02d}:{15 * (number % 4):02d}",
+            "name": "Bench Mark",
+            "mobile_number": f"04{number % 100000000:08d}",
+            "email": f"guest{number}@example.com",
+            "party_size": 1 + number % 6
+        }
+        try:
+            service.reserve(details)
+        except ValueError:
+            rejected += 1
+    elapsed = time.perf_counter() - started
+    print(f"[BENCHMARK] Requested {count} reservations in {elapsed:.2f}s ({count / elapsed:.0f} requests/s, {rejected} fully booked)")
+
+
+def benchmark_stress(count: int) -> None:
+    """
+    Places orders from an increasing number of threads and checks none are lost.
+
+    Every thread also constructs the Menu, which must yield a single instance.
+    After each round the order history, order index and ticket numbers are
+    checked against the orders that were placed, and the run stops with an
+    error if any order is missing or duplicated.
+
+    Parameters
+    ----------
+    count : int
+        The number of orders to place in each round.
+    """
+    Menu._instance = None
+    placed = []
+    for thread_count in (1, 2, 4, 8, 16):
+        round_ids = []
+        menus = []
+        errors = []
+
+        def worker(first: int, total: int) -> None:
+            try:
+                service = OrderService(Menu())
+                menus.append(service.menu)
+                for number in range(first, first + total):
+                    order_type, items, details = order_request(service, number)
+                    round_ids.append(service.place_order(order_type, items, **details).order_data["order_id"])
+            except Exception as error:
+                errors.append(error)
+
+        per_thread = count // thread_count
+        threads = [
+            threading.Thread(target=worker, args=(len(placed) + index * per_thread, per_thread))
+            for index in range(thread_count)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if errors:
+            raise SystemExit(f"[BENCHMARK] {len(errors)} threads failed: {errors[0]!r}")
+        if len({id(menu) for menu in menus}) != 1:
+            raise SystemExit("[BENCHMARK] Threads constructed more than one Menu")
+        placed += round_ids
+        print(f"[BENCHMARK] {thread_count:>2} threads placed {len(round_ids)} orders in {elapsed:.2f}s ({len(round_ids) / elapsed:.0f} orders/s)")
+
+    Invoice.commit_queue.flush()
+    order_history = OrderHistory()
+    stored = [order_data["order_id"] for order_data in order_history.iter_orders()]
+    tickets = [order_data["ticket_number"] for order_data in order_history.iter_orders()]
+    missing = set(placed) - set(stored)
+    unindexed = [order_id for order_id in placed if order_history.find(order_id) is None]
+    if missing or unindexed or len(stored) != len(placed) or len(set(tickets)) != len(tickets):
+        raise SystemExit(
+            f"[BENCHMARK] Lost {len(missing)} orders, {len(unindexed)} unindexed, "
+            f"{len(stored) - len(placed)} extra, {len(tickets) - len(set(tickets))} duplicate tickets"
+        )
+    print(f"[BENCHMARK] All {len(placed)} orders stored and indexed once, with unique ticket numbers")
+
+
+if __name__ == '__main__':
+    """
+    Measures the throughput of the headless services.
+
+    The benchmark runs in a temporary directory with a copy of the menu and
+    table layout, imported into SQLite for the "sqlite" backend, so the data
+    files of the restaurant are not touched.
+
+    Usage:
+        python benchmark.py orders [count]       Places orders through the OrderService.
+        python benchmark.py reservations [count] Makes reservations through the ReservationService.
+        python benchmark.py stress [count]       Places orders from 1 to 16 threads and checks none are lost.
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    benchmarks = {"orders": benchmark_orders, "reservations": benchmark_reservations, "stress": benchmark_stress}
+    if command not in benchmarks:
+        print("Usage: python benchmark.py orders | reservations | stress [count]")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for file_path in DATA_FILES:
+            if os.path.exists(file_path):
+                shutil.copy(file_path, work_dir)
+        os.chdir(work_dir)
+        if Config.STORAGE_BACKEND == "sqlite":
+            for file_path in DATA_FILES:
+                SQLiteDatabase.import_json(file_path, Config.SQLITE_PATH)
+        benchmarks[command](count)
@@ -0,0 +1,268 @@
+import calendar
+import json
+import os
+from array import array
+from datetime import date, datetime, timedelta
+import numpy as np
+from classes.OrderHistory import OrderHistory
+
+
+class AnalyticsStore:
+    """
+    A class to export the order history into columnar NumPy arrays.
+
+    Every order line item becomes one row across a set of ``.npy`` column files:
+    the order timestamp as int64 epoch seconds, the order type code, the menu
+    item id, the quantity and the line total in integer cents. Rows are sorted by
+    timestamp, so a date range is found with a binary search, and the columns are
+    memory-mapped when loaded, so aggregations over millions of rows only touch
+    the columns they use.
+
+    Timestamps are the restaurant's local wall-clock time encoded as if it were
+    UTC, so days, hours and weekdays can be derived with integer arithmetic.
+
+    Attributes
+    ----------
+    directory : str
+        The directory holding the column files.
+
+    Methods
+    -------
+    refresh(order_history: OrderHistory = None) -> int:
+        Rebuilds the column files from the order history.
+    load() -> dict:
+        Memory-maps the column files.
+    item_names() -> dict:
+        Returns the latest name of every menu item id in the store.
+    select(from_date: date = None, to_date: date = None) -> dict:
+        Returns the columns of the rows between two dates, inclusive.
+    group_by(columns: dict, key: str, value: str = "total_cents") -> tuple:
+        Sums a value column per distinct key.
+    day_to_date(day: int) -> date:
+        Converts a "day" group key back into a date.
+    """
+
+    ANALYTICS_DIR = "./analytics"
+    ORDER_TYPES = ["Dine-In", "Takeaway", "Delivery"]
+    COLUMNS = {
+        "timestamp": np.int64,
+        "order_type": np.int8,
+        "item_id": np.int32,
+        "quantity": np.int32,
+        "total_cents": np.int64
+    }
+    SECONDS_PER_DAY = 86400
+    DENSE_GROUP_LIMIT = 1 << 20
+
+    def __init__(self, directory: str = None):
+        """
+        Constructs all the necessary attributes for the AnalyticsStore object.
+
+        Parameters
+        ----------
+        directory : str, optional
+            The directory holding the column files (default is AnalyticsStore.ANALYTICS_DIR).
+        """
+        self.directory = directory or AnalyticsStore.ANALYTICS_DIR
+
+    def refresh(self, order_history: OrderHistory = None) -> int:
+        """
+        Rebuilds the column files from the order history.
+
+        The history is streamed once into compact typed buffers, sorted by
+        timestamp and written as one ``.npy`` file per column.
+
+        Parameters
+        ----------
+        order_history : OrderHistory, optional
+            The order history to export (default is a new OrderHistory).
+
+        Returns
+        -------
+        int
+            The number of line items exported.
+        """
+        order_history = order_history or OrderHistory()
+        buffers = {
+            "timestamp": array('q'),
+            "order_type": array('b'),
+            "item_id": array('i'),
+            "quantity": array('i'),
+            "total_cents": array('q')
+        }
+        order_type_codes = {order_type: code for code, order_type in enumerate(AnalyticsStore.ORDER_TYPES)}
+        names = {}
+
+        for order_data in order_history.iter_orders():
+            timestamp = calendar.timegm(
+                datetime.strptime(order_data["date_time"], OrderHistory.DATE_TIME_FORMAT).timetuple()
+            )
+            order_type = order_type_codes.get(order_data["order_type"], -1)
+            for item in order_data["items"]:
+                buffers["timestamp"].append(timestamp)
+                buffers["order_type"].append(order_type)
+                buffers["item_id"].append(item["id"])
+                buffers["quantity"].append(item["quantity"])
+                buffers["total_cents"].append(round(item["total_price"] * 100))
+                names[item["id"]] = item["name"]
+
+        columns = {
+            name: np.frombuffer(buffer, dtype=AnalyticsStore.COLUMNS[name]) if len(buffer)
+            else np.empty(0, dtype=AnalyticsStore.COLUMNS[name])
+            for name, buffer in buffers.items()
+        }
+        order = np.argsort(columns["timestamp"], kind="stable")
+
+        os.makedirs(self.directory, exist_ok=True)
+        for name, column in columns.items():
+            temp_path = os.path.join(self.directory, f".{name}.tmp.npy")
+            np.save(temp_path, column[order])
+            os.replace(temp_path, os.path.join(self.directory, f"{name}.npy"))
+        with open(os.path.join(self.directory, "items.json"), 'w') as file:
+            json.dump({str(item_id): name for item_id, name in names.items()}, file, indent=4)
+        return len(order)
+
+    def load(self) -> dict:
+        """
+        Memory-maps the column files.
+
+        Returns
+        -------
+        dict
+            The read-only column arrays keyed by column name. The arrays are empty
+            if the store has not been refreshed yet.
+        """
+        columns = {}
+        for name, dtype in AnalyticsStore.COLUMNS.items():
+            try:
+                columns[name] = np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode='r')
+            except (FileNotFoundError, ValueError):
+                columns[name] = np.empty(0, dtype=dtype)
+        return columns
+
+    def item_names(self) -> dict:
+        """
+        Returns the latest name of every menu item id in the store.
+
+        Returns
+        -------
+        dict
+            The item names keyed by integer menu item id.
+        """
+        try:
+            with open(os.path.join(self.directory, "items.json"), 'r') as file:
+                return {int(item_id): name for item_id, name in json.load(file).items()}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def select(self, from_date: date = None, to_date: date = None) -> dict:
+        """
+        Returns the columns of the rows between two dates, inclusive.
+
+        Parameters
+        ----------
+        from_date : date, optional
+            The first day to include (default is the first row).
+        to_date : date, optional
+            The last day to include (default is the last row).
+
+        Returns
+        -------
+        dict
+            Views of the column arrays restricted to the range.
+        """
+        columns = self.load()
+        timestamps = columns["timestamp"]
+        start = 0 if from_date is None else np.searchsorted(timestamps, self._epoch(from_date), side='left')
+        end = len(timestamps) if to_date is None else np.searchsorted(
+            timestamps, self._epoch(to_date + timedelta(days=1)), side='left'
+        )
+        return {name: column[start:end] for name, column in columns.items()}
+
+    @staticmethod
+    def group_by(columns: dict, key: str, value: str = "total_cents") -> tuple:
+        """
+        Sums a value column per distinct key.
+
+        Parameters
+        ----------
+        columns : dict
+            The column arrays, as returned by load() or select().
+        key : str
+            The grouping key: "day", "hour", "weekday", "item_id" or "order_type".
+        value : str, optional
+            The column to sum, e.g. "quantity" (default is "total_cents").
+
+        Returns
+        -------
+        tuple
+            The sorted distinct keys and the sum of the value column for each key.
+
+        Raises
+        ------
+        ValueError
+            If an invalid grouping key is provided.
+        """
+        timestamps = columns["timestamp"]
+        if key == "day":
+            keys = timestamps // AnalyticsStore.SECONDS_PER_DAY
+        elif key == "hour":
+            keys = (timestamps // 3600) % 24
+        elif key == "weekday":
+            # 1 January 1970 was a Thursday, so day 0 has weekday 3 (Monday is 0)
+            keys = (timestamps // AnalyticsStore.SECONDS_PER_DAY + 3) % 7
+        elif key in ("item_id", "order_type"):
+            keys = columns[key]
+        else:
+            raise ValueError("Invalid grouping key")
+
+        if not len(keys):
+            return keys[:0], np.empty(0, dtype=np.int64)
+
+        # dense keys (hours, days, item ids) are summed with one bincount pass,
+        # sparse keys fall back to sorting with np.unique
+        low = int(keys.min())
+        span = int(keys.max()) - low + 1
+        if span <= AnalyticsStore.DENSE_GROUP_LIMIT:
+            sums = np.bincount(keys - low, weights=columns[value], minlength=span)
+            counts = np.bincount(keys - low, minlength=span)
+            present = np.flatnonzero(counts)
+            return present + low, sums[present].astype(np.int64)
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sums = np.bincount(inverse, weights=columns[value], minlength=len(unique_keys))
+        return unique_keys, sums.astype(np.int64)
+
+    @staticmethod
+    def day_to_date(day: int) -> date:
+        """
+        Converts a "day" group key back into a date.
+
+        Parameters
+        ----------
+        day : int
+            The number of days since 1 January 1970.
+
+        Returns
+        -------
+        date
+            The calendar date.
+        """
+        return date(1970, 1, 1) + timedelta(days=int(day))
+
+    @staticmethod
+    def _epoch(day: date) -> int:
+        """
+        Returns the timestamp of midnight at the start of a day.
+
+        Parameters
+        ----------
+        day : date
+            The calendar date.
+
+        Returns
+        -------
+        int
+            The epoch seconds of the day's midnight.
+        """
+        return calendar.timegm(day.timetuple())
@@ -0,0 +1,356 @@
+import json
+from datetime import date
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+from classes.Config import Config
+
+
+class ApiClient:
+    """
+    A class to call the HTTP/JSON API of an ApiServer.
+
+    The terminal screens use it instead of the local data files when
+    Config.SERVER_URL is set. Its availability methods match those of the
+    AvailabilityEngine, so the reservation screen can use either.
+
+    Attributes
+    ----------
+    base_url : str
+        The URL of the API server.
+
+    Methods
+    -------
+    menu_items(category: str = None, query: str = "") -> list:
+        Returns the menu items as dicts.
+    categories() -> list:
+        Returns the menu categories.
+    checkout(payment) -> dict:
+        Places the order of a completed Payment on the server.
+    find_order(order_id: str, pin: str) -> dict | None:
+        Returns an order record by its order_id.
+    is_available(day: date, time: str, party_size: int) -> bool:
+        Checks whether a party can be seated at a time.
+    suggest(day: date, time: str, party_size: int, limit: int = 3) -> list:
+        Returns the free start times closest to a requested time.
+    free_slots(day: date, party_size: int = 1) -> list:
+        Returns the start times at which a party can be seated on a day.
+    reserve(details: dict) -> dict:
+        Makes a reservation on the server.
+    join_waitlist(details: dict) -> dict:
+        Adds a party to the waitlist on the server.
+    sales_report(from_date: str, to_date: str, pin: str) -> dict:
+        Returns the sales summary of a date range.
+    reservations_report(on_date: str, pin: str) -> list:
+        Returns the reservations of a day.
+    """
+
+    TIMEOUT = 10
+
+    def __init__(self, base_url: str = None):
+        """
+        Constructs all the necessary attributes for the ApiClient object.
+
+        Parameters
+        ----------
+        base_url : str, optional
+            The URL of the API server (default is Config.SERVER_URL).
+        """
+        self.base_url = (base_url or Config.SERVER_URL).rstrip("/")
+
+    def menu_items(self, category: str = None, query: str = "") -> list:
+        """
+        Returns the menu items as dicts.
+
+        Parameters
+        ----------
+        category : str, optional
+            The category to return (default is every category).
+        query : str, optional
+            A search query (default is no search).
+
+        Returns
+        -------
+        list
+            The menu items in menu order.
+        """
+        params = {"q": query}
+        if category:
+            params["category"] = category
+        return self._request("GET", "/menu", params)["items"]
+
+    def categories(self) -> list:
+        """
+        Returns the menu categories.
+
+        Returns
+        -------
+        list
+            The category names in menu order.
+        """
+        return self._request("GET", "/menu/categories")["categories"]
+
+    def checkout(self, payment) -> dict:
+        """
+        Places the order of a completed Payment on the server.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment, with every required detail entered.
+
+        Returns
+        -------
+        dict
+            The stored order record.
+
+        Raises
+        ------
+        ValueError
+            If the server rejects the order.
+        """
+        details = {field: payment.get_detail(field) for field, _, _ in payment.required_details()}
+        details["note"] = payment.note
+        return self._request("POST", "/orders", payload={
+            "order_type": payment.order.order_type,
+            "items": {str(item.menu_item.id): item.quantity for item in payment.order.order_items},
+            "details": details
+        })
+
+    def find_order(self, order_id: str, pin: str) -> dict | None:
+        """
+        Returns an order record by its order_id.
+
+        Parameters
+        ----------
+        order_id : str
+            The ID of the order.
+        pin : str
+            The staff PIN.
+
+        Returns
+        -------
+        dict | None
+            The order record, or None if no order has that ID.
+        """
+        try:
+            return self._request("GET", f"/orders/{quote(order_id, safe='')}", pin=pin)
+        except LookupError:
+            return None
+
+    def is_available(self, day: date, time: str, party_size: int) -> bool:
+        """
+        Checks whether a party can be seated at a time.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservation.
+        time : str
+            The start time (HH:MM).
+        party_size : int
+            The number of guests.
+
+        Returns
+        -------
+        bool
+            True if the party can be seated.
+        """
+        return self._availability(day, time, party_size)["available"]
+
+    def suggest(self, day: date, time: str, party_size: int, limit: int = 3) -> list:
+        """
+        Returns the free start times closest to a requested time.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservation.
+        time : str
+            The requested start time (HH:MM).
+        party_size : int
+            The number of guests.
+        limit : int, optional
+            The maximum number of times to return (default is 3).
+
+        Returns
+        -------
+        list
+            The suggested start times as HH:MM strings.
+        """
+        return self._availability(day, time, party_size)["suggestions"][:limit]
+
+    def free_slots(self, day: date, party_size: int = 1) -> list:
+        """
+        Returns the start times at which a party can be seated on a day.
+
+        Parameters
+        ----------
+        day : date
+            The day.
+        party_size : int, optional
+            The number of guests (default is 1).
+
+        Returns
+        -------
+        list
+            The free start times as HH:MM strings.
+        """
+        params = {"date": day.strftime("%d/%m/%Y"), "party_size": party_size}
+        return self._request("GET", "/reservations/free-slots", params)["free_slots"]
+
+    def reserve(self, details: dict) -> dict:
+        """
+        Makes a reservation on the server.
+
+        Parameters
+        ----------
+        details : dict
+            The date (DD/MM/YYYY), time (HH:MM), name, mobile_number, email,
+            party_size and accommodations of the reservation.
+
+        Returns
+        -------
+        dict
+            The stored reservation.
+
+        Raises
+        ------
+        ValueError
+            If the server rejects the reservation, e.g. because the slot is full.
+        """
+        return self._request("POST", "/reservations", payload=details)
+
+    def join_waitlist(self, details: dict) -> dict:
+        """
+        Adds a party to the waitlist on the server.
+
+        Parameters
+        ----------
+        details : dict
+            The reservation details, as for reserve.
+
+        Returns
+        -------
+        dict
+            The waitlist entry.
+        """
+        return self._request("POST", "/waitlist", payload=details)
+
+    def sales_report(self, from_date: str, to_date: str, pin: str) -> dict:
+        """
+        Returns the sales summary of a date range.
+
+        Parameters
+        ----------
+        from_date : str
+            The first day to include (DD/MM/YYYY).
+        to_date : str
+            The last day to include (DD/MM/YYYY).
+        pin : str
+            The staff PIN.
+
+        Returns
+        -------
+        dict
+            The attributes of the SalesSummary.
+        """
+        return self._request("GET", "/reports/sales", {"from": from_date, "to": to_date}, pin=pin)
+
+    def reservations_report(self, on_date: str, pin: str) -> list:
+        """
+        Returns the reservations of a day.
+
+        Parameters
+        ----------
+        on_date : str
+            The day (DD/MM/YYYY).
+        pin : str
+            The staff PIN.
+
+        Returns
+        -------
+        list
+            The reservations in time order.
+        """
+        return self._request("GET", "/reports/reservations", {"date": on_date}, pin=pin)["reservations"]
+
+    def _availability(self, day: date, time: str, party_size: int) -> dict:
+        """
+        Returns the availability of a slot and the closest free times.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservation.
+        time : str
+            The start time (HH:MM).
+        party_size : int
+            The number of guests.
+
+        Returns
+        -------
+        dict
+            The "available" flag and "suggestions" list.
+        """
+        params = {"date": day.strftime("%d/%m/%Y"), "time": time, "party_size": party_size}
+        return self._request("GET", "/reservations/availability", params)
+
+    def _request(self, method: str, path: str, params: dict = None, payload: dict = None, pin: str = None) -> dict:
+        """
+        Sends a request to the API server and returns its JSON response.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        path : str
+            The URL path.
+        params : dict, optional
+            The query string parameters.
+        payload : dict, optional
+            The JSON body.
+        pin : str, optional
+            The staff PIN for staff endpoints.
+
+        Returns
+        -------
+        dict
+            The JSON response.
+
+        Raises
+        ------
+        ValueError
+            If the server rejects the request.
+        LookupError
+            If the requested record does not exist.
+        PermissionError
+            If the staff PIN is wrong.
+        TimeoutError
+            If the server could not commit or look up an order in time.
+        ConnectionError
+            If the server cannot be reached.
+        """
+        url = self.base_url + path + (f"?{urlencode(params)}" if params else "")
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+        if pin is not None:
+            request.add_header("X-Staff-Pin", pin)
+
+        try:
+            with urlopen(request, timeout=ApiClient.TIMEOUT) as response:
+                return json.loads(response.read())
+        except HTTPError as error:
+            try:
+                message = json.loads(error.read()).get("error", error.reason)
+            except ValueError:
+                message = error.reason
+            if error.code == 404:
+                raise LookupError(message) from None
+            if error.code == 401:
+                raise PermissionError(message) from None
+            if error.code == 503:
+                raise TimeoutError(message) from None
+            raise ValueError(message) from None
+        except URLError as error:
+            raise ConnectionError(f"Cannot reach the server at {self.base_url}: {error.reason}") from None
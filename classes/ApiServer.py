@@ -0,0 +1,505 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+from classes.CommitQueue import CommitQueue
+from classes.Config import Config
+from classes.Invoice import Invoice
+from classes.Menu import Menu
+from classes.OrderHistory import OrderHistory
+from classes.OrderService import OrderService
+from classes.PinValidator import PinValidator
+from classes.Reports import Reports
+from classes.ReservationBook import ReservationBook
+from classes.ReservationService import ReservationService
+from classes.AvailabilityEngine import AvailabilityEngine
+
+
+class ApiServer:
+    """
+    A class to serve the restaurant system to many terminals over a local HTTP/JSON API.
+
+    Connections are handled by an asyncio event loop, so a slow or idle terminal
+    never holds up the others. Menu requests are answered from the single
+    in-memory Menu on the event loop. Orders, reservations and availability
+    checks run on one storage thread, so commits are applied one at a time in
+    arrival order without blocking the event loop. Orders are only queued on
+    the storage thread and their commits awaited elsewhere, so the orders of
+    many terminals share one group commit. Reports and order lookups
+    only read the data files and run on a separate pool of report threads, so a
+    long report never delays a commit.
+
+    Endpoints
+    ---------
+    GET  /menu?category=&q=&page=&page_size=    Menu items, optionally filtered and paginated.
+    GET  /menu/categories                       Menu categories.
+    POST /orders                                Places an order; returns the order record.
+    GET  /orders/<order_id>                     An order record (staff only).
+    GET  /reservations/availability?date=&time=&party_size=
+                                                Whether a slot is free, with suggested times.
+    GET  /reservations/free-slots?date=&party_size=
+                                                The free start times of a day.
+    POST /reservations                          Makes a reservation; returns the stored record.
+    POST /waitlist                              Adds a party to the waitlist; returns the entry.
+    GET  /reports/sales?from=&to=               The sales summary of a date range (staff only).
+    GET  /reports/reservations?date=            The reservations of a day (staff only).
+
+    Dates are DD/MM/YYYY and times HH:MM, as on the terminal screens. Staff
+    endpoints require the staff PIN in an X-Staff-Pin header. Errors are
+    returned as {"error": message}. A request that waits longer than
+    Config.COMMIT_TIMEOUT for orders to be committed returns 503; its order
+    stays queued and is committed once storage is available.
+
+    Attributes
+    ----------
+    host : str
+        The address the server listens on.
+    port : int
+        The port the server listens on.
+    menu : Menu
+        An instance of the Menu class representing the menu.
+    order_service : OrderService
+        The service used to place orders.
+    reservation_service : ReservationService
+        The service used to make reservations.
+    storage_executor : ThreadPoolExecutor
+        The single thread that runs the requests that write to the data files.
+    report_executor : ThreadPoolExecutor
+        The threads that run reports and order lookups.
+
+    Methods
+    -------
+    run() -> None:
+        Serves requests until interrupted.
+    serve() -> None:
+        Starts listening and serves requests forever.
+    handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        Serves the requests of one connection.
+    dispatch(method: str, path: str, query: dict, headers: dict, body: bytes) -> tuple:
+        Routes a request to its handler.
+    """
+
+    MAX_BODY_SIZE = 1024 * 1024
+    REPORT_THREADS = 4
+
+    def __init__(self, host: str = None, port: int = None):
+        """
+        Constructs all the necessary attributes for the ApiServer object.
+
+        Parameters
+        ----------
+        host : str, optional
+            The address to listen on (default is Config.SERVER_HOST).
+        port : int, optional
+            The port to listen on (default is Config.SERVER_PORT).
+        """
+        self.host = host or Config.SERVER_HOST
+        self.port = port or Config.SERVER_PORT
+        self.menu = Menu()
+        self.order_service = OrderService(self.menu)
+        self.reservation_service = ReservationService()
+        self.storage_executor = ThreadPoolExecutor(max_workers=1)
+        self.report_executor = ThreadPoolExecutor(max_workers=ApiServer.REPORT_THREADS)
+        self._routes = {
+            ("GET", "/menu"): (self._get_menu, None, False),
+            ("GET", "/menu/categories"): (self._get_categories, None, False),
+            ("POST", "/orders"): (self._post_order, None, False),
+            ("GET", "/orders/"): (self._get_order, self.report_executor, True),
+            ("GET", "/reservations/availability"): (self._get_availability, self.storage_executor, False),
+            ("GET", "/reservations/free-slots"): (self._get_free_slots, self.storage_executor, False),
+            ("POST", "/reservations"): (self._post_reservation, self.storage_executor, False),
+            ("POST", "/waitlist"): (self._post_waitlist, self.storage_executor, False),
+            ("GET", "/reports/sales"): (self._get_sales_report, self.report_executor, True),
+            ("GET", "/reports/reservations"): (self._get_reservations_report, self.report_executor, True)
+        }
+
+    def run(self) -> None:
+        """
+        Serves requests until interrupted.
+        """
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.storage_executor.shutdown()
+            self.report_executor.shutdown()
+            CommitQueue.close_all()
+
+    async def serve(self) -> None:
+        """
+        Starts listening and serves requests forever.
+        """
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        print(f"[SYSTEM] Serving the API on http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves the requests of one connection.
+
+        Connections are kept alive between requests unless the client asks to
+        close them.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The stream the requests are read from.
+        writer : asyncio.StreamWriter
+            The stream the responses are written to.
+        """
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                url = urlsplit(target)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                status, payload = await self.dispatch(method, unquote(url.path), query, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ValueError):
+            await self._write_response(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request."}, False)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, path: str, query: dict, headers: dict, body: bytes) -> tuple:
+        """
+        Routes a request to its handler.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        path : str
+            The URL path.
+        query : dict
+            The query string parameters.
+        headers : dict
+            The request headers, with lowercase names.
+        body : bytes
+            The request body.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        route = self._routes.get((method, path))
+        argument = None
+        if route is None and path.startswith("/orders/") and len(path) > len("/orders/"):
+            route = self._routes.get((method, "/orders/"))
+            argument = path[len("/orders/"):]
+        if route is None:
+            known = any(route_path == path for _, route_path in self._routes)
+            return (HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Method not allowed."}) if known \
+                else (HTTPStatus.NOT_FOUND, {"error": "Not found."})
+
+        handler, executor, staff_only = route
+        if staff_only and not PinValidator.is_valid(headers.get("x-staff-pin", "")):
+            return HTTPStatus.UNAUTHORIZED, {"error": "Invalid PIN."}
+
+        try:
+            data = json.loads(body) if body else {}
+            call = partial(handler, argument if argument is not None else query, data)
+            if executor is not None:
+                return await asyncio.get_running_loop().run_in_executor(executor, call)
+            result = call()
+            return await result if asyncio.iscoroutine(result) else result
+        except (ValueError, KeyError, TypeError) as error:
+            message = f"Missing {error.args[0]}." if isinstance(error, KeyError) else str(error)
+            return HTTPStatus.BAD_REQUEST, {"error": message}
+        except TimeoutError as error:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(error)}
+        except Exception as error:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}
+
+    def _get_menu(self, query: dict, data: dict) -> tuple:
+        """
+        Returns the menu items, optionally filtered by category and search query and paginated.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        items = [vars(item) for item in self.menu.search(query.get("q", ""), query.get("category"))]
+        if "page" not in query:
+            return HTTPStatus.OK, {"items": items}
+        page = int(query["page"])
+        page_size = int(query.get("page_size", Config.MENU_PAGE_SIZE))
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be at least 1.")
+        return HTTPStatus.OK, {
+            "items": items[(page - 1) * page_size:page * page_size],
+            "page": page,
+            "page_count": max(1, -(-len(items) // page_size)),
+            "total": len(items)
+        }
+
+    def _get_categories(self, query: dict, data: dict) -> tuple:
+        """
+        Returns the menu categories.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        return HTTPStatus.OK, {"categories": self.menu.categories()}
+
+    async def _post_order(self, query: dict, data: dict) -> tuple:
+        """
+        Places an order of {"order_type", "items": {item_id: quantity}, "details": {...}}.
+
+        The order is queued for commit on the storage thread, which returns at
+        once, and the commit is awaited on another thread. The storage thread is
+        therefore free to queue the orders of other terminals, and they are
+        committed together in one batch.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        items = {int(item_id): int(quantity) for item_id, quantity in data["items"].items()}
+        loop = asyncio.get_running_loop()
+        invoice = await loop.run_in_executor(self.storage_executor, partial(
+            self.order_service.place_order, data["order_type"], items, False, **data.get("details", {})
+        ))
+        await loop.run_in_executor(None, Invoice.commit_queue.confirm, invoice.commit_sequence)
+        return HTTPStatus.CREATED, invoice.order_data
+
+    def _get_order(self, order_id: str, data: dict) -> tuple:
+        """
+        Returns an order record by its order_id.
+
+        Parameters
+        ----------
+        order_id : str
+            The order_id from the URL path.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        order_data = OrderHistory().find(order_id)
+        if order_data is None and Invoice.commit_queue.pending():
+            if not Invoice.commit_queue.flush(Invoice.commit_queue.timeout):
+                raise TimeoutError("Recent orders are still being committed. Please try again shortly.")
+            order_data = OrderHistory().find(order_id)
+        if order_data is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"No order found with ID {order_id}."}
+        return HTTPStatus.OK, order_data
+
+    def _get_availability(self, query: dict, data: dict) -> tuple:
+        """
+        Returns whether a party can be seated at a time, with the closest free times if not.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        day = datetime.strptime(query["date"], "%d/%m/%Y").date()
+        party_size = int(query["party_size"])
+        engine = AvailabilityEngine()
+        if engine.is_available(day, query["time"], party_size):
+            return HTTPStatus.OK, {"available": True, "suggestions": []}
+        return HTTPStatus.OK, {"available": False, "suggestions": engine.suggest(day, query["time"], party_size)}
+
+    def _get_free_slots(self, query: dict, data: dict) -> tuple:
+        """
+        Returns the free start times of a day for a party.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        day = datetime.strptime(query["date"], "%d/%m/%Y").date()
+        return HTTPStatus.OK, {"free_slots": self.reservation_service.free_slots(day, int(query.get("party_size", 1)))}
+
+    def _post_reservation(self, query: dict, data: dict) -> tuple:
+        """
+        Makes a reservation from its details.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        return HTTPStatus.CREATED, self.reservation_service.reserve(data)
+
+    def _post_waitlist(self, query: dict, data: dict) -> tuple:
+        """
+        Adds a party to the waitlist from its reservation details.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        return HTTPStatus.CREATED, self.reservation_service.join_waitlist(data)
+
+    def _get_sales_report(self, query: dict, data: dict) -> tuple:
+        """
+        Returns the sales summary of a date range.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        return HTTPStatus.OK, vars(Reports().summarize_sales(query["from"], query["to"]))
+
+    def _get_reservations_report(self, query: dict, data: dict) -> tuple:
+        """
+        Returns the reservations of a day.
+
+        Parameters
+        ----------
+        query : dict
+            The query string parameters.
+        data : dict
+            The JSON body of the request.
+
+        Returns
+        -------
+        tuple
+            The HTTP status and the JSON payload of the response.
+        """
+        day = datetime.strptime(query["date"], "%d/%m/%Y").date()
+        return HTTPStatus.OK, {"reservations": ReservationBook().on_date(day)}
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple | None:
+        """
+        Reads one HTTP request.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The stream to read from.
+
+        Returns
+        -------
+        tuple | None
+            The method, target, headers and body, or None if the client closed
+            the connection.
+
+        Raises
+        ------
+        ValueError
+            If the request is malformed or its body is too large.
+        """
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if length > ApiServer.MAX_BODY_SIZE:
+            raise ValueError("Request body too large.")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+        """
+        Writes a JSON response.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            The stream to write to.
+        status : int
+            The HTTP status.
+        payload : dict
+            The JSON payload.
+        keep_alive : bool
+            True to keep the connection open for another request.
+        """
+        body = json.dumps(payload).encode("utf-8")
+        status = HTTPStatus(status)
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
@@ -0,0 +1,279 @@
+from datetime import date
+from classes.Config import Config
+from classes.ReservationBook import ReservationBook
+from classes.TableAssigner import TableAssigner
+from classes.TableLayout import TableLayout
+
+
+class AvailabilityEngine:
+    """
+    A class to check reservation requests against the restaurant's tables.
+
+    A request is accepted only if the TableAssigner can still seat every party
+    of the day, the request included, at the tables of the TableLayout. The
+    check runs the same packing that assign_day() later stores, so every
+    booking accepted is seated at a real table or combination of tables rather
+    than counted against the average seats per table.
+
+    Every booking occupies its tables from its start time for the average
+    dining duration. The day's bookings are found with a binary search in the
+    sorted ReservationBook and read once per call, however many times are
+    checked, so checking a request only touches that day's bookings, however
+    many future bookings exist.
+
+    Attributes
+    ----------
+    reservation_book : ReservationBook
+        The reservations the capacity is checked against.
+    layout : TableLayout
+        The tables the parties are seated at.
+    seats : int
+        The total number of seats of the layout.
+    tables : int
+        The number of tables of the layout.
+    dining_minutes : int
+        The time a party occupies its tables.
+    slot_minutes : int
+        The interval between bookable start times.
+
+    Methods
+    -------
+    is_available(day: date, time: str, party_size: int, reservations: list = None) -> bool:
+        Checks whether a party can be seated at a time.
+    largest_parties(day: date, times: list, reservations: list = None) -> dict:
+        Returns the largest party that can be seated at each of several times.
+    free_slots(day: date, party_size: int = 1) -> list:
+        Returns the start times at which a party can be seated on a day.
+    suggest(day: date, time: str, party_size: int, limit: int = 3) -> list:
+        Returns the free start times closest to a requested time.
+    """
+
+    OPENING_TIME = "09:00"
+    LAST_SEATING_TIME = "21:00"
+
+    def __init__(self, reservation_book: ReservationBook = None, layout: TableLayout = None,
+                 dining_minutes: int = None):
+        """
+        Constructs all the necessary attributes for the AvailabilityEngine object.
+
+        Parameters
+        ----------
+        reservation_book : ReservationBook, optional
+            The reservations to check against (default is a new ReservationBook).
+        layout : TableLayout, optional
+            The tables the parties are seated at (default is a new TableLayout).
+        dining_minutes : int, optional
+            The dining duration (default is Config.DINING_MINUTES).
+        """
+        self.reservation_book = reservation_book or ReservationBook()
+        self.layout = layout or TableLayout()
+        self.seats = sum(self.layout.tables.values())
+        self.tables = len(self.layout.tables)
+        self.dining_minutes = Config.DINING_MINUTES if dining_minutes is None else dining_minutes
+        self.slot_minutes = Config.SLOT_MINUTES
+        self._assigner = TableAssigner(self.layout, self.reservation_book, self.dining_minutes)
+        self._largest_seating = max((seats for seats, _ in self.layout.seatings()), default=0)
+
+    def is_available(self, day: date, time: str, party_size: int, reservations: list = None) -> bool:
+        """
+        Checks whether a party can be seated at a time.
+
+        Parameters
+        ----------
+        day : date
+            The day of the booking.
+        time : str
+            The start time (HH:MM).
+        party_size : int
+            The number of guests.
+        reservations : list, optional
+            The day's reservations, e.g. as read under a write lock (default is
+            the day's reservations in the reservation book).
+
+        Returns
+        -------
+        bool
+            True if every party of the day, this one included, can be seated.
+        """
+        return self._fits(self._day_reservations(day, reservations), day, self._minutes(time), int(party_size))
+
+    def largest_parties(self, day: date, times: list, reservations: list = None) -> dict:
+        """
+        Returns the largest party that can be seated at each of several times.
+
+        The day's reservations are read once for all of the times.
+
+        Parameters
+        ----------
+        day : date
+            The day of the bookings.
+        times : list
+            The start times (HH:MM).
+        reservations : list, optional
+            The day's reservations (default is the day's reservations in the
+            reservation book).
+
+        Returns
+        -------
+        dict
+            The largest party size, or 0 if no party fits, keyed by start time.
+        """
+        bookings = self._day_reservations(day, reservations)
+        largest = {}
+        for time in times:
+            start = self._minutes(time)
+            party_size = self._largest_seating
+            while party_size > 0 and not self._fits(bookings, day, start, party_size):
+                party_size -= 1
+            largest[time] = party_size
+        return largest
+
+    def free_slots(self, day: date, party_size: int = 1) -> list:
+        """
+        Returns the start times at which a party can be seated on a day.
+
+        Parameters
+        ----------
+        day : date
+            The day to check.
+        party_size : int, optional
+            The number of guests (default is 1).
+
+        Returns
+        -------
+        list
+            The free start times (HH:MM) in ascending order.
+        """
+        bookings = self._day_reservations(day)
+        return [
+            self._time(start) for start in self._start_times()
+            if self._fits(bookings, day, start, int(party_size))
+        ]
+
+    def suggest(self, day: date, time: str, party_size: int, limit: int = 3) -> list:
+        """
+        Returns the free start times closest to a requested time.
+
+        Parameters
+        ----------
+        day : date
+            The day of the booking.
+        time : str
+            The requested start time (HH:MM).
+        party_size : int
+            The number of guests.
+        limit : int, optional
+            The maximum number of suggestions (default is 3).
+
+        Returns
+        -------
+        list
+            Up to limit free start times (HH:MM), in ascending order.
+        """
+        bookings = self._day_reservations(day)
+        requested = self._minutes(time)
+        suggestions = []
+        for start in sorted(self._start_times(), key=lambda start: (abs(start - requested), start)):
+            if len(suggestions) == limit:
+                break
+            if start != requested and self._fits(bookings, day, start, int(party_size)):
+                suggestions.append(start)
+        return [self._time(start) for start in sorted(suggestions)]
+
+    def _day_reservations(self, day: date, reservations: list = None) -> dict:
+        """
+        Returns the reservations of a day to check requests against.
+
+        Parameters
+        ----------
+        day : date
+            The day of the bookings.
+        reservations : list, optional
+            The day's reservations (default is read from the reservation book).
+
+        Returns
+        -------
+        dict
+            The day's "reservations" and the number of them that cannot be
+            seated already ("unseated"), e.g. after the layout was reduced.
+        """
+        reservations = list(self.reservation_book.on_date(day) if reservations is None else reservations)
+        unseated = sum(1 for tables in self._assigner.assign(reservations) if not tables)
+        return {"reservations": reservations, "unseated": unseated}
+
+    def _fits(self, bookings: dict, day: date, start: int, party_size: int) -> bool:
+        """
+        Checks whether a party can be seated next to the other bookings of its day.
+
+        Parameters
+        ----------
+        bookings : dict
+            The day's reservations, as returned by _day_reservations().
+        day : date
+            The day of the booking.
+        start : int
+            The start time in minutes after opening.
+        party_size : int
+            The number of guests.
+
+        Returns
+        -------
+        bool
+            True if the TableAssigner seats the party without leaving any other
+            party of the day without a table.
+        """
+        if start < 0 or start > self._minutes(AvailabilityEngine.LAST_SEATING_TIME):
+            return False
+        if party_size > self._largest_seating:
+            return False
+        request = {"starts_at": f"{day.isoformat()} {self._time(start)}", "party_size": party_size}
+        assignments = self._assigner.assign(bookings["reservations"] + [request])
+        return bool(assignments[-1]) and sum(1 for tables in assignments if not tables) <= bookings["unseated"]
+
+    def _start_times(self) -> range:
+        """
+        Returns every bookable start time of a day.
+
+        Returns
+        -------
+        range
+            The slot start times in minutes after opening.
+        """
+        return range(0, self._minutes(AvailabilityEngine.LAST_SEATING_TIME) + 1, self.slot_minutes)
+
+    @staticmethod
+    def _minutes(time: str) -> int:
+        """
+        Converts a time of day into minutes after opening.
+
+        Parameters
+        ----------
+        time : str
+            The time (HH:MM).
+
+        Returns
+        -------
+        int
+            The number of minutes since AvailabilityEngine.OPENING_TIME.
+        """
+        hours, minutes = time.split(":")
+        opening_hours, opening_minutes = AvailabilityEngine.OPENING_TIME.split(":")
+        return int(hours) * 60 + int(minutes) - int(opening_hours) * 60 - int(opening_minutes)
+
+    @staticmethod
+    def _time(minutes: int) -> str:
+        """
+        Converts minutes after opening into a time of day.
+
+        Parameters
+        ----------
+        minutes : int
+            The number of minutes since AvailabilityEngine.OPENING_TIME.
+
+        Returns
+        -------
+        str
+            The time (HH:MM).
+        """
+        total = minutes - AvailabilityEngine._minutes("00:00")
+        return f"{total // 60:02d}:{total % 60:02d}"
@@ -0,0 +1,313 @@
+import atexit
+import sys
+import threading
+import time
+from typing import Any, Callable
+from classes.Config import Config
+
+
+class CommitQueue:
+    """
+    A class to commit records to storage in batches from a background writer thread.
+
+    Submitted records are queued and written by a single writer thread, which
+    passes everything that is pending, up to the batch size, to the commit
+    function in one call, so many records share the same writes and fsyncs.
+    The commit function also receives a progress dict, empty for a new batch,
+    in which it can record the steps it has completed.
+
+    In "fsync" durability mode submit() returns once the record's batch has been
+    committed, unless the caller passes wait=False and calls confirm() later,
+    e.g. from another thread, so the submitting thread is free to queue more. The writer then starts a batch as soon as it is free, so records
+    submitted while a batch is being written are grouped into the next one. In
+    "enqueue" mode submit() returns at once and the writer waits up to the flush
+    interval for a batch to fill before committing it.
+
+    A batch that fails is retried with exactly the same records and the same
+    progress dict, so steps that already succeeded can be skipped instead of
+    being applied twice, and records are committed in the order they were
+    submitted. A submit() in "fsync" mode waits at most the commit timeout and
+    then raises TimeoutError, leaving the record queued. Every queue is flushed
+    when the interpreter exits and by close_all(); records that still cannot be
+    committed then are reported on stderr.
+
+    Attributes
+    ----------
+    commit_batch : Callable[[list, dict], None]
+        The function that durably stores a batch of records, given the batch and
+        its progress dict.
+    batch_size : int
+        The maximum number of records committed together.
+    flush_interval : float
+        The maximum number of seconds a record waits in "enqueue" mode.
+    durability : str
+        When submit() returns: "fsync" after the record is committed, "enqueue"
+        as soon as it is queued.
+    timeout : float
+        The maximum number of seconds submit() waits in "fsync" mode.
+
+    Methods
+    -------
+    submit(record: Any, wait: bool = True) -> int:
+        Queues a record to be committed.
+    confirm(sequence: int) -> None:
+        Waits in "fsync" mode until a submitted record has been committed.
+    wait(sequence: int, timeout: float = None) -> bool:
+        Waits until a submitted record has been committed.
+    flush(timeout: float = None) -> bool:
+        Waits until every record submitted so far has been committed.
+    pending() -> int:
+        Returns the number of records not yet committed.
+    close() -> None:
+        Commits the pending records and stops the writer thread.
+    close_all() -> None:
+        Closes every commit queue, e.g. before the system shuts down.
+    """
+
+    RETRY_SECONDS = 1.0
+
+    _queues = []
+    _queues_lock = threading.Lock()
+
+    def __init__(self, commit_batch: Callable[[list, dict], None], batch_size: int = None,
+                 flush_interval: float = None, durability: str = None, timeout: float = None):
+        """
+        Constructs all the necessary attributes for the CommitQueue object.
+
+        The writer thread is started by the first submit().
+
+        Parameters
+        ----------
+        commit_batch : Callable[[list, dict], None]
+            The function that durably stores a batch of records, given the batch
+            and its progress dict.
+        batch_size : int, optional
+            The maximum number of records committed together (default is
+            Config.COMMIT_BATCH_SIZE).
+        flush_interval : float, optional
+            The maximum number of seconds a record waits in "enqueue" mode
+            (default is Config.COMMIT_INTERVAL_MS).
+        durability : str, optional
+            "fsync" or "enqueue" (default is Config.COMMIT_DURABILITY).
+        timeout : float, optional
+            The maximum number of seconds submit() waits in "fsync" mode
+            (default is Config.COMMIT_TIMEOUT).
+
+        Raises
+        ------
+        ValueError
+            If the durability mode is unknown.
+        """
+        self.commit_batch = commit_batch
+        self.batch_size = max(1, batch_size or Config.COMMIT_BATCH_SIZE)
+        self.flush_interval = Config.COMMIT_INTERVAL_MS / 1000 if flush_interval is None else flush_interval
+        self.durability = durability or Config.COMMIT_DURABILITY
+        if self.durability not in ("fsync", "enqueue"):
+            raise ValueError(f"Unknown commit durability mode: {self.durability}")
+        self.timeout = Config.COMMIT_TIMEOUT if timeout is None else timeout
+        self._condition = threading.Condition()
+        self._records = []
+        self._submitted = 0
+        self._committed = 0
+        self._flush_target = 0
+        self._closed = False
+        self._thread = None
+        with CommitQueue._queues_lock:
+            CommitQueue._queues.append(self)
+
+    def submit(self, record: Any, wait: bool = True) -> int:
+        """
+        Queues a record to be committed.
+
+        Parameters
+        ----------
+        record : Any
+            The record to be committed.
+        wait : bool, optional
+            Whether to wait in "fsync" mode until the record is committed
+            (default is True). Otherwise the caller should call confirm().
+
+        Returns
+        -------
+        int
+            The sequence number of the record, to be passed to wait().
+
+        Raises
+        ------
+        RuntimeError
+            If the queue has been closed.
+        TimeoutError
+            If in "fsync" mode the record has not been committed within the
+            timeout. It stays queued and is committed once storage recovers.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The commit queue has been closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="CommitQueue", daemon=True)
+                self._thread.start()
+            self._records.append((record, time.monotonic()))
+            self._submitted += 1
+            sequence = self._submitted
+            self._condition.notify_all()
+
+        if wait:
+            self.confirm(sequence)
+        return sequence
+
+    def confirm(self, sequence: int) -> None:
+        """
+        Waits in "fsync" mode until a submitted record has been committed.
+
+        In "enqueue" mode it returns at once.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number returned by submit().
+
+        Raises
+        ------
+        TimeoutError
+            If the record has not been committed within the timeout. It stays
+            queued and is committed once storage recovers.
+        """
+        if self.durability == "fsync" and not self.wait(sequence, self.timeout):
+            raise TimeoutError(
+                f"The record could not be committed within {self.timeout:g} seconds. "
+                "It is still queued and will be committed once storage is available."
+            )
+
+    def wait(self, sequence: int, timeout: float = None) -> bool:
+        """
+        Waits until a submitted record has been committed.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number returned by submit().
+        timeout : float, optional
+            The maximum number of seconds to wait (default is no limit).
+
+        Returns
+        -------
+        bool
+            True if the record has been committed.
+        """
+        with self._condition:
+            self._flush_target = max(self._flush_target, sequence)
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._committed >= sequence, timeout)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until every record submitted so far has been committed.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait (default is no limit).
+
+        Returns
+        -------
+        bool
+            True if every record has been committed.
+        """
+        with self._condition:
+            sequence = self._submitted
+        return self.wait(sequence, timeout)
+
+    def pending(self) -> int:
+        """
+        Returns the number of records not yet committed.
+
+        Returns
+        -------
+        int
+            The number of queued records, including a batch being written.
+        """
+        with self._condition:
+            return self._submitted - self._committed
+
+    def close(self) -> None:
+        """
+        Commits the pending records and stops the writer thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    @staticmethod
+    def close_all() -> None:
+        """
+        Closes every commit queue, e.g. before the system shuts down.
+        """
+        with CommitQueue._queues_lock:
+            queues = list(CommitQueue._queues)
+        for queue in queues:
+            queue.close()
+
+    def _run(self) -> None:
+        """
+        Commits batches of queued records until the queue is closed and empty.
+
+        A failed batch is retried with the same records and progress dict until
+        it succeeds, or until it fails once the queue is closing.
+        """
+        batch = None
+        progress = {}
+        while True:
+            if batch is None:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                progress = {}
+            try:
+                self.commit_batch(batch, progress)
+            except Exception as error:
+                with self._condition:
+                    if self._closed:
+                        print(f"[ERROR] {len(self._records)} records were not committed: {error}", file=sys.stderr)
+                        return
+                print(f"[ERROR] Could not commit {len(batch)} records, retrying: {error}", file=sys.stderr)
+                time.sleep(CommitQueue.RETRY_SECONDS)
+                continue
+
+            with self._condition:
+                del self._records[:len(batch)]
+                self._committed += len(batch)
+                self._condition.notify_all()
+            batch = None
+
+    def _next_batch(self) -> list | None:
+        """
+        Waits until a batch is due and returns its records.
+
+        A batch is due when it is full, when its oldest record has waited for the
+        flush interval, when a caller is waiting for it or when the queue is
+        closing. The records stay queued until they have been committed.
+
+        Returns
+        -------
+        list | None
+            The records of the batch, or None if the queue is closed and empty.
+        """
+        with self._condition:
+            while True:
+                if self._records:
+                    deadline = self._records[0][1] + self.flush_interval
+                    remaining = deadline - time.monotonic()
+                    if (len(self._records) >= self.batch_size or remaining <= 0 or self._closed
+                            or self.durability == "fsync" or self._flush_target > self._committed):
+                        return [record for record, _ in self._records[:self.batch_size]]
+                    self._condition.wait(remaining)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+
+atexit.register(CommitQueue.close_all)
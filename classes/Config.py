@@ -0,0 +1,91 @@
+import os
+
+
+class Config:
+    """
+    A class holding the system-wide configuration settings.
+
+    Each setting can be overridden with an environment variable of the same name
+    prefixed with ``RIS_``.
+
+    Attributes
+    ----------
+    STORAGE_BACKEND : str
+        The storage engine used for menu, orders and reservations ("json" or "sqlite").
+    SQLITE_PATH : str
+        The path to the SQLite database file used by the "sqlite" backend.
+    LOCK_TIMEOUT : float
+        The maximum number of seconds to wait for a lock on a data file.
+    FSYNC_WRITES : bool
+        True to flush every write to disk before it is acknowledged.
+    CACHE_SIZE : int
+        The maximum number of parsed data files kept in the read cache.
+    REPORT_WORKERS : int
+        The number of processes used to build large reports (0 uses every CPU,
+        1 builds reports serially).
+    SEAT_CAPACITY : int
+        The number of seats of the default table layout, used when no table
+        layout file exists.
+    TABLE_CAPACITY : int
+        The number of tables of the default table layout, used when no table
+        layout file exists.
+    DINING_MINUTES : int
+        The average time a reserved party occupies its table.
+    SLOT_MINUTES : int
+        The length of the reservation time slots.
+    MENU_PAGE_SIZE : int
+        The number of menu items shown on each page of the menu.
+    SERVER_HOST : str
+        The address the HTTP/JSON API server listens on.
+    SERVER_PORT : int
+        The port the HTTP/JSON API server listens on.
+    SERVER_URL : str
+        The URL of an API server to use instead of the local data files, e.g.
+        "http://127.0.0.1:8080" (empty to use the local data files).
+    COMMIT_DURABILITY : str
+        When a checkout returns: "fsync" once the order is written to disk,
+        "enqueue" as soon as it is queued for the background writer.
+    COMMIT_BATCH_SIZE : int
+        The maximum number of orders the background writer commits together.
+    COMMIT_INTERVAL_MS : int
+        The maximum number of milliseconds an order waits for its batch to fill
+        in "enqueue" mode.
+    COMMIT_TIMEOUT : float
+        The maximum number of seconds a checkout waits for its order to be
+        committed in "fsync" mode before reporting a delay.
+    TICKET_BLOCK_SIZE : int
+        The number of ticket numbers each process reserves at a time. The
+        default of 1 keeps ticket numbers sequential across every terminal;
+        larger blocks save disk writes but interleave the numbers of different
+        terminals and skip the unused numbers of a block when a process stops.
+    KDS_SEGMENT_TICKETS : int
+        The number of kitchen tickets in each segment of the KDS spool.
+    KDS_RETAINED_SEGMENTS : int
+        The number of KDS spool segments kept before the oldest is deleted, once
+        every consumer has handled its tickets.
+    KDS_POLL_MS : int
+        The number of milliseconds between checks of the KDS spool for new tickets.
+    """
+
+    STORAGE_BACKEND = os.environ.get("RIS_STORAGE_BACKEND", "json").lower()
+    SQLITE_PATH = os.environ.get("RIS_SQLITE_PATH", "./restaurant.db")
+    LOCK_TIMEOUT = float(os.environ.get("RIS_LOCK_TIMEOUT", "5"))
+    FSYNC_WRITES = os.environ.get("RIS_FSYNC_WRITES", "1") == "1"
+    CACHE_SIZE = int(os.environ.get("RIS_CACHE_SIZE", "16"))
+    REPORT_WORKERS = int(os.environ.get("RIS_REPORT_WORKERS", "0"))
+    SEAT_CAPACITY = int(os.environ.get("RIS_SEAT_CAPACITY", "80"))
+    TABLE_CAPACITY = int(os.environ.get("RIS_TABLE_CAPACITY", "20"))
+    DINING_MINUTES = int(os.environ.get("RIS_DINING_MINUTES", "90"))
+    SLOT_MINUTES = int(os.environ.get("RIS_SLOT_MINUTES", "15"))
+    MENU_PAGE_SIZE = int(os.environ.get("RIS_MENU_PAGE_SIZE", "10"))
+    SERVER_HOST = os.environ.get("RIS_SERVER_HOST", "127.0.0.1")
+    SERVER_PORT = int(os.environ.get("RIS_SERVER_PORT", "8080"))
+    SERVER_URL = os.environ.get("RIS_SERVER_URL", "").rstrip("/")
+    COMMIT_DURABILITY = os.environ.get("RIS_COMMIT_DURABILITY", "fsync").lower()
+    COMMIT_BATCH_SIZE = int(os.environ.get("RIS_COMMIT_BATCH_SIZE", "100"))
+    COMMIT_INTERVAL_MS = int(os.environ.get("RIS_COMMIT_INTERVAL_MS", "20"))
+    COMMIT_TIMEOUT = float(os.environ.get("RIS_COMMIT_TIMEOUT", "5"))
+    TICKET_BLOCK_SIZE = int(os.environ.get("RIS_TICKET_BLOCK_SIZE", "1"))
+    KDS_SEGMENT_TICKETS = int(os.environ.get("RIS_KDS_SEGMENT_TICKETS", "1000"))
+    KDS_RETAINED_SEGMENTS = int(os.environ.get("RIS_KDS_RETAINED_SEGMENTS", "7"))
+    KDS_POLL_MS = int(os.environ.get("RIS_KDS_POLL_MS", "100"))
@@ -0,0 +1,270 @@
+from datetime import datetime
+from tabulate import tabulate
+from classes.CustomerIndex import CustomerIndex
+from classes.Menu import Menu
+from classes.OrderFactory import OrderFactory
+from classes.OrderHandler import OrderHandler
+from classes.OrderHistory import OrderHistory
+from classes.ReservationBook import ReservationBook
+from classes.SystemUtils import SystemUtils
+from classes.Validator import Validator
+
+
+class CustomerHandler:
+    """
+    A class to handle returning-customer operations.
+
+    Every lookup goes through the CustomerIndex, and the records it points to
+    are read by order_id or from the day's slice of the ReservationBook, so no
+    history or reservations file is scanned. The customer kiosk asks for both
+    the mobile number and the email address, and only shows records on which
+    both match.
+
+    Methods
+    -------
+    find_reservations(contact: str, upcoming: bool = True, email: str = None) -> list:
+        Returns the reservations made with a mobile number or email address.
+    find_orders(contact: str, limit: int = None, email: str = None) -> list:
+        Returns the orders placed with a mobile number or email address, newest first.
+    handle_find_booking() -> None:
+        Prompts for contact details and displays the customer's upcoming bookings.
+    handle_reorder(menu: Menu) -> None:
+        Prompts for contact details and starts a new order from the customer's last order.
+    handle_lookup() -> None:
+        Prompts for contact details and displays the customer's bookings and recent orders.
+    """
+
+    @staticmethod
+    def find_reservations(contact: str, upcoming: bool = True, email: str = None) -> list:
+        """
+        Returns the reservations made with a mobile number or email address.
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+        upcoming : bool, optional
+            True to only return reservations that have not started (default is True).
+        email : str, optional
+            An email address the reservations must also have been made with
+            (default is no further check).
+
+        Returns
+        -------
+        list
+            The reservations in date and time order.
+        """
+        now = datetime.now().strftime(ReservationBook.KEY_FORMAT)
+        references = [
+            reference for reference in CustomerIndex().reservations(contact)
+            if not upcoming or reference["starts_at"] >= now
+        ]
+
+        reservation_book = ReservationBook()
+        days = {}
+        reservations = []
+        for reference in sorted(references, key=lambda reference: reference["starts_at"]):
+            day = datetime.strptime(reference["starts_at"], ReservationBook.KEY_FORMAT).date()
+            if day not in days:
+                days[day] = reservation_book.on_date(day)
+            for reservation in days[day]:
+                if (CustomerHandler._matches(reservation, reference) and reservation not in reservations
+                        and CustomerHandler._same_email(reservation.get("email"), email)):
+                    reservations.append(reservation)
+        return reservations
+
+    @staticmethod
+    def find_orders(contact: str, limit: int = None, email: str = None) -> list:
+        """
+        Returns the orders placed with a mobile number or email address, newest first.
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+        limit : int, optional
+            The maximum number of orders to return (default is all).
+        email : str, optional
+            An email address the orders must also have been placed with (default
+            is no further check).
+
+        Returns
+        -------
+        list
+            The order records.
+        """
+        order_history = OrderHistory()
+        orders = []
+        for order_id in CustomerIndex().orders(contact):
+            if limit is not None and len(orders) == limit:
+                break
+            order_data = order_history.find(order_id)
+            if order_data is not None and CustomerHandler._same_email(
+                (order_data.get("contact_information") or {}).get("email"), email
+            ):
+                orders.append(order_data)
+        return orders
+
+    @staticmethod
+    def handle_find_booking() -> None:
+        """
+        Prompts for contact details and displays the customer's upcoming bookings.
+        """
+        SystemUtils.clear_screen()
+        SystemUtils.heading("FIND MY BOOKING")
+        contact = CustomerHandler._enter_contact()
+        if contact is None:
+            return
+
+        reservations = CustomerHandler.find_reservations(contact[0], email=contact[1])
+        if reservations:
+            CustomerHandler._display_reservations(reservations)
+        else:
+            print("No upcoming bookings found.")
+        input("\nPress ENTER to continue")
+
+    @staticmethod
+    def handle_reorder(menu: Menu) -> None:
+        """
+        Prompts for contact details and starts a new order from the customer's last order.
+
+        Parameters
+        ----------
+        menu : Menu
+            An instance of the Menu class representing the menu.
+        """
+        SystemUtils.clear_screen()
+        SystemUtils.heading("REORDER MY LAST ORDER")
+        contact = CustomerHandler._enter_contact()
+        if contact is None:
+            return
+
+        orders = CustomerHandler.find_orders(contact[0], limit=1, email=contact[1])
+        if not orders:
+            print("No previous orders found.")
+            input("\nPress ENTER to continue")
+            return
+
+        order = OrderFactory.create_reorder(orders[0], menu)
+        if not order.items:
+            print("None of the items in your last order are available.")
+            input("\nPress ENTER to continue")
+            return
+        OrderHandler.manage_order(order, menu, view_cart=True)
+
+    @staticmethod
+    def handle_lookup() -> None:
+        """
+        Prompts for contact details and displays the customer's bookings and recent orders.
+        """
+        contact = input("Mobile Number or Email or [E] Exit: ")
+        if contact.lower() == 'e':
+            return
+
+        reservations = CustomerHandler.find_reservations(contact)
+        print("\nUpcoming Bookings:")
+        if reservations:
+            CustomerHandler._display_reservations(reservations)
+        else:
+            print("No upcoming bookings found.")
+
+        orders = CustomerHandler.find_orders(contact, limit=10)
+        print("\nRecent Orders:")
+        if orders:
+            table_data = [
+                [order_data['date_time'], order_data['order_id'], order_data['order_type'], f"${order_data['order_total']:.2f}"]
+                for order_data in orders
+            ]
+            print(tabulate(table_data, ["Date Time", "Order ID", "Order Type", "Order Total"], tablefmt="grid"))
+        else:
+            print("No orders found.")
+
+    @staticmethod
+    def _enter_contact() -> tuple | None:
+        """
+        Prompts the customer for both the mobile number and the email address.
+
+        Returns
+        -------
+        tuple | None
+            The valid mobile number and email address, or None if the customer exits.
+        """
+        while True:
+            mobile_number = input("Mobile Number or [E] Exit: ")
+            if mobile_number.lower() == 'e':
+                return None
+            email = input("Email: ")
+            if Validator.validate_mobile_number(mobile_number) and Validator.validate_email(email):
+                return mobile_number, email
+            print("[ERROR] Please enter a valid mobile number and email address.\n")
+
+    @staticmethod
+    def _same_email(stored: str, email: str) -> bool:
+        """
+        Checks whether a record's email address matches the one entered.
+
+        Parameters
+        ----------
+        stored : str
+            The email address stored on the record.
+        email : str
+            The email address entered, or None to skip the check.
+
+        Returns
+        -------
+        bool
+            True if no email address was entered, or both normalize to the same
+            CustomerIndex key.
+        """
+        if email is None:
+            return True
+        key = CustomerIndex.normalize(email)
+        return key is not None and key.startswith("email:") and key == CustomerIndex.normalize(stored)
+
+    @staticmethod
+    def _display_reservations(reservations: list) -> None:
+        """
+        Displays reservations as a table.
+
+        Parameters
+        ----------
+        reservations : list
+            The reservations to display.
+        """
+        table_data = [
+            [
+                reservation['date'],
+                reservation['time'],
+                reservation['name'],
+                reservation['party_size'],
+                reservation['accommodations'] if reservation['accommodations'] else "None"
+            ]
+            for reservation in reservations
+        ]
+        print(tabulate(table_data, ["Date", "Time", "Name", "Party Size", "Accommodations"], tablefmt="grid"))
+
+    @staticmethod
+    def _matches(reservation: dict, reference: dict) -> bool:
+        """
+        Checks whether a reservation is the one an index entry points to.
+
+        Parameters
+        ----------
+        reservation : dict
+            The stored reservation.
+        reference : dict
+            The CustomerIndex entry.
+
+        Returns
+        -------
+        bool
+            True if the reservation_id matches, or for reservations without an id,
+            if the start, name and mobile number match.
+        """
+        if reference["reservation_id"]:
+            return reservation.get("reservation_id") == reference["reservation_id"]
+        return (
+            ReservationBook.starts_at(reservation) == reference["starts_at"]
+            and reservation["name"] == reference["name"]
+            and reservation["mobile_number"] == reference["mobile_number"]
+        )
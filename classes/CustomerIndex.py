@@ -0,0 +1,310 @@
+import json
+import os
+import threading
+import re
+from typing import Iterable
+from classes.Database import Database
+
+
+class CustomerIndex:
+    """
+    A class to maintain a persistent index from customer contact details to records.
+
+    The index is an append-only journal of entries that map a normalized mobile
+    number or email address to an order_id or a reservation. It is updated when
+    an order or reservation is stored and loaded incrementally into an in-memory
+    hash map, so each process only reads the index lines added since its last
+    lookup and every lookup is a dictionary access.
+
+    Attributes
+    ----------
+    index_path : str
+        The path to the index journal.
+
+    Methods
+    -------
+    normalize(contact: str) -> str | None:
+        Returns the index key of a mobile number or email address.
+    add_order(order_data: dict) -> None:
+        Records the contact details of an order.
+    add_orders(orders: list) -> None:
+        Records the contact details of several orders with a single append.
+    add_reservation(reservation: dict) -> None:
+        Records the contact details of a reservation.
+    orders(contact: str) -> list:
+        Returns the order_ids recorded for a contact, newest first.
+    reservations(contact: str) -> list:
+        Returns the reservation references recorded for a contact, newest first.
+    rebuild(orders: Iterable[dict], reservations: Iterable[dict]) -> int:
+        Rebuilds the index from the given orders and reservations.
+    """
+
+    INDEX_PATH = "./customer_index.jsonl"
+
+    _states = {}
+    _lock = threading.Lock()
+
+    def __init__(self, index_path: str = None):
+        """
+        Constructs all the necessary attributes for the CustomerIndex object.
+
+        Parameters
+        ----------
+        index_path : str, optional
+            The path to the index journal (default is CustomerIndex.INDEX_PATH).
+        """
+        self.index_path = index_path or CustomerIndex.INDEX_PATH
+
+    @staticmethod
+    def normalize(contact: str) -> str | None:
+        """
+        Returns the index key of a mobile number or email address.
+
+        Email addresses are compared case-insensitively, and mobile numbers are
+        reduced to their digits with a leading "+61" written as "0".
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+
+        Returns
+        -------
+        str | None
+            The key, e.g. "email:jo@example.com" or "mobile:0412345678", or None
+            if the contact is empty.
+        """
+        contact = (contact or "").strip()
+        if "@" in contact:
+            return f"email:{contact.lower()}"
+        digits = re.sub(r"\D", "", contact)
+        if digits.startswith("61") and len(digits) == 11:
+            digits = "0" + digits[2:]
+        return f"mobile:{digits}" if digits else None
+
+    def add_order(self, order_data: dict) -> None:
+        """
+        Records the contact details of an order.
+
+        Orders without contact information, such as dine-in orders, are skipped.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record that was stored.
+        """
+        self.add_orders([order_data])
+
+    def add_orders(self, orders: list) -> None:
+        """
+        Records the contact details of several orders with a single append.
+
+        Parameters
+        ----------
+        orders : list
+            The order records that were stored.
+        """
+        self._append([entry for order_data in orders for entry in self._order_entries(order_data)])
+
+    def add_reservation(self, reservation: dict) -> None:
+        """
+        Records the contact details of a reservation.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation record that was stored, including its "starts_at" key.
+        """
+        self._append(self._reservation_entries(reservation))
+
+    def orders(self, contact: str) -> list:
+        """
+        Returns the order_ids recorded for a contact, newest first.
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+
+        Returns
+        -------
+        list
+            The order_ids.
+        """
+        return [entry["order_id"] for entry in self._lookup(contact) if "order_id" in entry]
+
+    def reservations(self, contact: str) -> list:
+        """
+        Returns the reservation references recorded for a contact, newest first.
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+
+        Returns
+        -------
+        list
+            Dicts with the "starts_at", "reservation_id" (None for reservations
+            made before ids were introduced), "name" and "mobile_number" of
+            each reservation.
+        """
+        return [entry for entry in self._lookup(contact) if "starts_at" in entry]
+
+    def rebuild(self, orders: Iterable[dict], reservations: Iterable[dict]) -> int:
+        """
+        Rebuilds the index from the given orders and reservations.
+
+        Parameters
+        ----------
+        orders : Iterable[dict]
+            Every stored order.
+        reservations : Iterable[dict]
+            Every stored reservation, including its "starts_at" key.
+
+        Returns
+        -------
+        int
+            The number of index entries written.
+        """
+        entries = []
+        for order_data in orders:
+            entries.extend(self._order_entries(order_data))
+        for reservation in reservations:
+            entries.extend(self._reservation_entries(reservation))
+        Database(self.index_path).write(entries)
+        return len(entries)
+
+    def _order_entries(self, order_data: dict) -> list:
+        """
+        Creates the index entries of an order.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+
+        Returns
+        -------
+        list
+            One entry per distinct contact key.
+        """
+        contact = order_data.get("contact_information") or {}
+        return [
+            {"key": key, "order_id": order_data["order_id"], "date_time": order_data["date_time"]}
+            for key in self._keys(contact.get("mobile_number"), contact.get("email"))
+        ]
+
+    def _reservation_entries(self, reservation: dict) -> list:
+        """
+        Creates the index entries of a reservation.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation record.
+
+        Returns
+        -------
+        list
+            One entry per distinct contact key.
+        """
+        return [
+            {
+                "key": key,
+                "starts_at": reservation["starts_at"],
+                "reservation_id": reservation.get("reservation_id"),
+                "name": reservation["name"],
+                "mobile_number": reservation["mobile_number"]
+            }
+            for key in self._keys(reservation.get("mobile_number"), reservation.get("email"))
+        ]
+
+    def _keys(self, mobile_number: str, email: str) -> list:
+        """
+        Returns the distinct index keys of a mobile number and email address.
+
+        Parameters
+        ----------
+        mobile_number : str
+            The mobile number, if any.
+        email : str
+            The email address, if any.
+
+        Returns
+        -------
+        list
+            The non-empty keys.
+        """
+        keys = []
+        for contact in (mobile_number, email):
+            key = self.normalize(contact)
+            if key and key not in keys:
+                keys.append(key)
+        return keys
+
+    def _append(self, entries: list) -> None:
+        """
+        Appends entries to the index journal.
+
+        Parameters
+        ----------
+        entries : list
+            The index entries.
+        """
+        if entries:
+            Database(self.index_path).append_many(entries)
+
+    def _lookup(self, contact: str) -> list:
+        """
+        Returns the index entries of a contact, newest first.
+
+        Parameters
+        ----------
+        contact : str
+            The mobile number or email address.
+
+        Returns
+        -------
+        list
+            The index entries.
+        """
+        key = self.normalize(contact)
+        if key is None:
+            return []
+        return list(reversed(self._state()["by_key"].get(key, [])))
+
+    def _state(self) -> dict:
+        """
+        Returns the in-memory index after reading any new index entries.
+
+        Returns
+        -------
+        dict
+            The by_key map of the index.
+        """
+        with CustomerIndex._lock:
+            state = CustomerIndex._states.get(self.index_path)
+            try:
+                file = open(self.index_path, 'rb')
+            except FileNotFoundError:
+                CustomerIndex._states.pop(self.index_path, None)
+                return {"by_key": {}}
+
+            with file:
+                inode = os.fstat(file.fileno()).st_ino
+                if state is None or state["inode"] != inode:
+                    state = {"inode": inode, "position": 0, "by_key": {}}
+                    CustomerIndex._states[self.index_path] = state
+
+                file.seek(state["position"])
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    state["position"] += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    state["by_key"].setdefault(entry.pop("key"), []).append(entry)
+            return state
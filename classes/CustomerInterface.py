@@ -3,6 +3,7 @@ from classes.SystemUtils import SystemUtils
 from classes.ReservationHandler import ReservationHandler
 from classes.OrderHandler import OrderHandler
 from classes.MenuHandler import MenuHandler
+from classes.CustomerHandler import CustomerHandler
 
 
 class CustomerInterface:
@@ -38,7 +39,7 @@ class CustomerInterface:
 
         The method runs in a loop, showing the main menu options and handling the 
         corresponding user inputs to make a reservation, view the menu, place an 
-        order, or exit the system.
+        order, find a booking, reorder the last order, or exit the system.
         """
         while True:
             SystemUtils.clear_screen()
@@ -47,6 +48,8 @@ class CustomerInterface:
             print("[1] Make Reservation\n")
             print("[2] View Menu\n")
             print("[3] Place Order\n")
+            print("[4] Find My Booking\n")
+            print("[5] Reorder My Last Order\n")
             print("[E] Exit\n")
             user_input = input("Select an option: ").lower()
 
@@ -57,6 +60,10 @@ class CustomerInterface:
                     OrderHandler.handle_order(self.menu)
             elif user_input == '3':
                 OrderHandler.handle_order(self.menu)
+            elif user_input == '4':
+                CustomerHandler.handle_find_booking()
+            elif user_input == '5':
+                CustomerHandler.handle_reorder(self.menu)
             elif user_input == 'e':
                 return
             else:
@@ -1,27 +1,99 @@
+import copy
 import json
-from typing import Any
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterator
+from classes.Config import Config
+from classes.FileLock import FileLock
+
+
+class FrozenDict(dict):
+    """
+    A read-only dictionary handed out by the Database read cache.
+
+    It is still a dict, so it can be serialized with json and passed anywhere a
+    dict is expected, but any attempt to modify it raises a TypeError. Copying
+    or pickling it returns a plain, modifiable dict.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached database records are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self) -> tuple:
+        return dict, (dict(self),)
 
 
 class Database:
     """
     A class to handle database operations using a JSON file.
 
+    A file path ending in ``.jsonl`` selects journal mode, where every record is
+    stored as a single JSON line. Appending in journal mode writes one line to the
+    end of the file instead of rewriting the whole data set.
+
+    Full writes go to a temporary file that is flushed to disk and renamed over
+    the target, so a crash never leaves a truncated file behind. Reads take a
+    shared lock and writes an exclusive lock on a ``.lock`` file next to the data
+    file, so several processes can safely share the same data directory.
+
+    Parsed files are kept in a process-wide LRU cache keyed on the file path and
+    validated against the inode, ``st_mtime_ns`` and size on every read, so an
+    unchanged file is never parsed twice. The cache is guarded by a lock, so a
+    Database can be used from several threads at once. Cached data is returned as read-only
+    tuples and FrozenDict objects, and must be copied before it is modified.
+
     Attributes
     ----------
     file_path : str
         The path to the JSON file used for storing data.
+    journal : bool
+        True if the file is stored in JSON Lines (journal) format.
+    lock_timeout : float
+        The maximum number of seconds to wait for a lock on the file.
 
     Methods
     -------
     read() -> Any:
         Reads and returns the data from the JSON file.
+    iter_records() -> Iterator[Any]:
+        Streams the records stored in the file one at a time.
     write(data: Any) -> None:
         Writes the given data to the JSON file.
-    append(item: Any) -> None:
+    append(item: Any) -> tuple | None:
         Appends an item to the data in the JSON file.
+    append_many(items: list) -> list | None:
+        Appends several items to the data in the JSON file with a single write.
+    append_with(function: Callable[[Any], list]) -> list:
+        Appends the items a function returns for the stored data under an exclusive lock.
+    update(function: Callable[[Any], Any], default: Any = None) -> Any:
+        Applies a change to the stored data under an exclusive lock.
+    read_at(offset: int, length: int) -> Any:
+        Reads a single journal record stored at a byte offset.
+    migrate() -> bool:
+        Converts the legacy JSON array file into the journal file.
+    cache_stats() -> dict:
+        Returns the hit and miss counters of the read cache.
+    clear_cache() -> None:
+        Empties the read cache and resets its counters.
     """
 
-    def __init__(self, file_path: str):
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_hits = 0
+    _cache_misses = 0
+
+    def __init__(self, file_path: str, lock_timeout: float = None):
         """
         Constructs all the necessary attributes for the Database object.
 
@@ -29,8 +101,25 @@ class Database:
         ----------
         file_path : str
             The path to the JSON file used for storing data.
+        lock_timeout : float, optional
+            The maximum number of seconds to wait for a lock on the file
+            (default is Config.LOCK_TIMEOUT).
         """
         self.file_path = file_path
+        self.journal = file_path.endswith(".jsonl")
+        self.lock_timeout = Config.LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+
+    @property
+    def legacy_path(self) -> str:
+        """
+        Returns the path of the JSON array file that precedes the journal file.
+
+        Returns
+        -------
+        str
+            The journal path with a ``.json`` extension.
+        """
+        return self.file_path[:-len(".jsonl")] + ".json"
 
     def read(self) -> Any:
         """
@@ -39,15 +128,66 @@ class Database:
         Returns
         -------
         Any
-            The data read from the JSON file. Returns an empty list if the file
-            does not exist or contains invalid JSON.
+            The read-only data read from the JSON file. Returns an empty tuple if
+            the file does not exist or contains invalid JSON.
+        """
+        self.migrate()
+        with self._lock(exclusive=False):
+            return self._read_cached()
+
+    def iter_records(self) -> Iterator[Any]:
+        """
+        Streams the records stored in the file one at a time.
+
+        In journal mode only one line is held in memory at a time and the cache is
+        bypassed. The shared lock is only held while the journal is opened, and
+        records appended after streaming starts are not returned. A line that
+        cannot be decoded, such as one left incomplete by a crash, is skipped.
+
+        Yields
+        ------
+        Any
+            The next record stored in the file.
         """
+        if not self.journal:
+            yield from self.read()
+            return
+
+        self.migrate()
         try:
-            with open(self.file_path, 'r') as file:
-                data = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = []
-        return data
+            with self._lock(exclusive=False):
+                file = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            return
+        yield from self._iter_journal(file)
+
+    @staticmethod
+    def _iter_journal(file) -> Iterator[Any]:
+        """
+        Streams the complete lines of an open journal file up to its current end.
+
+        Parameters
+        ----------
+        file : file object
+            The journal file opened in binary mode. It is closed once exhausted.
+
+        Yields
+        ------
+        Any
+            The next record stored in the journal.
+        """
+        end = os.fstat(file.fileno()).st_size
+        with file:
+            while file.tell() < end:
+                line = file.readline()
+                if not line.endswith(b"\n"):
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
 
     def write(self, data: Any) -> None:
         """
@@ -56,12 +196,13 @@ class Database:
         Parameters
         ----------
         data : Any
-            The data to be written to the JSON file.
+            The data to be written to the JSON file. In journal mode this must be
+            a list, and each item is written as its own line.
         """
-        with open(self.file_path, 'w') as file:
-            json.dump(data, file, indent=4)
+        with self._lock(exclusive=True):
+            self._write_atomic(data)
 
-    def append(self, item: Any) -> None:
+    def append(self, item: Any) -> tuple | None:
         """
         Appends an item to the data in the JSON file.
 
@@ -69,7 +210,396 @@ class Database:
         ----------
         item : Any
             The item to be appended to the data in the JSON file.
+
+        Returns
+        -------
+        tuple | None
+            In journal mode, the byte offset and length of the written line.
+            None otherwise.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the existing JSON file is corrupt, rather than overwriting it.
+        """
+        locations = self.append_many([item])
+        return locations[0] if locations else None
+
+    def append_many(self, items: list) -> list | None:
+        """
+        Appends several items to the data in the JSON file with a single write.
+
+        In journal mode the lines of all items are written and flushed to disk
+        together, so a batch costs one fsync instead of one per item.
+
+        Parameters
+        ----------
+        items : list
+            The items to be appended, in order.
+
+        Returns
+        -------
+        list | None
+            In journal mode, the byte offset and length of each written line.
+            None otherwise.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the existing JSON file is corrupt, rather than overwriting it.
+        """
+        self.migrate()
+        with self._lock(exclusive=True):
+            return self._append(items)
+
+    def append_with(self, function: Callable[[Any], list]) -> list:
+        """
+        Appends the items a function returns for the stored data under an exclusive lock.
+
+        No other process can write between the data being read and the items
+        being appended, so the function can check the data before anything is
+        written, e.g. that a slot is still free, and raise to append nothing.
+
+        Parameters
+        ----------
+        function : Callable[[Any], list]
+            A function that receives the current read-only data, or an empty
+            tuple if there is none, and returns the items to append.
+
+        Returns
+        -------
+        list
+            The items that were appended.
+        """
+        self.migrate()
+        with self._lock(exclusive=True):
+            items = list(function(self._read_cached()))
+            if items:
+                self._append(items)
+        return items
+
+    def update(self, function: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        Applies a change to the stored data under an exclusive lock.
+
+        The data is loaded, passed to the function and the result is written back
+        atomically, without another process being able to write in between.
+
+        Parameters
+        ----------
+        function : Callable[[Any], Any]
+            A function that receives the current data and returns the new data.
+        default : Any, optional
+            The data passed to the function when the file does not exist.
+
+        Returns
+        -------
+        Any
+            The new data that was written.
+        """
+        with self._lock(exclusive=True):
+            try:
+                if self.journal:
+                    data = list(self._iter_journal(open(self.file_path, 'rb')))
+                else:
+                    data = self._load()
+            except FileNotFoundError:
+                data = default
+            data = function(data)
+            self._write_atomic(data)
+        return data
+
+    def read_at(self, offset: int, length: int) -> Any:
+        """
+        Reads a single journal record stored at a byte offset.
+
+        Parameters
+        ----------
+        offset : int
+            The byte offset of the record's line.
+        length : int
+            The length of the line in bytes.
+
+        Returns
+        -------
+        Any
+            The decoded record, or None if the file or record does not exist.
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                file.seek(offset)
+                line = file.read(length)
+            return json.loads(line)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def migrate(self) -> bool:
+        """
+        Converts the legacy JSON array file into the journal file.
+
+        The migration only runs when the journal file does not exist yet and a
+        legacy ``.json`` file with the same name does. The legacy file is kept
+        with a ``.migrated`` suffix so it is never read twice.
+
+        Returns
+        -------
+        bool
+            True if a legacy file was migrated, False otherwise.
+        """
+        if not self.journal or os.path.exists(self.file_path) or not os.path.exists(self.legacy_path):
+            return False
+
+        with self._lock(exclusive=True):
+            if os.path.exists(self.file_path) or not os.path.exists(self.legacy_path):
+                return False
+            data = Database(self.legacy_path, self.lock_timeout).read()
+            self._write_atomic(data)
+            os.replace(self.legacy_path, f"{self.legacy_path}.migrated")
+        return True
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """
+        Returns the hit and miss counters of the read cache.
+
+        Returns
+        -------
+        dict
+            The number of cache hits, misses and currently cached files.
+        """
+        return {
+            "hits": Database._cache_hits,
+            "misses": Database._cache_misses,
+            "files": len(Database._cache)
+        }
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Empties the read cache and resets its counters.
+        """
+        with Database._cache_lock:
+            Database._cache.clear()
+            Database._cache_hits = 0
+            Database._cache_misses = 0
+
+    def _lock(self, exclusive: bool) -> FileLock:
+        """
+        Creates a lock on the data file.
+
+        Parameters
+        ----------
+        exclusive : bool
+            True for a writer lock, False for a reader lock.
+
+        Returns
+        -------
+        FileLock
+            The lock, to be used as a context manager.
+        """
+        return FileLock(self.file_path, exclusive, self.lock_timeout)
+
+    def _read_cached(self) -> Any:
+        """
+        Reads the data through the read cache while a lock is already held.
+
+        Returns
+        -------
+        Any
+            The read-only data, or an empty tuple if the file does not exist or
+            contains invalid JSON.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return ()
+
+        key = os.path.abspath(self.file_path)
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with Database._cache_lock:
+            cached = Database._cache.get(key)
+            if cached is not None and cached[0] == version:
+                Database._cache.move_to_end(key)
+                Database._cache_hits += 1
+                return cached[1]
+            Database._cache_misses += 1
+
+        try:
+            if self.journal:
+                data = list(self._iter_journal(open(self.file_path, 'rb')))
+            else:
+                data = self._load()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return ()
+
+        data = self._freeze(data)
+        with Database._cache_lock:
+            Database._cache[key] = (version, data)
+            Database._cache.move_to_end(key)
+            while len(Database._cache) > Config.CACHE_SIZE:
+                Database._cache.popitem(last=False)
+        return data
+
+    def _append(self, items: list) -> list | None:
+        """
+        Appends items to the file while the exclusive lock is already held.
+
+        In journal mode a torn last line left by an interrupted write is cut off
+        first, so the new lines are never glued onto it.
+
+        Parameters
+        ----------
+        items : list
+            The items to be appended, in order.
+
+        Returns
+        -------
+        list | None
+            In journal mode, the byte offset and length of each written line.
+            None otherwise.
+        """
+        if self.journal:
+            lines = [self._encode(item).encode() for item in items]
+            with open(self.file_path, 'a+b') as file:
+                offset = self._complete_end(file)
+                file.write(b"".join(lines))
+                self._sync(file)
+            locations = []
+            for line in lines:
+                locations.append((offset, len(line)))
+                offset += len(line)
+            return locations
+
+        try:
+            data = self._load()
+        except FileNotFoundError:
+            data = []
+        data.extend(items)
+        self._write_atomic(data)
+
+    @staticmethod
+    def _complete_end(file) -> int:
+        """
+        Truncates an open journal file after its last complete line.
+
+        Parameters
+        ----------
+        file : file object
+            The journal file opened in "a+b" mode.
+
+        Returns
+        -------
+        int
+            The size of the file, which ends with a newline unless it is empty.
+        """
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        chunk_size = 4096
+        while position > 0:
+            start = max(0, position - chunk_size)
+            file.seek(start)
+            newline = file.read(position - start).rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            file.truncate(position)
+        file.seek(0, os.SEEK_END)
+        return position
+
+    def _load(self) -> Any:
+        """
+        Loads the JSON file without locking or error handling.
+
+        Returns
+        -------
+        Any
+            The data read from the JSON file.
+        """
+        with open(self.file_path, 'r') as file:
+            return json.load(file)
+
+    def _write_atomic(self, data: Any) -> None:
+        """
+        Writes the data to a temporary file and renames it over the target.
+
+        Parameters
+        ----------
+        data : Any
+            The data to be written to the file.
+        """
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, 0o644)
+            with os.fdopen(fd, 'w') as file:
+                if self.journal:
+                    for item in data:
+                        file.write(self._encode(item))
+                else:
+                    json.dump(data, file, indent=4)
+                self._sync(file)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        if Config.FSYNC_WRITES and hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    @staticmethod
+    def _freeze(data: Any) -> Any:
+        """
+        Converts parsed JSON into read-only tuples and FrozenDict objects.
+
+        Parameters
+        ----------
+        data : Any
+            The parsed JSON data.
+
+        Returns
+        -------
+        Any
+            The read-only equivalent of the data.
+        """
+        if isinstance(data, dict):
+            return FrozenDict((key, Database._freeze(value)) for key, value in data.items())
+        if isinstance(data, list):
+            return tuple(Database._freeze(value) for value in data)
+        return data
+
+    @staticmethod
+    def _sync(file) -> None:
+        """
+        Flushes an open file to disk if durable writes are enabled.
+
+        Parameters
+        ----------
+        file : file object
+            The open file to be flushed.
+        """
+        file.flush()
+        if Config.FSYNC_WRITES:
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def _encode(item: Any) -> str:
+        """
+        Encodes a record as a single journal line.
+
+        Parameters
+        ----------
+        item : Any
+            The record to be encoded.
+
+        Returns
+        -------
+        str
+            The compact JSON representation followed by a newline.
         """
-        data = self.read()
-        data.append(item)
-        self.write(data)
\ No newline at end of file
+        return json.dumps(item, separators=(',', ':')) + "\n"
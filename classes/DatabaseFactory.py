@@ -0,0 +1,42 @@
+from classes.Config import Config
+from classes.Database import Database
+from classes.SQLiteDatabase import SQLiteDatabase
+
+
+class DatabaseFactory:
+    """
+    A factory class to create the storage backend selected in the configuration.
+
+    Methods
+    -------
+    create(file_path: str) -> Database | SQLiteDatabase:
+        Creates and returns a database for the given data file.
+    """
+
+    @staticmethod
+    def create(file_path: str) -> Database | SQLiteDatabase:
+        """
+        Creates and returns a database for the given data file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the data file. The SQLite backend uses the file name to
+            select the matching table.
+
+        Returns
+        -------
+        Database | SQLiteDatabase
+            An object implementing the read, write and append operations.
+
+        Raises
+        ------
+        ValueError
+            If the configured storage backend is not supported.
+        """
+        if Config.STORAGE_BACKEND == "json":
+            return Database(file_path)
+        elif Config.STORAGE_BACKEND == "sqlite":
+            return SQLiteDatabase(file_path, Config.SQLITE_PATH)
+        else:
+            raise ValueError("Invalid storage backend")
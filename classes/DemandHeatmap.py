@@ -0,0 +1,128 @@
+from datetime import date
+
+
+class DemandHeatmap:
+    """
+    A class to bucket orders and item quantities by weekday and hour of day.
+
+    The buckets are fixed-size flat lists indexed by order type, weekday and hour,
+    so adding an order is a constant-time update and the memory used never grows
+    with the number of orders. Two heatmaps can be merged, which allows partial
+    heatmaps to be computed separately and combined.
+
+    Attributes
+    ----------
+    orders : list
+        The number of orders per order type, weekday and hour.
+    quantities : list
+        The number of items ordered per order type, weekday and hour.
+
+    Methods
+    -------
+    add(order_data: dict) -> None:
+        Adds an order to its bucket.
+    merge(other: DemandHeatmap) -> DemandHeatmap:
+        Adds the buckets of another heatmap to this one.
+    grid(measure: str, order_type: str = None) -> list:
+        Returns a 7 x 24 grid of a measure, for one or all order types.
+    """
+
+    ORDER_TYPES = ["Dine-In", "Takeaway", "Delivery"]
+    WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    HOURS = 24
+
+    def __init__(self):
+        """
+        Constructs all the necessary attributes for the DemandHeatmap object.
+        """
+        size = len(DemandHeatmap.ORDER_TYPES) * len(DemandHeatmap.WEEKDAYS) * DemandHeatmap.HOURS
+        self.orders = [0] * size
+        self.quantities = [0] * size
+
+    def add(self, order_data: dict) -> None:
+        """
+        Adds an order to its bucket.
+
+        Orders with an unknown order type are ignored.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+        """
+        if order_data["order_type"] not in DemandHeatmap.ORDER_TYPES:
+            return
+        date_time = order_data["date_time"]
+        bucket = self._bucket(
+            DemandHeatmap.ORDER_TYPES.index(order_data["order_type"]),
+            date.fromisoformat(date_time[:10]).weekday(),
+            int(date_time[11:13])
+        )
+        self.orders[bucket] += 1
+        self.quantities[bucket] += sum(item["quantity"] for item in order_data["items"])
+
+    def merge(self, other: 'DemandHeatmap') -> 'DemandHeatmap':
+        """
+        Adds the buckets of another heatmap to this one.
+
+        Parameters
+        ----------
+        other : DemandHeatmap
+            The heatmap to be merged into this one.
+
+        Returns
+        -------
+        DemandHeatmap
+            This heatmap, for chaining.
+        """
+        self.orders = [a + b for a, b in zip(self.orders, other.orders)]
+        self.quantities = [a + b for a, b in zip(self.quantities, other.quantities)]
+        return self
+
+    def grid(self, measure: str, order_type: str = None) -> list:
+        """
+        Returns a 7 x 24 grid of a measure, for one or all order types.
+
+        Parameters
+        ----------
+        measure : str
+            "orders" or "quantities".
+        order_type : str, optional
+            The order type to include (default is all order types).
+
+        Returns
+        -------
+        list
+            One list of 24 hourly values per weekday, starting on Monday.
+        """
+        buckets = getattr(self, measure)
+        order_types = range(len(DemandHeatmap.ORDER_TYPES)) if order_type is None \
+            else [DemandHeatmap.ORDER_TYPES.index(order_type)]
+        return [
+            [
+                sum(buckets[self._bucket(type_code, weekday, hour)] for type_code in order_types)
+                for hour in range(DemandHeatmap.HOURS)
+            ]
+            for weekday in range(len(DemandHeatmap.WEEKDAYS))
+        ]
+
+    @staticmethod
+    def _bucket(type_code: int, weekday: int, hour: int) -> int:
+        """
+        Returns the flat index of a bucket.
+
+        Parameters
+        ----------
+        type_code : int
+            The index of the order type.
+        weekday : int
+            The day of the week, where Monday is 0.
+        hour : int
+            The hour of the day.
+
+        Returns
+        -------
+        int
+            The index into the bucket lists.
+        """
+        return (type_code * len(DemandHeatmap.WEEKDAYS) + weekday) * DemandHeatmap.HOURS + hour
@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class FileLock:
+    """
+    A class to provide advisory reader/writer locking between processes.
+
+    The lock is held on a separate ``.lock`` file next to the data file, so the
+    data file itself can be atomically replaced while the lock is held. Threads
+    of the same process first queue on an in-process reader/writer lock for the
+    same file, where waiting writers go ahead of new readers, so only one lock
+    per process competes for the file lock and threads never poll each other.
+    On platforms without ``fcntl`` only the in-process lock is taken.
+
+    Attributes
+    ----------
+    lock_path : str
+        The path to the lock file.
+    exclusive : bool
+        True for a writer (exclusive) lock, False for a reader (shared) lock.
+    timeout : float
+        The maximum number of seconds to wait for the lock.
+
+    Methods
+    -------
+    acquire() -> None:
+        Acquires the lock, waiting at most the configured timeout.
+    release() -> None:
+        Releases the lock.
+    """
+
+    POLL_INTERVAL = 0.01
+
+    _thread_locks = {}
+    _thread_locks_guard = threading.Lock()
+
+    def __init__(self, file_path: str, exclusive: bool, timeout: float):
+        """
+        Constructs all the necessary attributes for the FileLock object.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the data file to be locked.
+        exclusive : bool
+            True for a writer (exclusive) lock, False for a reader (shared) lock.
+        timeout : float
+            The maximum number of seconds to wait for the lock.
+        """
+        self.lock_path = f"{file_path}.lock"
+        self.exclusive = exclusive
+        self.timeout = timeout
+        self._fd = None
+        self._thread_lock = None
+
+    def acquire(self) -> None:
+        """
+        Acquires the lock, waiting at most the configured timeout.
+
+        Raises
+        ------
+        TimeoutError
+            If the lock could not be acquired within the timeout.
+        """
+        deadline = time.monotonic() + self.timeout
+        self._acquire_thread_lock()
+        if fcntl is None:
+            return
+        try:
+            directory = os.path.dirname(self.lock_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            operation = fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH
+            while True:
+                try:
+                    fcntl.flock(self._fd, operation | fcntl.LOCK_NB)
+                    return
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        os.close(self._fd)
+                        self._fd = None
+                        raise TimeoutError(f"Timed out waiting for lock on {self.lock_path}")
+                    time.sleep(FileLock.POLL_INTERVAL)
+        except BaseException:
+            self._release_thread_lock()
+            raise
+
+    def release(self) -> None:
+        """
+        Releases the lock.
+        """
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._release_thread_lock()
+
+    def _acquire_thread_lock(self) -> None:
+        """
+        Acquires the in-process reader/writer lock of the lock file.
+
+        Raises
+        ------
+        TimeoutError
+            If the lock could not be acquired within the timeout.
+        """
+        key = os.path.abspath(self.lock_path)
+        with FileLock._thread_locks_guard:
+            state = FileLock._thread_locks.get(key)
+            if state is None:
+                state = {"condition": threading.Condition(), "readers": 0, "writer": False, "waiting_writers": 0, "users": 0}
+                FileLock._thread_locks[key] = state
+            state["users"] += 1
+
+        with state["condition"]:
+            if self.exclusive:
+                state["waiting_writers"] += 1
+                try:
+                    acquired = state["condition"].wait_for(
+                        lambda: not state["writer"] and state["readers"] == 0, self.timeout
+                    )
+                finally:
+                    state["waiting_writers"] -= 1
+                if acquired:
+                    state["writer"] = True
+            else:
+                acquired = state["condition"].wait_for(
+                    lambda: not state["writer"] and state["waiting_writers"] == 0, self.timeout
+                )
+                if acquired:
+                    state["readers"] += 1
+            if not acquired:
+                state["condition"].notify_all()
+        if not acquired:
+            self._forget_thread_lock(key, state)
+            raise TimeoutError(f"Timed out waiting for lock on {self.lock_path}")
+        self._thread_lock = state
+
+    def _release_thread_lock(self) -> None:
+        """
+        Releases the in-process reader/writer lock of the lock file.
+        """
+        state = self._thread_lock
+        if state is None:
+            return
+        with state["condition"]:
+            if self.exclusive:
+                state["writer"] = False
+            else:
+                state["readers"] -= 1
+            state["condition"].notify_all()
+        self._thread_lock = None
+        self._forget_thread_lock(os.path.abspath(self.lock_path), state)
+
+    @staticmethod
+    def _forget_thread_lock(key: str, state: dict) -> None:
+        """
+        Drops the in-process lock of a lock file once no thread uses it.
+
+        Parameters
+        ----------
+        key : str
+            The absolute path of the lock file.
+        state : dict
+            The in-process lock.
+        """
+        with FileLock._thread_locks_guard:
+            state["users"] -= 1
+            if state["users"] == 0 and FileLock._thread_locks.get(key) is state:
+                del FileLock._thread_locks[key]
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
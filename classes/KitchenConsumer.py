@@ -0,0 +1,188 @@
+import json
+import os
+import sys
+import time
+from classes.Config import Config
+from classes.Database import Database
+from classes.KitchenQueue import KitchenQueue
+
+
+class KitchenConsumer:
+    """
+    A class to read kitchen tickets from the spool and track which have been handled.
+
+    Each consumer has a name and a committed offset: the sequence number of the
+    last ticket it has finished with, e.g. the last order the kitchen has
+    cooked. Offsets are kept in "offsets.json" in the spool directory, so a
+    consumer resumes after its committed offset when it is restarted.
+
+    poll() remembers the segment and byte position it has read up to and only
+    reads the lines appended since, so polling stays cheap however many tickets
+    the spool holds. The spool keeps every ticket after the lowest committed
+    offset, but if tickets are missing anyway, e.g. because the spool was
+    cleared by hand, the consumer resumes at the next ticket still in the
+    spool, counts the missing tickets in skipped and reports them on stderr.
+
+    Attributes
+    ----------
+    name : str
+        The name the consumer's offset is stored under.
+    kitchen_queue : KitchenQueue
+        The spool the tickets are read from.
+    skipped : int
+        The number of tickets that were missing from the spool when read.
+
+    Methods
+    -------
+    committed() -> int:
+        Returns the committed offset of the consumer.
+    commit(sequence: int) -> None:
+        Records that every ticket up to a sequence number has been handled.
+    poll(limit: int = None) -> list:
+        Returns the tickets published since the last ticket read.
+    wait(timeout: float) -> list:
+        Waits for new tickets, returning as soon as any arrive.
+    """
+
+    def __init__(self, name: str = "kitchen", kitchen_queue: KitchenQueue = None):
+        """
+        Constructs all the necessary attributes for the KitchenConsumer object.
+
+        Reading starts after the committed offset. The consumer's offset is
+        stored straight away, so the spool keeps its tickets from now on even
+        before the first one is handled.
+
+        Parameters
+        ----------
+        name : str, optional
+            The name the consumer's offset is stored under (default is "kitchen").
+        kitchen_queue : KitchenQueue, optional
+            The spool to read from (default is the spool in KitchenQueue.SPOOL_DIR).
+        """
+        self.name = name
+        self.kitchen_queue = kitchen_queue or KitchenQueue()
+        self._offsets = Database(os.path.join(self.kitchen_queue.spool_dir, "offsets.json"))
+        self._next_sequence = self.committed() + 1
+        self.commit(self._next_sequence - 1)
+        self._segment = None
+        self._position = 0
+        self.skipped = 0
+
+    def committed(self) -> int:
+        """
+        Returns the committed offset of the consumer.
+
+        Returns
+        -------
+        int
+            The sequence number of the last handled ticket, or 0 if none.
+        """
+        return (self._offsets.read() or {}).get(self.name, 0)
+
+    def commit(self, sequence: int) -> None:
+        """
+        Records that every ticket up to a sequence number has been handled.
+
+        The offset never moves backwards.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the last handled ticket.
+        """
+        os.makedirs(self.kitchen_queue.spool_dir, exist_ok=True)
+        self._offsets.update(
+            lambda offsets: {**(offsets or {}), self.name: max((offsets or {}).get(self.name, 0), sequence)}
+        )
+
+    def poll(self, limit: int = None) -> list:
+        """
+        Returns the tickets published since the last ticket read.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of tickets to return (default is no limit).
+
+        Returns
+        -------
+        list
+            {"sequence": n, "ticket": {...}} records in sequence order.
+        """
+        records = []
+        while limit is None or len(records) < limit:
+            if self._segment is None and not self._seek():
+                break
+            try:
+                file = open(self._segment, 'rb')
+            except FileNotFoundError:
+                self._segment = None
+                continue
+
+            with file:
+                file.seek(self._position)
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    self._position += len(line)
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record["sequence"] > self._next_sequence:
+                        missing = record["sequence"] - self._next_sequence
+                        self.skipped += missing
+                        print(f"[ERROR] {missing} kitchen tickets from {self._next_sequence} were no longer "
+                              f"in the spool when {self.name} read it.", file=sys.stderr)
+                    if record["sequence"] >= self._next_sequence:
+                        records.append(record)
+                        self._next_sequence = record["sequence"] + 1
+                        if limit is not None and len(records) >= limit:
+                            return records
+
+            following = [path for first, path in self.kitchen_queue.segments() if first >= self._next_sequence]
+            if not following:
+                break
+            self._segment, self._position = following[0], 0
+        return records
+
+    def wait(self, timeout: float) -> list:
+        """
+        Waits for new tickets, returning as soon as any arrive.
+
+        The spool is checked every Config.KDS_POLL_MS milliseconds.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum number of seconds to wait.
+
+        Returns
+        -------
+        list
+            The new records, or an empty list if none arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            records = self.poll()
+            remaining = deadline - time.monotonic()
+            if records or remaining <= 0:
+                return records
+            time.sleep(min(remaining, Config.KDS_POLL_MS / 1000))
+
+    def _seek(self) -> bool:
+        """
+        Finds the segment holding the next ticket to read.
+
+        Returns
+        -------
+        bool
+            True if a segment was found.
+        """
+        segments = self.kitchen_queue.segments()
+        if not segments:
+            return False
+        candidates = [path for first, path in segments if first <= self._next_sequence]
+        self._segment = candidates[-1] if candidates else segments[0][1]
+        self._position = 0
+        return True
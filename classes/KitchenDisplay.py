@@ -0,0 +1,140 @@
+import queue
+import sys
+import threading
+from datetime import datetime
+from classes.Config import Config
+from classes.KitchenConsumer import KitchenConsumer
+from classes.SystemUtils import SystemUtils
+
+
+class KitchenDisplay:
+    """
+    A class to show the open kitchen tickets on a terminal and bump them when cooked.
+
+    The display tails the KDS spool through a KitchenConsumer and redraws as soon
+    as new tickets arrive. Bumping the oldest ticket commits the consumer's
+    offset, so a restarted display shows only the tickets still to be cooked.
+    Keyboard input is read on a separate thread, so new tickets appear while
+    the display waits for a command. Tickets missing from the spool are
+    reported on screen, so the kitchen knows to check the order history.
+
+    Attributes
+    ----------
+    consumer : KitchenConsumer
+        The consumer the tickets are read and bumped through.
+    tickets : list
+        The open {"sequence": n, "ticket": {...}} records, oldest first.
+
+    Methods
+    -------
+    run() -> None:
+        Shows the open tickets until the user quits.
+    display(message: str = "") -> None:
+        Displays the open tickets and the options.
+    bump() -> str:
+        Marks the oldest open ticket as cooked.
+    """
+
+    MAX_SHOWN = 8
+
+    def __init__(self, consumer: KitchenConsumer = None):
+        """
+        Constructs all the necessary attributes for the KitchenDisplay object.
+
+        Parameters
+        ----------
+        consumer : KitchenConsumer, optional
+            The consumer to read tickets through (default is the "kitchen" consumer).
+        """
+        self.consumer = consumer or KitchenConsumer()
+        self.tickets = []
+
+    def run(self) -> None:
+        """
+        Shows the open tickets until the user quits.
+        """
+        commands = queue.Queue()
+        threading.Thread(target=self._read_commands, args=(commands,), daemon=True).start()
+        self.tickets.extend(self.consumer.poll())
+        message = f"[ERROR] {self.consumer.skipped} tickets were lost from the spool before they were shown." \
+            if self.consumer.skipped else ""
+        self.display(message)
+        while True:
+            try:
+                command = commands.get(timeout=Config.KDS_POLL_MS / 1000).strip().lower()
+            except queue.Empty:
+                command = None
+
+            if command == 'q':
+                return
+            if command in ('', 'b'):
+                message = self.bump()
+            elif command is not None:
+                message = "[ERROR] Please select a valid option."
+
+            skipped = self.consumer.skipped
+            new_tickets = self.consumer.poll()
+            self.tickets.extend(new_tickets)
+            if self.consumer.skipped > skipped:
+                message = f"[ERROR] {self.consumer.skipped - skipped} tickets were lost from the spool before they were shown."
+            if new_tickets or command is not None or self.consumer.skipped > skipped:
+                self.display(message)
+
+    def display(self, message: str = "") -> None:
+        """
+        Displays the open tickets and the options.
+
+        Parameters
+        ----------
+        message : str, optional
+            A message to display above the tickets.
+        """
+        SystemUtils.clear_screen()
+        SystemUtils.display_message(message)
+        SystemUtils.heading("KITCHEN DISPLAY")
+        if not self.tickets:
+            print("No open tickets.\n")
+        now = datetime.now()
+        for record in self.tickets[:KitchenDisplay.MAX_SHOWN]:
+            ticket = record["ticket"]
+            minutes = int((now - datetime.strptime(ticket["date_time"], "%Y-%m-%d %H:%M:%S")).total_seconds() // 60)
+            table = f" - Table {ticket['table_number']}" if ticket.get("table_number") else ""
+            print(f"Ticket {ticket.get('ticket_number') or record['sequence']} - {ticket['order_type']}{table} ({minutes} min)")
+            for item in ticket["items"]:
+                print(f"  {item['quantity']} x {item['name']}")
+            if ticket.get("note"):
+                print(f"  Note: {ticket['note']}")
+            print()
+        if len(self.tickets) > KitchenDisplay.MAX_SHOWN:
+            print(f"... and {len(self.tickets) - KitchenDisplay.MAX_SHOWN} more open tickets\n")
+        SystemUtils.divider()
+        print("[ENTER] Bump Oldest Ticket    [Q] Quit")
+
+    def bump(self) -> str:
+        """
+        Marks the oldest open ticket as cooked.
+
+        Returns
+        -------
+        str
+            A message describing the result.
+        """
+        if not self.tickets:
+            return "[ERROR] There are no open tickets."
+        record = self.tickets.pop(0)
+        self.consumer.commit(record["sequence"])
+        return f"[SYSTEM] Ticket {record['ticket'].get('ticket_number') or record['sequence']} bumped."
+
+    @staticmethod
+    def _read_commands(commands: queue.Queue) -> None:
+        """
+        Reads command lines from the keyboard and queues them.
+
+        Parameters
+        ----------
+        commands : queue.Queue
+            The queue the commands are put on. "q" is queued when input ends.
+        """
+        for line in sys.stdin:
+            commands.put(line)
+        commands.put("q")
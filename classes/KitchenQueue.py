@@ -0,0 +1,257 @@
+import json
+import os
+import sys
+from classes.Config import Config
+from classes.Database import Database
+from classes.FileLock import FileLock
+
+
+class KitchenQueue:
+    """
+    A class to dispatch kitchen tickets through an append-only spool.
+
+    Every ticket is appended as one JSON line, {"sequence": n, "ticket": {...}},
+    to the active segment file of the spool directory. Sequence numbers start
+    at 1 and increase by one for every ticket across all segments. Each segment
+    is named after the sequence number of its first ticket, e.g.
+    "./kds/000000000001.jsonl", so a reader finds the segment holding any
+    sequence number from the directory listing alone.
+
+    Once the active segment holds Config.KDS_SEGMENT_TICKETS tickets, the next
+    ticket starts a new segment and segments beyond the newest
+    Config.KDS_RETAINED_SEGMENTS are deleted, so dispatch cost and disk use do
+    not grow with the number of orders. When consumers are registered in
+    "offsets.json", a segment is only deleted once every one of them has
+    committed all of its tickets; while a consumer lags, older segments are
+    kept and a warning is printed on stderr. Without any consumer, e.g. on a
+    kiosk with no kitchen display attached, only the retention limit applies.
+    Publishing takes an exclusive lock on the spool, so several processes can
+    dispatch to the same kitchen.
+
+    Attributes
+    ----------
+    spool_dir : str
+        The directory holding the segment files.
+
+    Methods
+    -------
+    ticket(order_data: dict) -> dict:
+        Returns the kitchen ticket of an order.
+    publish(order_data: dict) -> int:
+        Appends the ticket of an order to the spool.
+    publish_many(orders: list) -> list:
+        Appends the tickets of several orders to the spool with a single write.
+    segments() -> list:
+        Returns the first sequence number and path of every segment, oldest first.
+    last_sequence() -> int:
+        Returns the sequence number of the newest ticket.
+    """
+
+    SPOOL_DIR = "./kds"
+    SEGMENT_SUFFIX = ".jsonl"
+
+    def __init__(self, spool_dir: str = None):
+        """
+        Constructs all the necessary attributes for the KitchenQueue object.
+
+        Parameters
+        ----------
+        spool_dir : str, optional
+            The directory holding the segment files (default is KitchenQueue.SPOOL_DIR).
+        """
+        self.spool_dir = spool_dir or KitchenQueue.SPOOL_DIR
+
+    @staticmethod
+    def ticket(order_data: dict) -> dict:
+        """
+        Returns the kitchen ticket of an order.
+
+        The ticket holds what the kitchen needs to prepare the order and leaves
+        out the payment and contact details.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+
+        Returns
+        -------
+        dict
+            The order_id, ticket_number, date_time, order_type, table_number,
+            items (id, name and quantity) and note of the order.
+        """
+        return {
+            "order_id": order_data["order_id"],
+            "ticket_number": order_data.get("ticket_number"),
+            "date_time": order_data["date_time"],
+            "order_type": order_data["order_type"],
+            "table_number": order_data.get("table_number"),
+            "items": [
+                {"id": item["id"], "name": item["name"], "quantity": item["quantity"]}
+                for item in order_data["items"]
+            ],
+            "note": order_data.get("payment_info", {}).get("note", "")
+        }
+
+    def publish(self, order_data: dict) -> int:
+        """
+        Appends the ticket of an order to the spool.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+
+        Returns
+        -------
+        int
+            The sequence number of the ticket.
+        """
+        return self.publish_many([order_data])[0]
+
+    def publish_many(self, orders: list) -> list:
+        """
+        Appends the tickets of several orders to the spool with a single write.
+
+        Parameters
+        ----------
+        orders : list
+            The order records, in the order they should reach the kitchen.
+
+        Returns
+        -------
+        list
+            The sequence numbers of the tickets.
+        """
+        if not orders:
+            return []
+        os.makedirs(self.spool_dir, exist_ok=True)
+        with FileLock(os.path.join(self.spool_dir, "spool"), True, Config.LOCK_TIMEOUT):
+            segments = self.segments()
+            last = self._last_in(segments[-1][1]) if segments else 0
+            if not segments or last - segments[-1][0] + 1 >= Config.KDS_SEGMENT_TICKETS:
+                segments.append((last + 1, self._segment_path(last + 1)))
+                self._rotate(segments)
+
+            sequences = list(range(last + 1, last + 1 + len(orders)))
+            Database(segments[-1][1]).append_many([
+                {"sequence": sequence, "ticket": self.ticket(order_data)}
+                for sequence, order_data in zip(sequences, orders)
+            ])
+        return sequences
+
+    def segments(self) -> list:
+        """
+        Returns the first sequence number and path of every segment, oldest first.
+
+        Returns
+        -------
+        list
+            (first_sequence, path) tuples in ascending order.
+        """
+        try:
+            names = os.listdir(self.spool_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            (int(name[:-len(KitchenQueue.SEGMENT_SUFFIX)]), os.path.join(self.spool_dir, name))
+            for name in names
+            if name.endswith(KitchenQueue.SEGMENT_SUFFIX) and name[:-len(KitchenQueue.SEGMENT_SUFFIX)].isdigit()
+        )
+
+    def last_sequence(self) -> int:
+        """
+        Returns the sequence number of the newest ticket.
+
+        Returns
+        -------
+        int
+            The sequence number, or 0 if no ticket has been published.
+        """
+        segments = self.segments()
+        return self._last_in(segments[-1][1]) if segments else 0
+
+    def _segment_path(self, first_sequence: int) -> str:
+        """
+        Returns the path of the segment starting at a sequence number.
+
+        Parameters
+        ----------
+        first_sequence : int
+            The sequence number of the segment's first ticket.
+
+        Returns
+        -------
+        str
+            The path of the segment file.
+        """
+        return os.path.join(self.spool_dir, f"{first_sequence:012d}{KitchenQueue.SEGMENT_SUFFIX}")
+
+    def _rotate(self, segments: list) -> None:
+        """
+        Deletes the oldest segments beyond the number retained.
+
+        Segments holding tickets after the lowest committed offset are kept, so
+        no registered consumer loses a ticket it has not handled yet.
+
+        Parameters
+        ----------
+        segments : list
+            The (first_sequence, path) tuples of the spool, including the new
+            active segment. Deleted segments are removed from the list.
+        """
+        offsets = Database(os.path.join(self.spool_dir, "offsets.json")).read() or {}
+        lowest = min(offsets.values(), default=None)
+        while len(segments) > max(1, Config.KDS_RETAINED_SEGMENTS):
+            if lowest is not None and segments[1][0] - 1 > lowest:
+                lagging = ", ".join(name for name, offset in offsets.items() if offset == lowest)
+                print(f"[ERROR] The KDS spool holds {len(segments)} segments, more than the "
+                      f"{Config.KDS_RETAINED_SEGMENTS} retained, because {lagging} has only handled "
+                      f"tickets up to {lowest}.", file=sys.stderr)
+                return
+            _, path = segments.pop(0)
+            for file_path in (path, f"{path}.lock"):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _last_in(segment_path: str) -> int:
+        """
+        Returns the sequence number of the last complete ticket of a segment.
+
+        Only the end of the file is read.
+
+        Parameters
+        ----------
+        segment_path : str
+            The path of the segment file.
+
+        Returns
+        -------
+        int
+            The sequence number, or one less than the segment's first sequence
+            number if it holds no complete ticket.
+        """
+        first = int(os.path.basename(segment_path)[:-len(KitchenQueue.SEGMENT_SUFFIX)])
+        try:
+            with open(segment_path, 'rb') as file:
+                end = file.seek(0, os.SEEK_END)
+                chunk_size = 4096
+                while True:
+                    start = max(0, end - chunk_size)
+                    file.seek(start)
+                    lines = file.read(end - start).split(b"\n")
+                    complete = [line for line in lines[:-1] if line.strip()]
+                    if start == 0 or len(complete) > 1:
+                        break
+                    chunk_size *= 2
+        except FileNotFoundError:
+            return first - 1
+        for line in reversed(complete):
+            try:
+                return json.loads(line)["sequence"]
+            except (json.JSONDecodeError, KeyError):
+                continue
+        return first - 1
@@ -54,7 +54,8 @@ class MainInterface:
             elif user_input == '2':
                 SystemUtils.clear_screen()
                 SystemUtils.heading("STAFF LOGIN")
-                if PinValidator.check_pin():
-                    StaffInterface.display()
+                pin = PinValidator.check_pin()
+                if pin:
+                    StaffInterface.display(pin)
             else:
                 self.message = "[ERROR] Invalid Option. Please select a valid option."
\ No newline at end of file
@@ -0,0 +1,175 @@
+from classes.Config import Config
+from classes.Menu import Menu
+
+
+class MenuBrowser:
+    """
+    A class to hold the category filter, search query and page of a menu screen.
+
+    The filtered items come from the menu indexes and are kept until the filter
+    changes, and each screen refresh renders a single page of them.
+
+    Attributes
+    ----------
+    menu : Menu
+        An instance of the Menu class representing the menu.
+    category : str
+        The category shown, or None for every category.
+    query : str
+        The search query, or an empty string for no search.
+    page : int
+        The index of the page shown, starting at 0.
+    page_size : int
+        The number of items on each page.
+
+    Methods
+    -------
+    items() -> list:
+        Returns the menu items matching the category filter and search query.
+    page_count() -> int:
+        Returns the number of pages of matching items.
+    display() -> None:
+        Displays the filter, the current page of items and the page number.
+    display_options() -> None:
+        Displays the browsing options.
+    handle_input(user_input: str) -> str | None:
+        Handles a browsing option.
+    """
+
+    def __init__(self, menu: Menu, page_size: int = None):
+        """
+        Constructs all the necessary attributes for the MenuBrowser object.
+
+        Parameters
+        ----------
+        menu : Menu
+            An instance of the Menu class representing the menu.
+        page_size : int, optional
+            The number of items on each page (default is Config.MENU_PAGE_SIZE).
+        """
+        self.menu = menu
+        self.category = None
+        self.query = ""
+        self.page = 0
+        self.page_size = page_size or Config.MENU_PAGE_SIZE
+        self._items = None
+
+    def items(self) -> list:
+        """
+        Returns the menu items matching the category filter and search query.
+
+        Returns
+        -------
+        list
+            The matching menu items in menu order.
+        """
+        if self._items is None:
+            self._items = self.menu.search(self.query, self.category)
+        return self._items
+
+    def page_count(self) -> int:
+        """
+        Returns the number of pages of matching items.
+
+        Returns
+        -------
+        int
+            The number of pages, at least 1.
+        """
+        return max(1, -(-len(self.items()) // self.page_size))
+
+    def display(self) -> None:
+        """
+        Displays the filter, the current page of items and the page number.
+        """
+        if self.category or self.query:
+            filters = [f"Category: {self.category}"] if self.category else []
+            filters += [f"Search: \"{self.query}\""] if self.query else []
+            print(f"{'    '.join(filters)}\n")
+
+        self.page = min(self.page, self.page_count() - 1)
+        start = self.page * self.page_size
+        items = self.items()[start:start + self.page_size]
+        if items:
+            self.menu.display_menu(items)
+        else:
+            print("No menu items found.\n")
+        print(f"Page {self.page + 1} of {self.page_count()} ({len(self.items())} items)\n")
+
+    def display_options(self) -> None:
+        """
+        Displays the browsing options.
+        """
+        print("[N] Next Page        [P] Previous Page        [C] Category        [S] Search        [A] All Items\n")
+
+    def handle_input(self, user_input: str) -> str | None:
+        """
+        Handles a browsing option.
+
+        Parameters
+        ----------
+        user_input : str
+            The lowercase option entered by the user.
+
+        Returns
+        -------
+        str | None
+            A message to display (empty if there is none), or None if the input
+            is not a browsing option.
+        """
+        if user_input == 'n':
+            if self.page + 1 >= self.page_count():
+                return "[ERROR] This is the last page."
+            self.page += 1
+        elif user_input == 'p':
+            if self.page == 0:
+                return "[ERROR] This is the first page."
+            self.page -= 1
+        elif user_input == 'c':
+            return self._select_category()
+        elif user_input == 's':
+            self._filter(self.category, input("Search: ").strip())
+        elif user_input == 'a':
+            self._filter(None, "")
+        else:
+            return None
+        return ""
+
+    def _select_category(self) -> str:
+        """
+        Prompts for a category to filter the menu by.
+
+        Returns
+        -------
+        str
+            A message to display, or an empty string.
+        """
+        categories = self.menu.categories()
+        print()
+        for index, category in enumerate(categories, start=1):
+            print(f"[{index}] {category}")
+        print("[A] All Categories\n")
+        user_input = input("Select a category: ").lower()
+        if user_input == 'a':
+            self._filter(None, self.query)
+        elif user_input.isdigit() and 1 <= int(user_input) <= len(categories):
+            self._filter(categories[int(user_input) - 1], self.query)
+        else:
+            return "[ERROR] Please select a valid category."
+        return ""
+
+    def _filter(self, category: str, query: str) -> None:
+        """
+        Changes the category filter and search query and returns to the first page.
+
+        Parameters
+        ----------
+        category : str
+            The category to show, or None for every category.
+        query : str
+            The search query, or an empty string for no search.
+        """
+        self.category = category
+        self.query = query
+        self.page = 0
+        self._items = None
@@ -1,4 +1,5 @@
 from classes.Menu import Menu
+from classes.MenuBrowser import MenuBrowser
 from classes.SystemUtils import SystemUtils
 
 class MenuHandler:
@@ -16,6 +17,9 @@ class MenuHandler:
         """
         Displays the menu and handles user interaction for ordering or exiting.
 
+        The menu is shown one page at a time and can be filtered by category or
+        searched.
+
         Parameters
         ----------
         menu : Menu
@@ -26,17 +30,21 @@ class MenuHandler:
         bool
             True if the user chooses to order, False if the user chooses to exit.
         """
+        browser = MenuBrowser(menu)
         message = ""
         while True:
             SystemUtils.clear_screen()
             SystemUtils.display_message(message)
             SystemUtils.heading("MENU")
-            menu.display_menu()
-            print("\n[O] Order        [E] Exit")
+            browser.display()
+            browser.display_options()
+            print("[O] Order        [E] Exit")
             user_input = input("\nSelect an option: ").lower()
             if user_input == 'o':
                 return True
             elif user_input == 'e':
                 return False
             else:
-                message = "[ERROR] Invalid Option. Please select a valid option."
+                message = browser.handle_input(user_input)
+                if message is None:
+                    message = "[ERROR] Invalid Option. Please select a valid option."
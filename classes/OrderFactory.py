@@ -13,8 +13,12 @@ class OrderFactory:
     -------
     create_order(order_type: str, menu: Menu) -> Order:
         Creates and returns an order based on the specified type.
+    create_reorder(order_data: dict, menu: Menu) -> Order:
+        Creates a new order with the items of a past order.
     """
 
+    ORDER_TYPES = {"Dine-In": '1', "Takeaway": '2', "Delivery": '3'}
+
     @staticmethod
     def create_order(order_type: str, menu: Menu) -> Order:
         """
@@ -45,3 +49,29 @@ class OrderFactory:
             return DeliveryOrder(menu)
         else:
             raise ValueError("Invalid order type")
+
+    @staticmethod
+    def create_reorder(order_data: dict, menu: Menu) -> Order:
+        """
+        Creates a new order with the items of a past order.
+
+        Items that are no longer on the menu are left out. The contact details
+        and delivery address are not copied; they are entered again at checkout.
+
+        Parameters
+        ----------
+        order_data : dict
+            The past order record.
+        menu : Menu
+            An instance of the Menu class representing the menu.
+
+        Returns
+        -------
+        Order
+            A new order of the same type, with a new order ID.
+        """
+        order = OrderFactory.create_order(OrderFactory.ORDER_TYPES[order_data["order_type"]], menu)
+        for item in order_data["items"]:
+            if menu.get(item["id"]):
+                order.add_item(item["id"], item["quantity"])
+        return order
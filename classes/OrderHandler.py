@@ -3,6 +3,7 @@ from classes.OrderFactory import OrderFactory
 from classes.Order import Order
 from classes.PaymentHandler import PaymentHandler
 from classes.Menu import Menu
+from classes.MenuBrowser import MenuBrowser
 
 
 class OrderHandler:
@@ -13,6 +14,8 @@ class OrderHandler:
     -------
     handle_order(menu: Menu) -> None:
         Handles the process of creating and managing an order.
+    manage_order(order: Order, menu: Menu, view_cart: bool = False) -> None:
+        Lets the user add and remove items and pay for an order.
     select_order_type() -> str:
         Displays the order type selection menu and returns the selected option.
     add_items_to_order(order: Order, menu: Menu) -> str:
@@ -38,8 +41,25 @@ class OrderHandler:
             return
         
         order = OrderFactory.create_order(order_type, menu)
+        OrderHandler.manage_order(order, menu)
+
+    @staticmethod
+    def manage_order(order: Order, menu: Menu, view_cart: bool = False) -> None:
+        """
+        Lets the user add and remove items and pay for an order.
+
+        Parameters
+        ----------
+        order : Order
+            The order to be managed.
+        menu : Menu
+            An instance of the Menu class representing the menu.
+        view_cart : bool, optional
+            True to start on the cart instead of the menu (default is False).
+        """
         while True:
-            status = OrderHandler.add_items_to_order(order, menu)
+            status = 'v' if view_cart else OrderHandler.add_items_to_order(order, menu)
+            view_cart = False
             if status == 'v':
                 status = OrderHandler.display_order(order)
                 if status == 'p':
@@ -99,26 +119,31 @@ class OrderHandler:
         str
             'v' to view cart, 'e' to exit, or 'b' to go back.
         """
+        browser = MenuBrowser(menu)
         message = ""
         while True:
             SystemUtils.clear_screen()
             SystemUtils.display_message(message)
             SystemUtils.heading("ORDERING")
-            menu.display_menu()
+            browser.display()
+            browser.display_options()
             print("[V] View Cart        [E] Exit\n")
             user_input = input("Select an option: ").lower()
+            message = ""
             if user_input == 'v':
                 return 'v'
             elif user_input == 'e':
                 return 'e'
-            elif user_input.isdigit() and 1 <= int(user_input) <= len(menu):
+            elif user_input.isdigit() and menu.get(int(user_input)):
                 quantity = input("Quantity: ")
                 if quantity.isdigit() and int(quantity) > 0:
                     order.add_item(int(user_input), int(quantity))
                 else:
                     message = "[ERROR] Please enter a valid quantity."
             else:
-                message = "[ERROR] Please enter a valid menu item number."
+                message = browser.handle_input(user_input)
+                if message is None:
+                    message = "[ERROR] Please enter a valid menu item number."
 
     @staticmethod
     def remove_items_from_order(order: Order) -> str:
@@ -138,15 +163,12 @@ class OrderHandler:
         user_input = input("\nEnter the item number to remove or [E] Exit: ").lower()
         if user_input == 'e':
             return
-        elif user_input.isdigit() and 1 <= int(user_input) <= len(order.order_items):
-            item_index = int(user_input) - 1
-            item = order.order_items[item_index]
+        elif user_input.isdigit() and 1 <= int(user_input) <= len(order.items):
+            item = order.order_items[int(user_input) - 1]
             quantity_to_remove = input(f"Enter the quantity to remove (max {item.quantity}): ")
             if quantity_to_remove.isdigit() and 1 <= int(quantity_to_remove) <= item.quantity:
                 quantity_to_remove = int(quantity_to_remove)
-                item.quantity -= quantity_to_remove
-                if item.quantity == 0:
-                    order.order_items.pop(item_index)
+                order.remove_item(item.menu_item.id, quantity_to_remove)
                 return f"[SYSTEM] {item.menu_item.name} (x{quantity_to_remove}) Removed"
             else:
                 return "[ERROR] Please enter a valid quantity."
@@ -177,12 +199,12 @@ class OrderHandler:
             print("\n[R] Remove Item        [P] Pay        [B] Back        [E] Exit\n")
             user_input = input("Select an option: ").lower()
             if user_input == 'r':
-                if order.order_items:
+                if order.items:
                     message = OrderHandler.remove_items_from_order(order)
                 else:
                     message = "[ERROR] Your order is empty."
             elif user_input == 'p':
-                if order.order_items:
+                if order.items:
                     return 'p'
                 message = "[ERROR] Your order is empty."
             elif user_input == 'b':
@@ -0,0 +1,445 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Iterator
+from classes.Config import Config
+from classes.Database import Database
+from classes.OrderId import OrderId
+from classes.OrderIndex import OrderIndex
+from classes.CustomerIndex import CustomerIndex
+from classes.SQLiteDatabase import SQLiteDatabase
+
+
+class OrderHistory:
+    """
+    A class to store and query the order history in per-day shards.
+
+    Every order is appended to the journal file of the day it was placed, e.g.
+    "./order_history/2024-05-31.jsonl", so a report only opens the shards of the
+    days it asks for. Orders in the legacy single "./order_history.jsonl" (or
+    "./order_history.json") file remain readable until they are split into
+    shards with split_legacy(). Every appended order is also recorded in the
+    OrderIndex, so single orders and the legacy file's orders for a day can be
+    read by seeking straight to their records, and orders with contact details
+    are recorded in the CustomerIndex. With the "sqlite" storage backend
+    the orders table is queried through its indexes instead.
+
+    Attributes
+    ----------
+    backend : str
+        The storage backend used ("json" or "sqlite").
+
+    Methods
+    -------
+    append(order_data: dict) -> None:
+        Appends an order to the shard of the day it was placed.
+    append_many(orders: list, progress: dict = None) -> None:
+        Appends several orders with one write per shard and index.
+    iter_orders(start_date: date = None, end_date: date = None) -> Iterator[dict]:
+        Streams the orders placed between two dates, inclusive.
+    iter_legacy(start_date: date = None, end_date: date = None) -> Iterator[dict]:
+        Streams the orders of the legacy history file placed between two dates.
+    iter_shard(day: date) -> Iterator[dict]:
+        Streams the orders stored in the shard of a single day.
+    days_in_range(start_date: date = None, end_date: date = None) -> list:
+        Returns the days with a shard between two dates, inclusive.
+    iter_rows_after(day: date, rowid: int) -> Iterator[tuple]:
+        Streams the orders of a day stored after a rowid, with their rowids.
+    row_stats(day: date) -> tuple:
+        Returns the number of orders of a day and their highest rowid.
+    read_day(day: date) -> tuple:
+        Returns all orders placed on a single day.
+    find(order_id: str) -> dict | None:
+        Returns a single order by its ID.
+    rebuild_index() -> int:
+        Rebuilds the order index from the history files.
+    shard_dates() -> list:
+        Returns the dates that have a shard, in ascending order.
+    shard_path(day: date) -> str:
+        Returns the path of the shard for the given day.
+    order_date(order_data: dict) -> date:
+        Returns the day an order was placed.
+    split_legacy() -> int:
+        Moves the orders of the legacy history file into the day shards.
+    """
+
+    SHARD_DIR = "./order_history"
+    LEGACY_PATH = "./order_history.jsonl"
+    DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, backend: str = None):
+        """
+        Constructs all the necessary attributes for the OrderHistory object.
+
+        Parameters
+        ----------
+        backend : str, optional
+            The storage backend to use (default is Config.STORAGE_BACKEND).
+        """
+        self.backend = backend or Config.STORAGE_BACKEND
+
+    @staticmethod
+    def shard_path(day: date) -> str:
+        """
+        Returns the path of the shard for the given day.
+
+        Parameters
+        ----------
+        day : date
+            The day of the shard.
+
+        Returns
+        -------
+        str
+            The path of the shard journal file.
+        """
+        return os.path.join(OrderHistory.SHARD_DIR, f"{day.isoformat()}.jsonl")
+
+    @staticmethod
+    def order_date(order_data: dict) -> date:
+        """
+        Returns the day an order was placed.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+
+        Returns
+        -------
+        date
+            The date part of the order's date_time.
+        """
+        return datetime.strptime(order_data["date_time"], OrderHistory.DATE_TIME_FORMAT).date()
+
+    def append(self, order_data: dict) -> None:
+        """
+        Appends an order to the shard of the day it was placed.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record to be stored.
+        """
+        self.append_many([order_data])
+
+    def append_many(self, orders: list, progress: dict = None) -> None:
+        """
+        Appends several orders with one write per shard and index.
+
+        The orders of each day are written to its shard together and their
+        locations recorded in the OrderIndex with a single append, so a batch of
+        orders costs a few writes instead of several per order.
+
+        Each completed write is recorded in progress, so calling this again with
+        the same orders and progress after a failure only performs the writes
+        that did not happen.
+
+        Parameters
+        ----------
+        orders : list
+            The order records to be stored, in commit order.
+        progress : dict, optional
+            The writes already completed for these orders, updated in place.
+        """
+        progress = {} if progress is None else progress
+        if self.backend == "sqlite":
+            if "orders" not in progress:
+                self._sqlite().append_many(orders)
+                progress["orders"] = True
+        else:
+            os.makedirs(OrderHistory.SHARD_DIR, exist_ok=True)
+            by_shard = {}
+            for order_data in orders:
+                by_shard.setdefault(self.shard_path(self.order_date(order_data)), []).append(order_data)
+            shards = progress.setdefault("shards", {})
+            indexed = progress.setdefault("indexed", set())
+            for shard_path, shard_orders in by_shard.items():
+                if shard_path not in shards:
+                    shards[shard_path] = Database(shard_path).append_many(shard_orders)
+                if shard_path not in indexed:
+                    OrderIndex().add_many(shard_orders, shard_path, shards[shard_path])
+                    indexed.add(shard_path)
+        if "customers" not in progress:
+            CustomerIndex().add_orders(orders)
+            progress["customers"] = True
+
+    def iter_orders(self, start_date: date = None, end_date: date = None) -> Iterator[dict]:
+        """
+        Streams the orders placed between two dates, inclusive.
+
+        Only the shards inside the range are opened. Orders still stored in the
+        legacy history file are read first, through the order index when the file
+        is fully indexed and the range is bounded, or by a filtered scan otherwise.
+
+        Parameters
+        ----------
+        start_date : date, optional
+            The first day to include (default is the first day with orders).
+        end_date : date, optional
+            The last day to include (default is the last day with orders).
+
+        Yields
+        ------
+        dict
+            The next order, in the order the orders were stored.
+        """
+        if self.backend == "sqlite":
+            yield from self._sqlite().iter_between(
+                start_date.isoformat() if start_date else None,
+                (end_date + timedelta(days=1)).isoformat() if end_date else None
+            )
+            return
+
+        yield from self.iter_legacy(start_date, end_date)
+        for day in self.days_in_range(start_date, end_date):
+            yield from self.iter_shard(day)
+
+    def iter_legacy(self, start_date: date = None, end_date: date = None) -> Iterator[dict]:
+        """
+        Streams the orders of the legacy history file placed between two dates.
+
+        The order index is used when it fully covers the legacy file and the range
+        is bounded; otherwise the file is scanned and filtered by date.
+
+        Parameters
+        ----------
+        start_date : date, optional
+            The first day to include.
+        end_date : date, optional
+            The last day to include.
+
+        Yields
+        ------
+        dict
+            The next order stored in the legacy file.
+        """
+        legacy = Database(OrderHistory.LEGACY_PATH)
+        index = OrderIndex()
+        if start_date and end_date and index.covers(legacy.file_path):
+            day = start_date
+            while day <= end_date:
+                yield from index.orders_on(day, legacy.file_path)
+                day += timedelta(days=1)
+        elif os.path.exists(legacy.file_path) or os.path.exists(legacy.legacy_path):
+            for order_data in legacy.iter_records():
+                day = self.order_date(order_data)
+                if (start_date is None or day >= start_date) and (end_date is None or day <= end_date):
+                    yield order_data
+
+    def iter_shard(self, day: date) -> Iterator[dict]:
+        """
+        Streams the orders stored in the shard of a single day.
+
+        Parameters
+        ----------
+        day : date
+            The day of the shard.
+
+        Yields
+        ------
+        dict
+            The next order stored in the shard.
+        """
+        yield from Database(self.shard_path(day)).iter_records()
+
+    def iter_rows_after(self, day: date, rowid: int) -> Iterator[tuple]:
+        """
+        Streams the orders of a day stored after a rowid, with their rowids.
+
+        Only available with the "sqlite" backend.
+
+        Parameters
+        ----------
+        day : date
+            The day the orders were placed.
+        rowid : int
+            Only orders with a higher rowid are returned.
+
+        Yields
+        ------
+        tuple
+            The rowid and the order, in the order the orders were stored.
+        """
+        yield from self._sqlite().iter_rows_after(day.isoformat(), (day + timedelta(days=1)).isoformat(), rowid)
+
+    def row_stats(self, day: date) -> tuple:
+        """
+        Returns the number of orders of a day and their highest rowid.
+
+        Only available with the "sqlite" backend.
+
+        Parameters
+        ----------
+        day : date
+            The day the orders were placed.
+
+        Returns
+        -------
+        tuple
+            The number of orders and the highest rowid, or (0, 0) if there are none.
+        """
+        return self._sqlite().order_stats(day.isoformat(), (day + timedelta(days=1)).isoformat())
+
+    def read_day(self, day: date) -> tuple:
+        """
+        Returns all orders placed on a single day.
+
+        Parameters
+        ----------
+        day : date
+            The day to read.
+
+        Returns
+        -------
+        tuple
+            The read-only orders of that day.
+        """
+        return tuple(self.iter_orders(day, day))
+
+    def find(self, order_id: str) -> dict | None:
+        """
+        Returns a single order by its ID.
+
+        The order index answers the lookup with one seek. An order missing from
+        the index is looked for in the shards of the day its time-ordered ID was
+        created and the day after, and, only when the legacy history file has
+        not been fully indexed yet, in that file.
+
+        Parameters
+        ----------
+        order_id : str
+            The ID of the order.
+
+        Returns
+        -------
+        dict | None
+            The order record, or None if no order has that ID.
+        """
+        if self.backend == "sqlite":
+            return self._sqlite().get_order(order_id)
+
+        index = OrderIndex()
+        order_data = index.find(order_id)
+        if order_data is not None:
+            return order_data
+
+        created_at = OrderId.timestamp(order_id)
+        if created_at is not None:
+            day = created_at.date()
+            for shard_day in self.days_in_range(day, day + timedelta(days=1)):
+                for order_data in self.iter_shard(shard_day):
+                    if order_data["order_id"] == order_id:
+                        return order_data
+        if index.covers(OrderHistory.LEGACY_PATH):
+            return None
+        return next((order_data for order_data in self.iter_legacy() if order_data["order_id"] == order_id), None)
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuilds the order index from the history files.
+
+        Returns
+        -------
+        int
+            The number of orders indexed.
+        """
+        Database(OrderHistory.LEGACY_PATH).migrate()
+        file_paths = [OrderHistory.LEGACY_PATH] + [self.shard_path(day) for day in self.shard_dates()]
+        return OrderIndex().rebuild(file_paths)
+
+    @staticmethod
+    def shard_dates() -> list:
+        """
+        Returns the dates that have a shard, in ascending order.
+
+        Returns
+        -------
+        list
+            A sorted list of date objects.
+        """
+        try:
+            names = os.listdir(OrderHistory.SHARD_DIR)
+        except FileNotFoundError:
+            return []
+
+        days = []
+        for name in names:
+            if name.endswith(".jsonl"):
+                try:
+                    days.append(date.fromisoformat(name[:-len(".jsonl")]))
+                except ValueError:
+                    continue
+        return sorted(days)
+
+    def split_legacy(self) -> int:
+        """
+        Moves the orders of the legacy history file into the day shards.
+
+        The legacy journal is renamed with a ``.migrated`` suffix afterwards so its
+        orders are not read twice.
+
+        Returns
+        -------
+        int
+            The number of orders moved.
+        """
+        legacy = Database(OrderHistory.LEGACY_PATH)
+        orders = legacy.read()
+        if not os.path.exists(legacy.file_path):
+            return 0
+
+        days = {}
+        for order_data in orders:
+            days.setdefault(self.order_date(order_data), []).append(order_data)
+
+        os.makedirs(OrderHistory.SHARD_DIR, exist_ok=True)
+        for day, day_orders in days.items():
+            shard = Database(self.shard_path(day))
+            shard.write(list(shard.read()) + day_orders)
+        os.replace(legacy.file_path, f"{legacy.file_path}.migrated")
+        self.rebuild_index()
+        return len(orders)
+
+    def days_in_range(self, start_date: date = None, end_date: date = None) -> list:
+        """
+        Returns the days with a shard between two dates, inclusive.
+
+        A fully bounded range is walked day by day, so its cost depends on the
+        length of the range rather than the number of shards on disk.
+
+        Parameters
+        ----------
+        start_date : date, optional
+            The first day to include.
+        end_date : date, optional
+            The last day to include.
+
+        Returns
+        -------
+        list
+            A sorted list of date objects.
+        """
+        if start_date is None or end_date is None:
+            return [
+                day for day in self.shard_dates()
+                if (start_date is None or day >= start_date) and (end_date is None or day <= end_date)
+            ]
+
+        days = []
+        day = start_date
+        while day <= end_date:
+            if os.path.exists(self.shard_path(day)):
+                days.append(day)
+            day += timedelta(days=1)
+        return days
+
+    def _sqlite(self) -> SQLiteDatabase:
+        """
+        Returns the SQLite database holding the orders table.
+
+        Returns
+        -------
+        SQLiteDatabase
+            The database for the order history collection.
+        """
+        return SQLiteDatabase(OrderHistory.LEGACY_PATH, Config.SQLITE_PATH)
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+
+class OrderId:
+    """
+    A class to generate time-ordered, collision-safe order IDs.
+
+    The IDs follow the ULID layout: a 48-bit millisecond timestamp followed by 80
+    random bits, written as 26 Crockford base32 characters. IDs therefore sort
+    by creation time as plain strings, so invoice files, history records and
+    indexes keyed on the ID are in time order, and the IDs created in a time
+    range share a common prefix. Within the same millisecond the random part is
+    incremented, so IDs from one process are strictly increasing. Older uuid4
+    order IDs remain valid IDs, they just carry no timestamp.
+
+    Methods
+    -------
+    new() -> str:
+        Returns a new order ID.
+    lower_bound(moment: datetime) -> str:
+        Returns the smallest order ID that can be created at a moment.
+    timestamp(order_id: str) -> datetime | None:
+        Returns the creation time encoded in an order ID.
+    """
+
+    ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+    RANDOM_BITS = 80
+
+    _lock = threading.Lock()
+    _last_millis = -1
+    _last_random = 0
+
+    @staticmethod
+    def new() -> str:
+        """
+        Returns a new order ID.
+
+        Returns
+        -------
+        str
+            The 26-character ID.
+        """
+        with OrderId._lock:
+            millis = time.time_ns() // 1_000_000
+            if millis <= OrderId._last_millis:
+                millis = OrderId._last_millis
+                random_part = OrderId._last_random + 1
+                if random_part >> OrderId.RANDOM_BITS:
+                    millis += 1
+                    random_part = int.from_bytes(os.urandom(10), "big")
+            else:
+                random_part = int.from_bytes(os.urandom(10), "big")
+            OrderId._last_millis = millis
+            OrderId._last_random = random_part
+        return OrderId._encode((millis << OrderId.RANDOM_BITS) | random_part)
+
+    @staticmethod
+    def lower_bound(moment: datetime) -> str:
+        """
+        Returns the smallest order ID that can be created at a moment.
+
+        Parameters
+        ----------
+        moment : datetime
+            The moment, in local time if it has no timezone.
+
+        Returns
+        -------
+        str
+            The ID, for use as an inclusive lower or exclusive upper bound of a
+            range of IDs.
+        """
+        return OrderId._encode(int(moment.timestamp() * 1000) << OrderId.RANDOM_BITS)
+
+    @staticmethod
+    def timestamp(order_id: str) -> datetime | None:
+        """
+        Returns the creation time encoded in an order ID.
+
+        Parameters
+        ----------
+        order_id : str
+            The order ID.
+
+        Returns
+        -------
+        datetime | None
+            The local creation time, or None for a legacy uuid4 order ID.
+        """
+        if len(order_id) != 26 or any(char not in OrderId.ALPHABET for char in order_id):
+            return None
+        millis = OrderId._decode(order_id) >> OrderId.RANDOM_BITS
+        return datetime.fromtimestamp(millis / 1000, timezone.utc).astimezone().replace(tzinfo=None)
+
+    @staticmethod
+    def _encode(value: int) -> str:
+        """
+        Encodes a 128-bit integer as 26 Crockford base32 characters.
+
+        Parameters
+        ----------
+        value : int
+            The integer to encode.
+
+        Returns
+        -------
+        str
+            The encoded ID.
+        """
+        chars = []
+        for _ in range(26):
+            chars.append(OrderId.ALPHABET[value & 31])
+            value >>= 5
+        return "".join(reversed(chars))
+
+    @staticmethod
+    def _decode(order_id: str) -> int:
+        """
+        Decodes 26 Crockford base32 characters into an integer.
+
+        Parameters
+        ----------
+        order_id : str
+            The encoded ID.
+
+        Returns
+        -------
+        int
+            The decoded integer.
+        """
+        value = 0
+        for char in order_id:
+            value = (value << 5) | OrderId.ALPHABET.index(char)
+        return value
@@ -0,0 +1,282 @@
+import json
+import os
+import threading
+from datetime import date
+from classes.Database import Database
+
+
+class OrderIndex:
+    """
+    A class to maintain a persistent byte-offset index over the order history.
+
+    The index is an append-only journal of entries that map each order_id and
+    calendar date to the file, byte offset and length of the order's line. It is
+    updated on every append and loaded incrementally: each process only reads the
+    index lines added since its last lookup. A rebuild also records the size of
+    every file it scanned, so readers can tell whether a file is fully indexed.
+
+    Attributes
+    ----------
+    index_path : str
+        The path to the index journal.
+
+    Methods
+    -------
+    add(order_data: dict, file_path: str, offset: int, length: int) -> None:
+        Records the location of a newly appended order.
+    add_many(orders: list, file_path: str, locations: list) -> None:
+        Records the locations of orders appended to a file together.
+    locate(order_id: str) -> tuple | None:
+        Returns the file, offset and length of an order.
+    find(order_id: str) -> dict | None:
+        Reads an order by seeking straight to its record.
+    orders_on(day: date, file_path: str = None) -> list:
+        Reads the orders placed on a day by seeking straight to their records.
+    covers(file_path: str) -> bool:
+        Checks whether every record of a file is in the index.
+    rebuild(file_paths: list) -> int:
+        Rebuilds the index by scanning the given journal files.
+    """
+
+    INDEX_PATH = "./order_history/index.jsonl"
+
+    _states = {}
+    _lock = threading.Lock()
+
+    def __init__(self, index_path: str = None):
+        """
+        Constructs all the necessary attributes for the OrderIndex object.
+
+        Parameters
+        ----------
+        index_path : str, optional
+            The path to the index journal (default is OrderIndex.INDEX_PATH).
+        """
+        self.index_path = index_path or OrderIndex.INDEX_PATH
+
+    def add(self, order_data: dict, file_path: str, offset: int, length: int) -> None:
+        """
+        Records the location of a newly appended order.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record that was appended.
+        file_path : str
+            The journal file the order was appended to.
+        offset : int
+            The byte offset of the order's line.
+        length : int
+            The length of the order's line in bytes.
+        """
+        self.add_many([order_data], file_path, [(offset, length)])
+
+    def add_many(self, orders: list, file_path: str, locations: list) -> None:
+        """
+        Records the locations of orders appended to a file together.
+
+        The entries are written to the index journal with a single append.
+
+        Parameters
+        ----------
+        orders : list
+            The order records that were appended.
+        file_path : str
+            The journal file the orders were appended to.
+        locations : list
+            The byte offset and length of each order's line, in the same order.
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        Database(self.index_path).append_many([
+            self._entry(order_data, file_path, offset, length)
+            for order_data, (offset, length) in zip(orders, locations)
+        ])
+
+    def locate(self, order_id: str) -> tuple | None:
+        """
+        Returns the file, offset and length of an order.
+
+        Parameters
+        ----------
+        order_id : str
+            The ID of the order.
+
+        Returns
+        -------
+        tuple | None
+            The file path, byte offset and length, or None if the order is not indexed.
+        """
+        return self._state()["by_id"].get(order_id)
+
+    def find(self, order_id: str) -> dict | None:
+        """
+        Reads an order by seeking straight to its record.
+
+        Parameters
+        ----------
+        order_id : str
+            The ID of the order.
+
+        Returns
+        -------
+        dict | None
+            The order record, or None if the order is not indexed.
+        """
+        location = self.locate(order_id)
+        if location is None:
+            return None
+        file_path, offset, length = location
+        return Database(file_path).read_at(offset, length)
+
+    def orders_on(self, day: date, file_path: str = None) -> list:
+        """
+        Reads the orders placed on a day by seeking straight to their records.
+
+        Parameters
+        ----------
+        day : date
+            The day to read.
+        file_path : str, optional
+            Only return orders stored in this file.
+
+        Returns
+        -------
+        list
+            The order records in the order they were indexed.
+        """
+        orders = []
+        for location_file, offset, length in self._state()["by_date"].get(day.isoformat(), []):
+            if file_path is None or location_file == file_path:
+                order_data = Database(location_file).read_at(offset, length)
+                if order_data is not None:
+                    orders.append(order_data)
+        return orders
+
+    def covers(self, file_path: str) -> bool:
+        """
+        Checks whether every record of a file is in the index.
+
+        Parameters
+        ----------
+        file_path : str
+            The journal file to check.
+
+        Returns
+        -------
+        bool
+            True if the file has not changed since it was last fully indexed.
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except FileNotFoundError:
+            return False
+        return self._state()["sizes"].get(file_path) == size
+
+    def rebuild(self, file_paths: list) -> int:
+        """
+        Rebuilds the index by scanning the given journal files.
+
+        Parameters
+        ----------
+        file_paths : list
+            The journal files holding the order history.
+
+        Returns
+        -------
+        int
+            The number of orders indexed.
+        """
+        entries = []
+        count = 0
+        for file_path in file_paths:
+            try:
+                file = open(file_path, 'rb')
+            except FileNotFoundError:
+                continue
+            with file:
+                offset = 0
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        order_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        order_data = None
+                    if order_data:
+                        entries.append(self._entry(order_data, file_path, offset, len(line)))
+                        count += 1
+                    offset += len(line)
+            entries.append({"file": file_path, "size": offset})
+
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        Database(self.index_path).write(entries)
+        return count
+
+    @staticmethod
+    def _entry(order_data: dict, file_path: str, offset: int, length: int) -> dict:
+        """
+        Creates an index entry for an order.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+        file_path : str
+            The journal file holding the order.
+        offset : int
+            The byte offset of the order's line.
+        length : int
+            The length of the order's line in bytes.
+
+        Returns
+        -------
+        dict
+            The index entry.
+        """
+        return {
+            "order_id": order_data["order_id"],
+            "date": order_data["date_time"][:10],
+            "file": file_path,
+            "offset": offset,
+            "length": length
+        }
+
+    def _state(self) -> dict:
+        """
+        Returns the in-memory index after reading any new index entries.
+
+        Returns
+        -------
+        dict
+            The by_id, by_date and sizes maps of the index.
+        """
+        with OrderIndex._lock:
+            state = OrderIndex._states.get(self.index_path)
+            try:
+                file = open(self.index_path, 'rb')
+            except FileNotFoundError:
+                OrderIndex._states.pop(self.index_path, None)
+                return {"by_id": {}, "by_date": {}, "sizes": {}}
+
+            with file:
+                inode = os.fstat(file.fileno()).st_ino
+                if state is None or state["inode"] != inode:
+                    state = {"inode": inode, "position": 0, "by_id": {}, "by_date": {}, "sizes": {}}
+                    OrderIndex._states[self.index_path] = state
+
+                file.seek(state["position"])
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    state["position"] += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "order_id" in entry:
+                        location = (entry["file"], entry["offset"], entry["length"])
+                        state["by_id"][entry["order_id"]] = location
+                        state["by_date"].setdefault(entry["date"], []).append(location)
+                    else:
+                        state["sizes"][entry["file"]] = entry["size"]
+            return state
@@ -11,9 +11,15 @@ class OrderItem:
         An instance of the MenuItem class representing the item in the menu.
     quantity : int
         The quantity of the menu item in the order.
+    price_cents : int
+        The unit price of the menu item in cents.
 
     Methods
     -------
+    to_cents(amount: float) -> int:
+        Converts a dollar amount to integer cents.
+    calculate_total_cents() -> int:
+        Calculates and returns the total price for the order item in cents.
     calculate_total_price() -> float:
         Calculates and returns the total price for the order item.
     """
@@ -31,6 +37,35 @@ class OrderItem:
         """
         self.menu_item = menu_item
         self.quantity = quantity
+        self.price_cents = OrderItem.to_cents(menu_item.price)
+
+    @staticmethod
+    def to_cents(amount: float) -> int:
+        """
+        Converts a dollar amount to integer cents.
+
+        Parameters
+        ----------
+        amount : float
+            The amount in dollars.
+
+        Returns
+        -------
+        int
+            The amount in cents.
+        """
+        return round(amount * 100)
+
+    def calculate_total_cents(self) -> int:
+        """
+        Calculates and returns the total price for the order item in cents.
+
+        Returns
+        -------
+        int
+            The total price for the order item in cents.
+        """
+        return self.price_cents * self.quantity
 
     def calculate_total_price(self) -> float:
         """
@@ -41,4 +76,4 @@ class OrderItem:
         float
             The total price for the order item.
         """
-        return round(self.menu_item.price * self.quantity, 2)
\ No newline at end of file
+        return self.calculate_total_cents() / 100
\ No newline at end of file
@@ -0,0 +1,317 @@
+from classes.Menu import Menu
+from classes.Order import Order
+from classes.OrderFactory import OrderFactory
+from classes.Payment import Payment
+from classes.Invoice import Invoice
+
+
+class OrderService:
+    """
+    A class to place orders without any terminal input or output.
+
+    The ordering screens are front-ends over the same Order, Payment and Invoice
+    objects, so orders placed through this class are validated and committed
+    exactly like orders entered at the terminal.
+
+    Attributes
+    ----------
+    menu : Menu
+        An instance of the Menu class representing the menu.
+
+    Methods
+    -------
+    create_order(order_type: str) -> Order:
+        Creates an empty order.
+    add_item(order: Order, item_id: int, quantity: int = 1) -> None:
+        Adds a menu item to an order.
+    remove_item(order: Order, item_id: int, quantity: int = None) -> None:
+        Removes some or all of a menu item from an order.
+    set_quantity(order: Order, item_id: int, quantity: int) -> None:
+        Sets the quantity of a menu item in an order.
+    create_payment(order: Order, **details: str) -> Payment:
+        Creates the payment of an order and stores any payment, contact, address or table details given.
+    set_contact(payment: Payment, name: str, mobile_number: str, email: str) -> None:
+        Stores the contact details of a takeaway or delivery order.
+    set_delivery_address(payment: Payment, address: str, suburb: str, postal_code: str) -> None:
+        Stores the delivery address of a delivery order.
+    set_table(payment: Payment, table_number: str) -> None:
+        Stores the table number of a dine-in order.
+    validate(payment: Payment) -> list:
+        Returns the problems that prevent an order from being paid.
+    checkout(payment: Payment, wait: bool = True) -> Invoice:
+        Pays for and commits an order.
+    place_order(order_type: str, items: dict, wait: bool = True, **details: str) -> Invoice:
+        Creates, pays for and commits an order in one call.
+    """
+
+    def __init__(self, menu: Menu = None):
+        """
+        Constructs all the necessary attributes for the OrderService object.
+
+        Parameters
+        ----------
+        menu : Menu, optional
+            An instance of the Menu class representing the menu (default is the loaded menu).
+        """
+        self.menu = menu or Menu()
+
+    def create_order(self, order_type: str) -> Order:
+        """
+        Creates an empty order.
+
+        Parameters
+        ----------
+        order_type : str
+            "Dine-In", "Takeaway" or "Delivery".
+
+        Returns
+        -------
+        Order
+            The new order.
+
+        Raises
+        ------
+        ValueError
+            If the order type is unknown.
+        """
+        if order_type not in OrderFactory.ORDER_TYPES:
+            raise ValueError(f"Unknown order type: {order_type}.")
+        return OrderFactory.create_order(OrderFactory.ORDER_TYPES[order_type], self.menu)
+
+    def add_item(self, order: Order, item_id: int, quantity: int = 1) -> None:
+        """
+        Adds a menu item to an order.
+
+        Parameters
+        ----------
+        order : Order
+            The order.
+        item_id : int
+            The menu item id.
+        quantity : int, optional
+            The quantity to add (default is 1).
+
+        Raises
+        ------
+        ValueError
+            If the item is not on the menu or the quantity is not positive.
+        """
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1.")
+        order.add_item(item_id, quantity)
+
+    def remove_item(self, order: Order, item_id: int, quantity: int = None) -> None:
+        """
+        Removes some or all of a menu item from an order.
+
+        Parameters
+        ----------
+        order : Order
+            The order.
+        item_id : int
+            The menu item id.
+        quantity : int, optional
+            The quantity to remove (default is all of it).
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the order or the quantity is invalid.
+        """
+        order.remove_item(item_id, quantity)
+
+    def set_quantity(self, order: Order, item_id: int, quantity: int) -> None:
+        """
+        Sets the quantity of a menu item in an order.
+
+        Parameters
+        ----------
+        order : Order
+            The order.
+        item_id : int
+            The menu item id.
+        quantity : int
+            The new quantity, or 0 to remove the item.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the order or the quantity is negative.
+        """
+        order.set_quantity(item_id, quantity)
+
+    def create_payment(self, order: Order, **details: str) -> Payment:
+        """
+        Creates the payment of an order and stores any payment, contact, address or table details given.
+
+        Parameters
+        ----------
+        order : Order
+            The order.
+        **details : str
+            Values for any of Payment.DETAILS, e.g. card_number="4111111111111111",
+            and an optional note.
+
+        Returns
+        -------
+        Payment
+            The payment.
+
+        Raises
+        ------
+        ValueError
+            If a detail is unknown or invalid.
+        """
+        payment = Payment(order)
+        payment.note = details.pop("note", "")
+        for field, value in details.items():
+            payment.set_detail(field, value)
+        return payment
+
+    def set_contact(self, payment: Payment, name: str, mobile_number: str, email: str) -> None:
+        """
+        Stores the contact details of a takeaway or delivery order.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment of the order.
+        name : str
+            The customer's name.
+        mobile_number : str
+            The customer's mobile number.
+        email : str
+            The customer's email address.
+
+        Raises
+        ------
+        ValueError
+            If a detail is invalid.
+        """
+        payment.set_detail("name", name)
+        payment.set_detail("mobile_number", mobile_number)
+        payment.set_detail("email", email)
+
+    def set_delivery_address(self, payment: Payment, address: str, suburb: str, postal_code: str) -> None:
+        """
+        Stores the delivery address of a delivery order.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment of the order.
+        address : str
+            The street address.
+        suburb : str
+            The suburb.
+        postal_code : str
+            The postal code.
+
+        Raises
+        ------
+        ValueError
+            If a detail is invalid.
+        """
+        payment.set_detail("address", address)
+        payment.set_detail("suburb", suburb)
+        payment.set_detail("postal_code", postal_code)
+
+    def set_table(self, payment: Payment, table_number: str) -> None:
+        """
+        Stores the table number of a dine-in order.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment of the order.
+        table_number : str
+            The table number.
+
+        Raises
+        ------
+        ValueError
+            If the table is not in the table layout.
+        """
+        payment.set_detail("table_number", table_number)
+
+    def validate(self, payment: Payment) -> list:
+        """
+        Returns the problems that prevent an order from being paid.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment of the order.
+
+        Returns
+        -------
+        list
+            Messages describing each problem, empty if the order can be paid.
+        """
+        problems = [] if payment.order.items else ["The order is empty."]
+        problems += [f"Missing {Payment.DETAILS[field][0]}." for field in payment.missing_details()]
+        return problems
+
+    def checkout(self, payment: Payment, wait: bool = True) -> Invoice:
+        """
+        Pays for and commits an order.
+
+        The invoice is sent to the KDS and recorded in the order history.
+
+        Parameters
+        ----------
+        payment : Payment
+            The payment of the order.
+        wait : bool, optional
+            Whether to wait in "fsync" mode until the order is committed (default
+            is True). Otherwise the caller confirms the invoice's commit_sequence
+            on Invoice.commit_queue.
+
+        Returns
+        -------
+        Invoice
+            The invoice of the order.
+
+        Raises
+        ------
+        ValueError
+            If the order cannot be paid, listing every problem.
+        TimeoutError
+            If the order could not be committed in time. It stays queued and is
+            committed once storage is available.
+        """
+        problems = self.validate(payment)
+        if problems:
+            raise ValueError(" ".join(problems))
+        return Invoice(payment, wait)
+
+    def place_order(self, order_type: str, items: dict, wait: bool = True, **details: str) -> Invoice:
+        """
+        Creates, pays for and commits an order in one call.
+
+        Parameters
+        ----------
+        order_type : str
+            "Dine-In", "Takeaway" or "Delivery".
+        items : dict
+            The quantity of each menu item id.
+        wait : bool, optional
+            Whether to wait in "fsync" mode until the order is committed (default
+            is True), as for checkout.
+        **details : str
+            The payment, contact, address or table details and note, as for create_payment.
+
+        Returns
+        -------
+        Invoice
+            The invoice of the order.
+
+        Raises
+        ------
+        ValueError
+            If the order type, an item or a detail is invalid, or a detail is missing.
+        """
+        order = self.create_order(order_type)
+        for item_id, quantity in items.items():
+            self.add_item(order, item_id, quantity)
+        return self.checkout(self.create_payment(order, **details), wait)
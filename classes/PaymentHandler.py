@@ -1,5 +1,8 @@
 from classes.Payment import Payment
+from classes.ApiClient import ApiClient
+from classes.Config import Config
 from classes.Invoice import Invoice
+from classes.OrderService import OrderService
 from classes.ReceiptHandler import ReceiptHandler
 from classes.Order import Order
 
@@ -19,6 +22,10 @@ class PaymentHandler:
         """
         Processes the payment for the given order.
 
+        The details are entered at the terminal and the order is committed
+        through the OrderService, or placed on the API server when
+        Config.SERVER_URL is set.
+
         Parameters
         ----------
         order : Order
@@ -27,7 +34,19 @@ class PaymentHandler:
         payment = Payment(order)
         if payment.enter_payment_details():
             if payment.finalize_payment():
-                invoice = Invoice(payment)
+                try:
+                    if Config.SERVER_URL:
+                        invoice = Invoice.from_order_data(ApiClient().checkout(payment))
+                    else:
+                        invoice = OrderService(order.menu).checkout(payment)
+                except TimeoutError as error:
+                    print(f"[SYSTEM] Your order has been taken but is delayed. {error}")
+                    input("\nPress ENTER to continue")
+                    return
+                except (ValueError, ConnectionError) as error:
+                    print(f"Payment Failed. {error}")
+                    input("\nPress ENTER to continue")
+                    return
                 ReceiptHandler.handle_receipt(invoice)
             else:
                 print("Payment Cancelled.")
@@ -4,29 +4,46 @@ class PinValidator:
 
     Methods
     -------
-    check_pin(correct_pin: str) -> bool:
-        Checks if the entered PIN matches the correct PIN.
+    check_pin() -> str:
+        Prompts for the PIN and returns it if it is correct.
+    is_valid(pin: str) -> bool:
+        Checks if a PIN matches the staff PIN.
     """
 
+    PIN_CODE = "1234"
+
     @staticmethod
-    def check_pin() -> bool:
+    def check_pin() -> str:
         """
-        Checks if the entered PIN matches the correct PIN.
+        Prompts for the PIN and returns it if it is correct.
 
-        Parameters
-        ----------
-        correct_pin : str
-            The correct PIN to be validated against.
+        The PIN is returned so staff screens can pass it on to the API server.
 
         Returns
         -------
-        bool
-            True if the entered PIN is correct, False otherwise.
+        str
+            The entered PIN if it is correct, otherwise an empty string.
         """
-        PIN_CODE = "1234"
         user_input = input("PIN: ")
-        if user_input == PIN_CODE:
-            return True
+        if PinValidator.is_valid(user_input):
+            return user_input
         else:
             print("Invalid PIN.")
-            return False
+            return ""
+
+    @staticmethod
+    def is_valid(pin: str) -> bool:
+        """
+        Checks if a PIN matches the staff PIN.
+
+        Parameters
+        ----------
+        pin : str
+            The PIN to check.
+
+        Returns
+        -------
+        bool
+            True if the PIN is correct, False otherwise.
+        """
+        return pin == PinValidator.PIN_CODE
@@ -1,5 +1,8 @@
 from classes.SystemUtils import SystemUtils
+from classes.ApiClient import ApiClient
+from classes.Config import Config
 from classes.Invoice import Invoice
+from classes.OrderHistory import OrderHistory
 
 
 class ReceiptHandler:
@@ -10,6 +13,8 @@ class ReceiptHandler:
     -------
     handle_receipt(invoice: Invoice) -> None:
         Prompts the user to print the receipt and displays it if requested.
+    handle_reprint(pin: str = "") -> None:
+        Prompts for an order ID and reprints the receipt of that order.
     """
 
     @staticmethod
@@ -27,6 +32,40 @@ class ReceiptHandler:
             if user_input == 'y':
                 SystemUtils.clear_screen()
                 invoice.display_invoice()
+                input("\nPress ENTER to continue")
                 return
             elif user_input == 'n':
-                break
\ No newline at end of file
+                break
+
+    @staticmethod
+    def handle_reprint(pin: str = "") -> None:
+        """
+        Prompts for an order ID and reprints the receipt of that order.
+
+        The order is found through the order_id index, so the lookup does not
+        depend on the size of the order history. When Config.SERVER_URL is set,
+        the order is looked up on the API server.
+
+        Parameters
+        ----------
+        pin : str, optional
+            The staff PIN, required by the API server's order lookup.
+        """
+        order_id = input("Order ID or [E] Exit: ").strip()
+        if order_id.lower() == 'e':
+            return
+
+        try:
+            order_data = ApiClient().find_order(order_id, pin) if Config.SERVER_URL else OrderHistory().find(order_id)
+        except (ValueError, ConnectionError, PermissionError) as error:
+            print(f"[ERROR] {error}")
+            input("\nPress ENTER to continue")
+            return
+        if order_data is None:
+            print(f"No order found with ID {order_id}.")
+            input("\nPress ENTER to continue")
+            return
+
+        SystemUtils.clear_screen()
+        Invoice.from_order_data(order_data).display_invoice()
+        input("\nPress ENTER to continue")
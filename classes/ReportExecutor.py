@@ -0,0 +1,139 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from classes.Config import Config
+from classes.OrderHistory import OrderHistory
+
+
+class ReportExecutor:
+    """
+    A class to build report aggregates over the order history in parallel.
+
+    The day shards of the requested range are split into partitions, each
+    partition is aggregated in a separate process and the partial aggregates are
+    merged in the parent. Any aggregate class with an ``add(order_data)`` and a
+    ``merge(other)`` method can be used, such as SalesSummary or DemandHeatmap.
+    Small ranges, a single worker and the "sqlite" backend run serially, and
+    both modes produce identical totals. Workers are started with "spawn" rather
+    than forked, so they do not inherit the parent's threads and locks, such as
+    those of the commit queue writer or the API server.
+
+    Attributes
+    ----------
+    workers : int
+        The number of worker processes.
+    order_history : OrderHistory
+        The order history to aggregate.
+
+    Methods
+    -------
+    run(aggregate_class: type, start_date: date, end_date: date) -> object:
+        Aggregates the orders placed between two dates, inclusive.
+    """
+
+    MIN_DAYS_PER_PARTITION = 7
+
+    def __init__(self, workers: int = None, order_history: OrderHistory = None):
+        """
+        Constructs all the necessary attributes for the ReportExecutor object.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes, where 0 uses every CPU
+            (default is Config.REPORT_WORKERS).
+        order_history : OrderHistory, optional
+            The order history to aggregate (default is a new OrderHistory).
+        """
+        workers = Config.REPORT_WORKERS if workers is None else workers
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.order_history = order_history or OrderHistory()
+
+    def run(self, aggregate_class: type, start_date: date, end_date: date) -> object:
+        """
+        Aggregates the orders placed between two dates, inclusive.
+
+        Parameters
+        ----------
+        aggregate_class : type
+            The aggregate to build, e.g. SalesSummary.
+        start_date : date
+            The first day to include.
+        end_date : date
+            The last day to include.
+
+        Returns
+        -------
+        object
+            The merged aggregate.
+        """
+        if self.order_history.backend != "json":
+            aggregate = aggregate_class()
+            for order_data in self.order_history.iter_orders(start_date, end_date):
+                aggregate.add(order_data)
+            return aggregate
+
+        aggregate = aggregate_class()
+        for order_data in self.order_history.iter_legacy(start_date, end_date):
+            aggregate.add(order_data)
+
+        days = self.order_history.days_in_range(start_date, end_date)
+        partitions = self._partition(days)
+        if len(partitions) < 2:
+            return aggregate.merge(ReportExecutor._aggregate_days(aggregate_class, days))
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(partitions)), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            for partial in executor.map(
+                ReportExecutor._aggregate_days, [aggregate_class] * len(partitions), partitions
+            ):
+                aggregate.merge(partial)
+        return aggregate
+
+    def _partition(self, days: list) -> list:
+        """
+        Splits the days into contiguous partitions for the worker processes.
+
+        Parameters
+        ----------
+        days : list
+            The sorted days with a shard.
+
+        Returns
+        -------
+        list
+            The partitions, at most a few per worker and never smaller than
+            MIN_DAYS_PER_PARTITION days. A single partition means serial execution.
+        """
+        if self.workers < 2 or len(days) < 2 * ReportExecutor.MIN_DAYS_PER_PARTITION:
+            return [days]
+
+        count = min(self.workers * 4, len(days) // ReportExecutor.MIN_DAYS_PER_PARTITION)
+        size = -(-len(days) // count)
+        return [days[i:i + size] for i in range(0, len(days), size)]
+
+    @staticmethod
+    def _aggregate_days(aggregate_class: type, days: list) -> object:
+        """
+        Aggregates the shards of the given days. Runs inside a worker process.
+
+        Parameters
+        ----------
+        aggregate_class : type
+            The aggregate to build.
+        days : list
+            The days whose shards are read.
+
+        Returns
+        -------
+        object
+            The partial aggregate.
+        """
+        order_history = OrderHistory("json")
+        aggregate = aggregate_class()
+        for day in days:
+            for order_data in order_history.iter_shard(day):
+                aggregate.add(order_data)
+        return aggregate
@@ -0,0 +1,453 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Callable
+from classes.Config import Config
+from classes.CustomerIndex import CustomerIndex
+from classes.Database import Database
+from classes.SQLiteDatabase import SQLiteDatabase
+
+
+class ReservationBook:
+    """
+    A class to store reservations in date and time order.
+
+    The hot reservations file only holds current and future bookings. New
+    bookings are appended to it, and the file is sorted by each reservation's
+    "starts_at" key ("YYYY-MM-DD HH:MM") when it is read, so the bookings after a
+    moment or on a given day are found with a binary search followed by a slice.
+    The sorted reservations and keys are kept per file and reused for as long as
+    the Database read cache returns the same data; when a new version of the
+    file only adds bookings, they are inserted into the sorted index with a
+    binary search instead of sorting the whole file again. Changes to existing
+    bookings rewrite the file in sorted order.
+    Past bookings are moved to an archive journal by archive(), which runs
+    automatically on the first booking of each day, so the hot file does not
+    grow with the restaurant's history. Ranges reaching into the past are read
+    from the archive as well. With the "sqlite" storage backend the
+    reservations table is queried through its date and time index instead.
+
+    Attributes
+    ----------
+    backend : str
+        The storage backend used ("json" or "sqlite").
+
+    Methods
+    -------
+    starts_at(reservation: dict) -> str:
+        Returns the sortable start key of a reservation.
+    add(reservation: dict, engine=None) -> None:
+        Appends a reservation to the hot file if its slot still has capacity.
+    between(start: datetime = None, end: datetime = None) -> list:
+        Returns the reservations starting in a range.
+    upcoming(after: datetime = None) -> list:
+        Returns the reservations starting at or after a moment.
+    on_date(day: date) -> list:
+        Returns the reservations on a given day.
+    update_day(day: date, function: Callable[[list], list]) -> list:
+        Replaces the reservations on a day with the result of a function.
+    cancel(reservation: dict) -> bool:
+        Removes a reservation from the book.
+    archive(before: datetime = None) -> int:
+        Moves the reservations starting before a moment into the archive.
+    """
+
+    HOT_PATH = "./reservations.jsonl"
+    ARCHIVE_PATH = "./reservations_archive.jsonl"
+    KEY_FORMAT = "%Y-%m-%d %H:%M"
+
+    _indexes = {}
+    _archived_on = {}
+
+    def __init__(self, backend: str = None):
+        """
+        Constructs all the necessary attributes for the ReservationBook object.
+
+        Parameters
+        ----------
+        backend : str, optional
+            The storage backend to use (default is Config.STORAGE_BACKEND).
+        """
+        self.backend = backend or Config.STORAGE_BACKEND
+
+    @staticmethod
+    def starts_at(reservation: dict) -> str:
+        """
+        Returns the sortable start key of a reservation.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation record.
+
+        Returns
+        -------
+        str
+            The stored "starts_at" key, or one derived from the "date" (DD/MM/YYYY)
+            and "time" (HH:MM) fields for records written before it existed.
+        """
+        key = reservation.get("starts_at")
+        if key:
+            return key
+        return datetime.strptime(
+            f"{reservation['date']} {reservation['time']}", "%d/%m/%Y %H:%M"
+        ).strftime(ReservationBook.KEY_FORMAT)
+
+    def add(self, reservation: dict, engine=None) -> None:
+        """
+        Appends a reservation to the hot file if its slot still has capacity.
+
+        The capacity is checked by seating the day's reservations at the tables
+        of the layout. They are read under the file's exclusive lock (a write
+        transaction with the "sqlite" backend), so bookings made at the same time
+        by other threads or processes cannot overbook the slot. The reservation
+        is also recorded in the CustomerIndex.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation record. A "starts_at" key is added to it.
+        engine : AvailabilityEngine, optional
+            The engine the capacity is checked with (default is an engine over
+            this book).
+
+        Raises
+        ------
+        ValueError
+            If the slot has been fully booked in the meantime.
+        """
+        reservation["starts_at"] = self.starts_at(reservation)
+        day = datetime.strptime(reservation["starts_at"], ReservationBook.KEY_FORMAT).date()
+        start_key, end_key = self._day_keys(day)
+
+        def check(reservations: list) -> list:
+            self._check_capacity(reservation, reservations, engine)
+            return [reservation]
+
+        if self.backend == "sqlite":
+            self._sqlite(ReservationBook.HOT_PATH).append_reservations_with(start_key, end_key, check)
+        else:
+            def check_day(data: tuple) -> list:
+                ordered, keys = self._index(data)
+                return check(ordered[bisect_left(keys, start_key):bisect_left(keys, end_key)])
+
+            Database(ReservationBook.HOT_PATH).append_with(check_day)
+            self._archive_daily()
+        CustomerIndex().add_reservation(reservation)
+
+    def between(self, start: datetime = None, end: datetime = None) -> list:
+        """
+        Returns the reservations starting in a range.
+
+        Parameters
+        ----------
+        start : datetime, optional
+            The inclusive lower bound (default is the first reservation).
+        end : datetime, optional
+            The exclusive upper bound (default is the last reservation).
+
+        Returns
+        -------
+        list
+            The reservations in date and time order. They are read-only when they
+            come from the cache.
+        """
+        start_key = start.strftime(ReservationBook.KEY_FORMAT) if start else None
+        end_key = end.strftime(ReservationBook.KEY_FORMAT) if end else None
+        if self.backend == "sqlite":
+            return list(self._sqlite(ReservationBook.HOT_PATH).iter_reservations(start_key, end_key))
+
+        slices = []
+        for file_path in (ReservationBook.ARCHIVE_PATH, ReservationBook.HOT_PATH):
+            data, keys = self._index(file_path=file_path)
+            low = 0 if start_key is None else bisect_left(keys, start_key)
+            high = len(keys) if end_key is None else bisect_left(keys, end_key)
+            slices.append(data[low:high])
+        if not slices[0]:
+            return list(slices[1])
+        return list(heapq.merge(*slices, key=self.starts_at))
+
+    def upcoming(self, after: datetime = None) -> list:
+        """
+        Returns the reservations starting at or after a moment.
+
+        Parameters
+        ----------
+        after : datetime, optional
+            The earliest start to include (default is now).
+
+        Returns
+        -------
+        list
+            The reservations in date and time order.
+        """
+        return self.between(after or datetime.now())
+
+    def on_date(self, day: date) -> list:
+        """
+        Returns the reservations on a given day.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservations.
+
+        Returns
+        -------
+        list
+            The reservations in time order.
+        """
+        start = datetime.combine(day, datetime.min.time())
+        return self.between(start, start + timedelta(days=1))
+
+    def update_day(self, day: date, function: Callable[[list], list]) -> list:
+        """
+        Replaces the reservations on a day with the result of a function.
+
+        Only the day's slice of the sorted hot file is passed to the function,
+        and the whole change is applied under the file's exclusive lock.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservations.
+        function : Callable[[list], list]
+            A function that receives the day's reservations as modifiable dicts
+            and returns the reservations to store for that day.
+
+        Returns
+        -------
+        list
+            The reservations stored for the day, in date and time order.
+        """
+        start_key, end_key = self._day_keys(day)
+        if self.backend == "sqlite":
+            database = self._sqlite(ReservationBook.HOT_PATH)
+            return database.replace_reservations(start_key, end_key, function)
+
+        updated = []
+
+        def replace(data: list) -> list:
+            data = self._sorted(data or [])
+            keys = [self.starts_at(item) for item in data]
+            low, high = bisect_left(keys, start_key), bisect_left(keys, end_key)
+            for reservation in function(data[low:high]):
+                reservation["starts_at"] = self.starts_at(reservation)
+                updated.append(reservation)
+            updated.sort(key=lambda item: item["starts_at"])
+            return data[:low] + updated + data[high:]
+
+        Database(ReservationBook.HOT_PATH).update(replace, [])
+        return updated
+
+    def cancel(self, reservation: dict) -> bool:
+        """
+        Removes a reservation from the book.
+
+        Reservations are matched on their reservation_id, or on their start,
+        name and mobile number if they were made before ids were introduced.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation to remove.
+
+        Returns
+        -------
+        bool
+            True if the reservation was found and removed, False otherwise.
+        """
+        def identity(item: dict) -> tuple:
+            if item.get("reservation_id"):
+                return (item["reservation_id"],)
+            return self.starts_at(item), item["name"], item["mobile_number"]
+
+        target = identity(reservation)
+        removed = []
+
+        def remove(reservations: list) -> list:
+            kept = [item for item in reservations if identity(item) != target]
+            removed.append(len(reservations) - len(kept))
+            return kept
+
+        day = datetime.strptime(self.starts_at(reservation), ReservationBook.KEY_FORMAT).date()
+        self.update_day(day, remove)
+        return sum(removed) > 0
+
+    def archive(self, before: datetime = None) -> int:
+        """
+        Moves the reservations starting before a moment into the archive.
+
+        The archive is written before the hot file is rewritten, so a crash in
+        between can only leave a reservation in both files, never in neither.
+
+        Parameters
+        ----------
+        before : datetime, optional
+            The moment before which reservations are archived (default is now).
+
+        Returns
+        -------
+        int
+            The number of reservations archived.
+        """
+        before_key = (before or datetime.now()).strftime(ReservationBook.KEY_FORMAT)
+        if self.backend == "sqlite":
+            past = self._sqlite(ReservationBook.HOT_PATH).remove_reservations_before(before_key)
+            self._sqlite(ReservationBook.ARCHIVE_PATH).append_many(past)
+            return len(past)
+
+        archived = []
+
+        def split(data: list) -> list:
+            data = self._sorted(data or [])
+            keys = [self.starts_at(item) for item in data]
+            cut = bisect_left(keys, before_key)
+            if cut:
+                Database(ReservationBook.ARCHIVE_PATH).append_many(data[:cut])
+            archived.extend(data[:cut])
+            return data[cut:]
+
+        Database(ReservationBook.HOT_PATH).update(split, [])
+        return len(archived)
+
+    def _archive_daily(self) -> None:
+        """
+        Archives the bookings of previous days on the first booking of each day.
+
+        The hot file is only rewritten if it holds a booking from before today.
+        """
+        today = date.today()
+        if ReservationBook._archived_on.get(ReservationBook.HOT_PATH) == today:
+            return
+        ReservationBook._archived_on[ReservationBook.HOT_PATH] = today
+        midnight = datetime.combine(today, datetime.min.time())
+        _, keys = self._index()
+        if keys and keys[0] < midnight.strftime(ReservationBook.KEY_FORMAT):
+            self.archive(midnight)
+
+    def _index(self, data: tuple = None, file_path: str = None) -> tuple:
+        """
+        Returns the reservations of a file and their sorted start keys.
+
+        A version of the file that only appends bookings to the version indexed
+        before is indexed by inserting the new bookings with a binary search.
+
+        Parameters
+        ----------
+        data : tuple, optional
+            The read-only contents of the file, e.g. as read under its exclusive
+            lock (default is read from the file).
+        file_path : str, optional
+            The file to index (default is ReservationBook.HOT_PATH).
+
+        Returns
+        -------
+        tuple
+            The read-only reservations in date and time order and the list of
+            their "starts_at" keys.
+        """
+        file_path = file_path or ReservationBook.HOT_PATH
+        if data is None:
+            data = Database(file_path).read()
+        index = ReservationBook._indexes.get(file_path)
+        if index is not None and index[0] is data:
+            return index[1], index[2]
+
+        if index is not None and 0 < len(index[0]) <= len(data) and data[:len(index[0])] == index[0]:
+            ordered, keys = list(index[1]), list(index[2])
+            for item in data[len(index[0]):]:
+                key = self.starts_at(item)
+                position = bisect_right(keys, key)
+                keys.insert(position, key)
+                ordered.insert(position, item)
+            ordered = tuple(ordered)
+        else:
+            ordered = tuple(self._sorted(list(data)))
+            keys = [self.starts_at(item) for item in ordered]
+        ReservationBook._indexes[file_path] = (data, ordered, keys)
+        return ordered, keys
+
+    @staticmethod
+    def _day_keys(day: date) -> tuple:
+        """
+        Returns the start keys bounding a day.
+
+        Parameters
+        ----------
+        day : date
+            The day.
+
+        Returns
+        -------
+        tuple
+            The inclusive key of the day's midnight and the exclusive key of the
+            next day's midnight.
+        """
+        start = datetime.combine(day, datetime.min.time())
+        return start.strftime(ReservationBook.KEY_FORMAT), (start + timedelta(days=1)).strftime(ReservationBook.KEY_FORMAT)
+
+    def _check_capacity(self, reservation: dict, reservations: list, engine=None) -> None:
+        """
+        Checks that a reservation still fits next to the other bookings of its day.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation to be stored, with its "starts_at" key.
+        reservations : list
+            The reservations already stored on its day.
+        engine : AvailabilityEngine, optional
+            The engine the capacity is checked with (default is an engine over
+            this book).
+
+        Raises
+        ------
+        ValueError
+            If the slot is fully booked.
+        """
+        from classes.AvailabilityEngine import AvailabilityEngine
+
+        engine = engine or AvailabilityEngine(self)
+        starts_at = datetime.strptime(reservation["starts_at"], ReservationBook.KEY_FORMAT)
+        if not engine.is_available(starts_at.date(), reservation["starts_at"][11:], reservation["party_size"], reservations):
+            raise ValueError(
+                f"{starts_at.strftime('%d/%m/%Y at %H:%M')} has just been fully booked for "
+                f"{reservation['party_size']}. Please choose another time."
+            )
+
+    def _sorted(self, data: list) -> list:
+        """
+        Sorts reservations by their start key unless they are already sorted.
+
+        Parameters
+        ----------
+        data : list
+            The reservations, e.g. from a file written before it was kept sorted.
+
+        Returns
+        -------
+        list
+            The reservations in date and time order.
+        """
+        keys = [self.starts_at(item) for item in data]
+        if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+            return data
+        return [item for _, item in sorted(zip(keys, data), key=lambda pair: pair[0])]
+
+    @staticmethod
+    def _sqlite(file_path: str) -> SQLiteDatabase:
+        """
+        Returns the SQLite database holding a reservations collection.
+
+        Parameters
+        ----------
+        file_path : str
+            The data file of the collection.
+
+        Returns
+        -------
+        SQLiteDatabase
+            The database for the collection.
+        """
+        return SQLiteDatabase(file_path, Config.SQLITE_PATH)
@@ -0,0 +1,125 @@
+import threading
+from datetime import date
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.Reservation import Reservation
+
+
+class ReservationService:
+    """
+    A class to make reservations without any terminal input or output.
+
+    Reservations are validated and stored through the same Reservation object
+    the reservation screen uses. The availability check and the booking are made
+    under one lock, so a full slot is reported with suggestions before anything
+    is written. ReservationBook.add() checks the capacity again under the
+    reservations file's lock, so bookings from other processes cannot overbook
+    a slot either.
+
+    Methods
+    -------
+    reserve(details: dict) -> dict:
+        Validates a reservation, checks availability and stores it.
+    join_waitlist(details: dict) -> dict:
+        Validates a reservation request and adds the party to the waitlist.
+    free_slots(day: date, party_size: int) -> list:
+        Returns the start times at which a party can still be seated.
+    """
+
+    _lock = threading.Lock()
+
+    def reserve(self, details: dict) -> dict:
+        """
+        Validates a reservation, checks availability and stores it.
+
+        Parameters
+        ----------
+        details : dict
+            The date (DD/MM/YYYY), time (HH:MM), name, mobile_number, email,
+            party_size and optional accommodations of the reservation.
+
+        Returns
+        -------
+        dict
+            The stored reservation.
+
+        Raises
+        ------
+        ValueError
+            If a detail is missing or invalid, or the slot is fully booked, with
+            a message suggesting other times.
+        """
+        reservation = self._reservation(details)
+        with ReservationService._lock:
+            message = reservation.check_availability()
+            if message:
+                raise ValueError(message)
+            return reservation.make_reservation()
+
+    def join_waitlist(self, details: dict) -> dict:
+        """
+        Validates a reservation request and adds the party to the waitlist.
+
+        Parameters
+        ----------
+        details : dict
+            The reservation details, as for reserve.
+
+        Returns
+        -------
+        dict
+            The waitlist entry.
+
+        Raises
+        ------
+        ValueError
+            If a detail is missing or invalid.
+        """
+        reservation = self._reservation(details)
+        reservation.full_time = reservation.time
+        reservation.join_waitlist()
+        return reservation.make_reservation()
+
+    def free_slots(self, day: date, party_size: int) -> list:
+        """
+        Returns the start times at which a party can still be seated.
+
+        Parameters
+        ----------
+        day : date
+            The day.
+        party_size : int
+            The number of guests.
+
+        Returns
+        -------
+        list
+            The free start times as HH:MM strings.
+        """
+        return AvailabilityEngine().free_slots(day, party_size)
+
+    def _reservation(self, details: dict) -> Reservation:
+        """
+        Creates a Reservation from a dict of details.
+
+        Parameters
+        ----------
+        details : dict
+            The reservation details.
+
+        Returns
+        -------
+        Reservation
+            The validated reservation.
+
+        Raises
+        ------
+        ValueError
+            If a detail is missing or invalid.
+        """
+        reservation = Reservation()
+        for field, label in Reservation.FIELDS:
+            if field not in details:
+                raise ValueError(f"Missing {label}.")
+            reservation.set_detail(field, str(details[field]))
+        reservation.set_detail("accommodations", details.get("accommodations", ""))
+        return reservation
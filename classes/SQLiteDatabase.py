@@ -0,0 +1,515 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator
+from classes.Database import Database
+
+
+class SQLiteDatabase:
+    """
+    A class to handle database operations using an SQLite database.
+
+    It implements the same read, write and append operations as the Database class.
+    The collection is selected from the name of the data file, so
+    "./order_history.jsonl" maps to the orders and order_items tables and
+    "./reservations.jsonl" maps to the reservations table. Any other collection,
+    such as the menu, is stored in the generic documents table.
+
+    Attributes
+    ----------
+    file_path : str
+        The path of the data file this database replaces.
+    db_path : str
+        The path to the SQLite database file.
+    collection : str
+        The name of the collection derived from the data file name.
+
+    Methods
+    -------
+    read() -> list:
+        Reads and returns all records of the collection.
+    iter_records() -> Iterator[dict]:
+        Streams the records of the collection one at a time.
+    iter_between(start: str = None, end: str = None) -> Iterator[dict]:
+        Streams the orders whose date_time falls within a range.
+    iter_rows_after(start: str, end: str, rowid: int) -> Iterator[tuple]:
+        Streams the orders within a range stored after a rowid, with their rowids.
+    order_stats(start: str, end: str) -> tuple:
+        Returns the number of orders within a range and their highest rowid.
+    get_order(order_id: str) -> dict | None:
+        Returns a single order by its ID.
+    iter_reservations(start: str = None, end: str = None) -> Iterator[dict]:
+        Streams the reservations starting within a range, in date and time order.
+    remove_reservations_before(end: str) -> list:
+        Deletes and returns the reservations starting before a moment.
+    replace_reservations(start: str, end: str, function: Callable[[list], list]) -> list:
+        Replaces the reservations starting within a range with the result of a function.
+    append_reservations_with(start: str, end: str, function: Callable[[list], list]) -> list:
+        Appends the reservations a function returns for the reservations within a range.
+    write(data: list) -> None:
+        Replaces all records of the collection with the given data.
+    append(item: dict) -> None:
+        Appends a record to the collection.
+    append_many(items: list) -> None:
+        Appends several records to the collection in a single transaction.
+    import_json(file_path: str, db_path: str) -> int:
+        Imports the records of a JSON or JSON Lines file into the database.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS orders (
+            order_id TEXT PRIMARY KEY,
+            date_time TEXT NOT NULL,
+            order_type TEXT NOT NULL,
+            subtotal REAL NOT NULL,
+            delivery_fee REAL NOT NULL,
+            order_total REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_orders_date_time ON orders (date_time);
+
+        CREATE TABLE IF NOT EXISTS order_items (
+            order_id TEXT NOT NULL REFERENCES orders (order_id),
+            item_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            price REAL NOT NULL,
+            total_price REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items (order_id);
+
+        CREATE TABLE IF NOT EXISTS reservations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            reservation_date TEXT NOT NULL,
+            reservation_time TEXT NOT NULL,
+            name TEXT NOT NULL,
+            mobile_number TEXT NOT NULL,
+            email TEXT NOT NULL,
+            party_size INTEGER NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_reservations_date ON reservations (reservation_date, reservation_time);
+
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            collection TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_documents_collection ON documents (collection);
+    """
+
+    _initialized = set()
+
+    def __init__(self, file_path: str, db_path: str):
+        """
+        Constructs all the necessary attributes for the SQLiteDatabase object.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the data file this database replaces.
+        db_path : str
+            The path to the SQLite database file.
+        """
+        self.file_path = file_path
+        self.db_path = db_path
+        self.collection = os.path.splitext(os.path.basename(file_path))[0]
+
+    def read(self) -> list:
+        """
+        Reads and returns all records of the collection.
+
+        Returns
+        -------
+        list
+            The records in the order they were added.
+        """
+        return list(self.iter_records())
+
+    def iter_records(self) -> Iterator[dict]:
+        """
+        Streams the records of the collection one at a time.
+
+        Yields
+        ------
+        dict
+            The next record in the order they were added.
+        """
+        with self._connect() as conn:
+            if self.collection == "order_history":
+                cursor = conn.execute("SELECT data FROM orders ORDER BY rowid")
+            elif self.collection == "reservations":
+                cursor = conn.execute("SELECT data FROM reservations ORDER BY id")
+            else:
+                cursor = conn.execute(
+                    "SELECT data FROM documents WHERE collection = ? ORDER BY id", (self.collection,)
+                )
+            for (data,) in cursor:
+                yield json.loads(data)
+
+    def iter_between(self, start: str = None, end: str = None) -> Iterator[dict]:
+        """
+        Streams the orders whose date_time falls within a range.
+
+        The query uses the date_time index, so only the matching rows are read.
+
+        Parameters
+        ----------
+        start : str, optional
+            The inclusive lower bound, e.g. "2024-05-31".
+        end : str, optional
+            The exclusive upper bound, e.g. "2024-06-01".
+
+        Yields
+        ------
+        dict
+            The next order in date_time order.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT data FROM orders WHERE date_time >= ? AND date_time < ? ORDER BY date_time",
+                (start or "", end or "\uffff")
+            )
+            for (data,) in cursor:
+                yield json.loads(data)
+
+    def iter_rows_after(self, start: str, end: str, rowid: int) -> Iterator[tuple]:
+        """
+        Streams the orders within a range stored after a rowid, with their rowids.
+
+        Parameters
+        ----------
+        start : str
+            The inclusive lower bound of date_time, e.g. "2024-05-31".
+        end : str
+            The exclusive upper bound of date_time, e.g. "2024-06-01".
+        rowid : int
+            Only orders with a higher rowid are returned.
+
+        Yields
+        ------
+        tuple
+            The rowid and the order, in rowid order.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT rowid, data FROM orders WHERE date_time >= ? AND date_time < ? AND rowid > ? ORDER BY rowid",
+                (start, end, rowid)
+            )
+            for row_id, data in cursor:
+                yield row_id, json.loads(data)
+
+    def order_stats(self, start: str, end: str) -> tuple:
+        """
+        Returns the number of orders within a range and their highest rowid.
+
+        Only the date_time index is read.
+
+        Parameters
+        ----------
+        start : str
+            The inclusive lower bound of date_time, e.g. "2024-05-31".
+        end : str
+            The exclusive upper bound of date_time, e.g. "2024-06-01".
+
+        Returns
+        -------
+        tuple
+            The number of orders and the highest rowid, or (0, 0) if there are none.
+        """
+        with self._connect() as conn:
+            count, rowid = conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM orders WHERE date_time >= ? AND date_time < ?",
+                (start, end)
+            ).fetchone()
+        return count, rowid
+
+    def get_order(self, order_id: str) -> dict | None:
+        """
+        Returns a single order by its ID.
+
+        Parameters
+        ----------
+        order_id : str
+            The ID of the order.
+
+        Returns
+        -------
+        dict | None
+            The order record, or None if no order has that ID.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT data FROM orders WHERE order_id = ?", (order_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_reservations(self, start: str = None, end: str = None) -> Iterator[dict]:
+        """
+        Streams the reservations starting within a range, in date and time order.
+
+        The query uses the reservation date and time index, so only the matching
+        rows are read.
+
+        Parameters
+        ----------
+        start : str, optional
+            The inclusive lower bound, e.g. "2024-05-31 18:00".
+        end : str, optional
+            The exclusive upper bound, e.g. "2024-06-01 00:00".
+
+        Yields
+        ------
+        dict
+            The next reservation.
+        """
+        start_date, start_time = (start or "0000-00-00 00:00").split(" ")
+        end_date, end_time = (end or "9999-99-99 99:99").split(" ")
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT data FROM reservations "
+                "WHERE (reservation_date, reservation_time) >= (?, ?) "
+                "AND (reservation_date, reservation_time) < (?, ?) "
+                "ORDER BY reservation_date, reservation_time, id",
+                (start_date, start_time, end_date, end_time)
+            )
+            for (data,) in cursor:
+                yield json.loads(data)
+
+    def remove_reservations_before(self, end: str) -> list:
+        """
+        Deletes and returns the reservations starting before a moment.
+
+        Parameters
+        ----------
+        end : str
+            The exclusive upper bound, e.g. "2024-06-01 00:00".
+
+        Returns
+        -------
+        list
+            The deleted reservations in date and time order.
+        """
+        end_date, end_time = end.split(" ")
+        condition = "(reservation_date, reservation_time) < (?, ?)"
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT data FROM reservations WHERE {condition} "
+                "ORDER BY reservation_date, reservation_time, id",
+                (end_date, end_time)
+            ).fetchall()
+            conn.execute(f"DELETE FROM reservations WHERE {condition}", (end_date, end_time))
+        return [json.loads(data) for (data,) in rows]
+
+    def replace_reservations(self, start: str, end: str, function: Callable[[list], list]) -> list:
+        """
+        Replaces the reservations starting within a range with the result of a function.
+
+        The reservations are read, replaced and written back in one transaction,
+        which takes the database's write lock before reading.
+
+        Parameters
+        ----------
+        start : str
+            The inclusive lower bound, e.g. "2024-05-31 00:00".
+        end : str
+            The exclusive upper bound, e.g. "2024-06-01 00:00".
+        function : Callable[[list], list]
+            A function that receives the reservations in the range and returns
+            the reservations to store in their place.
+
+        Returns
+        -------
+        list
+            The reservations that were stored.
+        """
+        start_date, start_time = start.split(" ")
+        end_date, end_time = end.split(" ")
+        condition = "(reservation_date, reservation_time) >= (?, ?) AND (reservation_date, reservation_time) < (?, ?)"
+        bounds = (start_date, start_time, end_date, end_time)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT data FROM reservations WHERE {condition} "
+                "ORDER BY reservation_date, reservation_time, id",
+                bounds
+            ).fetchall()
+            updated = function([json.loads(data) for (data,) in rows])
+            conn.execute(f"DELETE FROM reservations WHERE {condition}", bounds)
+            for item in updated:
+                self._insert(conn, item)
+        return updated
+
+    def append_reservations_with(self, start: str, end: str, function: Callable[[list], list]) -> list:
+        """
+        Appends the reservations a function returns for the reservations within a range.
+
+        The transaction takes the database's write lock before the range is read,
+        so no other connection can book in between and the function can check
+        the range, e.g. for capacity, and raise to append nothing.
+
+        Parameters
+        ----------
+        start : str
+            The inclusive lower bound, e.g. "2024-05-31 00:00".
+        end : str
+            The exclusive upper bound, e.g. "2024-06-01 00:00".
+        function : Callable[[list], list]
+            A function that receives the reservations in the range and returns
+            the reservations to append.
+
+        Returns
+        -------
+        list
+            The reservations that were appended.
+        """
+        start_date, start_time = start.split(" ")
+        end_date, end_time = end.split(" ")
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT data FROM reservations "
+                "WHERE (reservation_date, reservation_time) >= (?, ?) "
+                "AND (reservation_date, reservation_time) < (?, ?) "
+                "ORDER BY reservation_date, reservation_time, id",
+                (start_date, start_time, end_date, end_time)
+            ).fetchall()
+            items = list(function([json.loads(data) for (data,) in rows]))
+            for item in items:
+                self._insert(conn, item)
+        return items
+
+    def write(self, data: list) -> None:
+        """
+        Replaces all records of the collection with the given data.
+
+        Parameters
+        ----------
+        data : list
+            The records to be stored.
+        """
+        with self._connect() as conn:
+            if self.collection == "order_history":
+                conn.execute("DELETE FROM order_items")
+                conn.execute("DELETE FROM orders")
+            elif self.collection == "reservations":
+                conn.execute("DELETE FROM reservations")
+            else:
+                conn.execute("DELETE FROM documents WHERE collection = ?", (self.collection,))
+            for item in data:
+                self._insert(conn, item)
+
+    def append(self, item: dict) -> None:
+        """
+        Appends a record to the collection.
+
+        Parameters
+        ----------
+        item : dict
+            The record to be appended.
+        """
+        with self._connect() as conn:
+            self._insert(conn, item)
+
+    def append_many(self, items: list) -> None:
+        """
+        Appends several records to the collection in a single transaction.
+
+        Parameters
+        ----------
+        items : list
+            The records to be appended.
+        """
+        with self._connect() as conn:
+            for item in items:
+                self._insert(conn, item)
+
+    @staticmethod
+    def import_json(file_path: str, db_path: str) -> int:
+        """
+        Imports the records of a JSON or JSON Lines file into the database.
+
+        The existing records of the matching collection are replaced, so the
+        import can be repeated safely.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the JSON or JSON Lines file to import.
+        db_path : str
+            The path to the SQLite database file.
+
+        Returns
+        -------
+        int
+            The number of records imported.
+        """
+        data = Database(file_path).read()
+        if isinstance(data, dict):
+            data = [data]
+        SQLiteDatabase(file_path, db_path).write(data)
+        return len(data)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a connection to the database and creates the schema if needed.
+
+        The transaction is committed when the block succeeds, rolled back when it
+        raises, and the connection is closed in both cases.
+
+        Yields
+        ------
+        sqlite3.Connection
+            An open connection to the database.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if self.db_path not in SQLiteDatabase._initialized:
+                conn.executescript(SQLiteDatabase.SCHEMA)
+                SQLiteDatabase._initialized.add(self.db_path)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _insert(self, conn: sqlite3.Connection, item: dict) -> None:
+        """
+        Inserts a record into the tables of the collection.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            An open connection to the database.
+        item : dict
+            The record to be inserted.
+        """
+        data = json.dumps(item)
+        if self.collection == "order_history":
+            conn.execute(
+                "INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    item["order_id"], item["date_time"], item["order_type"], item["subtotal"],
+                    item.get("delivery_fee", 0), item["order_total"], data
+                )
+            )
+            conn.execute("DELETE FROM order_items WHERE order_id = ?", (item["order_id"],))
+            conn.executemany(
+                "INSERT INTO order_items VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (item["order_id"], line["id"], line["name"], line["quantity"], line["price"], line["total_price"])
+                    for line in item["items"]
+                ]
+            )
+        elif self.collection == "reservations":
+            conn.execute(
+                "INSERT INTO reservations (reservation_date, reservation_time, name, mobile_number, email, party_size, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.strptime(item["date"], "%d/%m/%Y").strftime("%Y-%m-%d"),
+                    datetime.strptime(item["time"], "%H:%M").strftime("%H:%M"),
+                    item["name"], item["mobile_number"], item["email"], int(item["party_size"]), data
+                )
+            )
+        else:
+            conn.execute("INSERT INTO documents (collection, data) VALUES (?, ?)", (self.collection, data))
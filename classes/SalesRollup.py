@@ -0,0 +1,343 @@
+import copy
+import json
+import os
+from datetime import date, timedelta
+from typing import Iterator
+from classes.Database import Database
+from classes.OrderHistory import OrderHistory
+
+
+class SalesRollup:
+    """
+    A class to maintain materialized daily sales totals.
+
+    One small JSON file per day holds the order count, the revenue and order count
+    per order type, the quantity and revenue per menu item id and the delivery fee
+    total. The rollup is brought up to date when an order is committed, so daily
+    reports are answered in O(items) instead of re-reading every order of the day.
+    Each rollup remembers how far into its day's shard, or up to which rowid of
+    the orders table, it has read, so updating it reads only the orders stored
+    since and never counts an order twice.
+
+    Attributes
+    ----------
+    order_history : OrderHistory
+        The order history the rollups are built from.
+
+    Methods
+    -------
+    rollup_path(day: date) -> str:
+        Returns the path of the rollup file for the given day.
+    empty(day: date) -> dict:
+        Returns a rollup with no orders for the given day.
+    add_order(rollup: dict, order_data: dict) -> dict:
+        Adds an order to a rollup.
+    record(order_data: dict) -> None:
+        Adds a committed order to the rollup of its day.
+    record_many(orders: list) -> None:
+        Brings the rollups of the days of committed orders up to date.
+    read_day(day: date) -> dict:
+        Returns the rollup of a day, bringing it up to date with the history first.
+    iter_range(start_date: date, end_date: date) -> Iterator[dict]:
+        Streams the rollups of the days between two dates, inclusive.
+    rebuild() -> int:
+        Rebuilds every rollup from the order history.
+    """
+
+    ROLLUP_DIR = "./order_history/rollups"
+
+    def __init__(self, order_history: OrderHistory = None):
+        """
+        Constructs all the necessary attributes for the SalesRollup object.
+
+        Parameters
+        ----------
+        order_history : OrderHistory, optional
+            The order history the rollups are built from (default is a new OrderHistory).
+        """
+        self.order_history = order_history or OrderHistory()
+
+    @staticmethod
+    def rollup_path(day: date) -> str:
+        """
+        Returns the path of the rollup file for the given day.
+
+        Parameters
+        ----------
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        str
+            The path of the rollup file.
+        """
+        return os.path.join(SalesRollup.ROLLUP_DIR, f"{day.isoformat()}.json")
+
+    @staticmethod
+    def empty(day: date) -> dict:
+        """
+        Returns a rollup with no orders for the given day.
+
+        Parameters
+        ----------
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        dict
+            The empty rollup.
+        """
+        return {
+            "date": day.isoformat(),
+            "order_count": 0,
+            "revenue": 0,
+            "delivery_fee_total": 0,
+            "order_types": {},
+            "items": {}
+        }
+
+    @staticmethod
+    def add_order(rollup: dict, order_data: dict) -> dict:
+        """
+        Adds an order to a rollup.
+
+        Parameters
+        ----------
+        rollup : dict
+            The rollup to be updated in place.
+        order_data : dict
+            The order record.
+
+        Returns
+        -------
+        dict
+            The updated rollup.
+        """
+        rollup["order_count"] += 1
+        rollup["revenue"] = round(rollup["revenue"] + order_data["order_total"], 2)
+        rollup["delivery_fee_total"] = round(rollup["delivery_fee_total"] + order_data.get("delivery_fee", 0), 2)
+
+        order_type = rollup["order_types"].setdefault(order_data["order_type"], {"order_count": 0, "revenue": 0})
+        order_type["order_count"] += 1
+        order_type["revenue"] = round(order_type["revenue"] + order_data["order_total"], 2)
+
+        for item in order_data["items"]:
+            totals = rollup["items"].setdefault(str(item["id"]), {"name": item["name"], "quantity": 0, "revenue": 0})
+            totals["quantity"] += item["quantity"]
+            totals["revenue"] = round(totals["revenue"] + item["total_price"], 2)
+        return rollup
+
+    def record(self, order_data: dict) -> None:
+        """
+        Adds a committed order to the rollup of its day.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record that was committed.
+        """
+        self.record_many([order_data])
+
+    def record_many(self, orders: list) -> None:
+        """
+        Brings the rollups of the days of committed orders up to date.
+
+        The orders are read back from the day's shard rather than added from the
+        list, so a rollup never counts an order twice and calling this again
+        after a failed commit is safe.
+
+        Parameters
+        ----------
+        orders : list
+            The order records that were committed.
+        """
+        for day in {OrderHistory.order_date(order_data) for order_data in orders}:
+            self._refresh(day)
+
+    def read_day(self, day: date) -> dict:
+        """
+        Returns the rollup of a day, bringing it up to date with the history first.
+
+        A rollup that already covers the whole shard, or every row, of its day is
+        returned without reading any orders.
+
+        Parameters
+        ----------
+        day : date
+            The day to read.
+
+        Returns
+        -------
+        dict
+            The rollup of the day. It is read-only when it comes from the cache.
+        """
+        rollup = Database(self.rollup_path(day)).read()
+        if rollup and self._covers(rollup, day):
+            return rollup
+        return self._refresh(day)
+
+    def _refresh(self, day: date) -> dict:
+        """
+        Brings the rollup of a day up to date under an exclusive lock on its file.
+
+        Empty rollups are written too, so days without orders are not read again.
+
+        Parameters
+        ----------
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        dict
+            The updated rollup.
+        """
+        os.makedirs(SalesRollup.ROLLUP_DIR, exist_ok=True)
+        return Database(self.rollup_path(day)).update(lambda rollup: self._catch_up(rollup, day))
+
+    def _catch_up(self, rollup: dict, day: date) -> dict:
+        """
+        Adds the orders stored since a rollup was last updated.
+
+        With the "json" backend a rollup records the inode of its day's shard and
+        the number of bytes of it already added. Only the complete lines after
+        that position are read. A rollup that is missing, predates this scheme or
+        belongs to a shard that has since been rewritten is rebuilt, starting with
+        the day's orders in the legacy history file. With the "sqlite" backend a
+        rollup records the highest rowid and the number of orders it has added,
+        and only the rows after that rowid are read. It is rebuilt if the day's
+        rows no longer match, e.g. because an order was replaced or deleted.
+
+        Parameters
+        ----------
+        rollup : dict
+            The stored rollup, or None if there is none.
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        dict
+            The updated rollup.
+        """
+        if self.order_history.backend == "sqlite":
+            if rollup and "last_rowid" in rollup:
+                rollup = self._add_rows(copy.deepcopy(rollup), day)
+                if self._covers(rollup, day):
+                    return rollup
+            rollup = self.empty(day)
+            rollup["last_rowid"], rollup["row_count"] = 0, 0
+            return self._add_rows(rollup, day)
+
+        try:
+            shard = open(OrderHistory.shard_path(day), 'rb')
+        except FileNotFoundError:
+            shard = None
+        inode = os.fstat(shard.fileno()).st_ino if shard else None
+
+        if not rollup or "shard_position" not in rollup or rollup.get("shard_inode") != inode:
+            rollup = self.empty(day)
+            for order_data in self.order_history.iter_legacy(day, day):
+                self.add_order(rollup, order_data)
+            rollup["shard_inode"], rollup["shard_position"] = inode, 0
+        else:
+            rollup = copy.deepcopy(rollup)
+
+        if shard:
+            with shard:
+                shard.seek(rollup["shard_position"])
+                for line in shard:
+                    if not line.endswith(b"\n"):
+                        break
+                    rollup["shard_position"] += len(line)
+                    try:
+                        order_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.add_order(rollup, order_data)
+        return rollup
+
+    def _add_rows(self, rollup: dict, day: date) -> dict:
+        """
+        Adds the orders of a day stored after the last rowid of a rollup.
+
+        Parameters
+        ----------
+        rollup : dict
+            The rollup to be updated in place.
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        dict
+            The updated rollup.
+        """
+        for rowid, order_data in self.order_history.iter_rows_after(day, rollup["last_rowid"]):
+            self.add_order(rollup, order_data)
+            rollup["last_rowid"] = rowid
+            rollup["row_count"] += 1
+        return rollup
+
+    def _covers(self, rollup: dict, day: date) -> bool:
+        """
+        Checks whether a rollup includes every order stored for its day.
+
+        Parameters
+        ----------
+        rollup : dict
+            The stored rollup.
+        day : date
+            The day of the rollup.
+
+        Returns
+        -------
+        bool
+            True if the rollup was built from the current shard up to its end,
+            or from every row of the day in the orders table.
+        """
+        if self.order_history.backend == "sqlite":
+            return (rollup.get("row_count"), rollup.get("last_rowid")) == self.order_history.row_stats(day)
+        try:
+            stat = os.stat(OrderHistory.shard_path(day))
+        except FileNotFoundError:
+            return rollup.get("shard_inode", 0) is None and rollup.get("shard_position") == 0
+        return rollup.get("shard_inode") == stat.st_ino and rollup.get("shard_position") == stat.st_size
+
+    def iter_range(self, start_date: date, end_date: date) -> Iterator[dict]:
+        """
+        Streams the rollups of the days between two dates, inclusive.
+
+        Parameters
+        ----------
+        start_date : date
+            The first day to include.
+        end_date : date
+            The last day to include.
+
+        Yields
+        ------
+        dict
+            The rollup of the next day.
+        """
+        day = start_date
+        while day <= end_date:
+            yield self.read_day(day)
+            day += timedelta(days=1)
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds every rollup from the order history.
+
+        Returns
+        -------
+        int
+            The number of days rebuilt.
+        """
+        days = {OrderHistory.order_date(order_data) for order_data in self.order_history.iter_orders()}
+        os.makedirs(SalesRollup.ROLLUP_DIR, exist_ok=True)
+        for day in days:
+            Database(self.rollup_path(day)).update(lambda rollup, day=day: self._catch_up(None, day))
+        return len(days)
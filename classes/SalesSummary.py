@@ -0,0 +1,137 @@
+class SalesSummary:
+    """
+    A class to aggregate sales over a date range in a single pass.
+
+    Orders are added one at a time and only the running totals are kept, so the
+    memory used depends on the number of days, order types and menu items in the
+    range rather than on the number of orders. Two summaries can be merged, which
+    allows partial summaries to be computed separately and combined.
+
+    Attributes
+    ----------
+    order_count : int
+        The number of orders added.
+    revenue : float
+        The total revenue of the orders added.
+    delivery_fee_total : float
+        The total delivery fees of the orders added.
+    days : dict
+        The order count and revenue per day, keyed by "YYYY-MM-DD".
+    order_types : dict
+        The order count and revenue per order type.
+    items : dict
+        The name, quantity and revenue per menu item id.
+
+    Methods
+    -------
+    add(order_data: dict) -> None:
+        Adds an order to the running totals.
+    merge(other: SalesSummary) -> SalesSummary:
+        Adds the totals of another summary to this one.
+    from_dict(data: dict) -> SalesSummary:
+        Creates a summary from its attributes, e.g. as returned by the API server.
+    """
+
+    def __init__(self):
+        """
+        Constructs all the necessary attributes for the SalesSummary object.
+        """
+        self.order_count = 0
+        self.revenue = 0
+        self.delivery_fee_total = 0
+        self.days = {}
+        self.order_types = {}
+        self.items = {}
+
+    @staticmethod
+    def from_dict(data: dict) -> 'SalesSummary':
+        """
+        Creates a summary from its attributes, e.g. as returned by the API server.
+
+        Parameters
+        ----------
+        data : dict
+            The order_count, revenue, delivery_fee_total, days, order_types and
+            items of the summary.
+
+        Returns
+        -------
+        SalesSummary
+            The summary.
+        """
+        summary = SalesSummary()
+        for name in vars(summary):
+            setattr(summary, name, data[name])
+        return summary
+
+    def add(self, order_data: dict) -> None:
+        """
+        Adds an order to the running totals.
+
+        Parameters
+        ----------
+        order_data : dict
+            The order record.
+        """
+        order_total = order_data["order_total"]
+        self.order_count += 1
+        self.revenue = round(self.revenue + order_total, 2)
+        self.delivery_fee_total = round(self.delivery_fee_total + order_data.get("delivery_fee", 0), 2)
+        self._add_totals(self.days, order_data["date_time"][:10], 1, order_total)
+        self._add_totals(self.order_types, order_data["order_type"], 1, order_total)
+
+        for item in order_data["items"]:
+            totals = self.items.get(item["id"])
+            if totals is None:
+                totals = self.items[item["id"]] = {"name": item["name"], "quantity": 0, "revenue": 0}
+            totals["quantity"] += item["quantity"]
+            totals["revenue"] = round(totals["revenue"] + item["total_price"], 2)
+
+    def merge(self, other: 'SalesSummary') -> 'SalesSummary':
+        """
+        Adds the totals of another summary to this one.
+
+        Parameters
+        ----------
+        other : SalesSummary
+            The summary to be merged into this one.
+
+        Returns
+        -------
+        SalesSummary
+            This summary, for chaining.
+        """
+        self.order_count += other.order_count
+        self.revenue = round(self.revenue + other.revenue, 2)
+        self.delivery_fee_total = round(self.delivery_fee_total + other.delivery_fee_total, 2)
+        for day, totals in other.days.items():
+            self._add_totals(self.days, day, totals["order_count"], totals["revenue"])
+        for order_type, totals in other.order_types.items():
+            self._add_totals(self.order_types, order_type, totals["order_count"], totals["revenue"])
+        for item_id, totals in other.items.items():
+            merged = self.items.setdefault(item_id, {"name": totals["name"], "quantity": 0, "revenue": 0})
+            merged["quantity"] += totals["quantity"]
+            merged["revenue"] = round(merged["revenue"] + totals["revenue"], 2)
+        return self
+
+    @staticmethod
+    def _add_totals(group: dict, key: str, order_count: int, revenue: float) -> None:
+        """
+        Adds an order count and revenue to one entry of a group.
+
+        Parameters
+        ----------
+        group : dict
+            The group of totals, e.g. days or order types.
+        key : str
+            The key of the entry within the group.
+        order_count : int
+            The number of orders to add.
+        revenue : float
+            The revenue to add.
+        """
+        totals = group.get(key)
+        if totals is None:
+            totals = group[key] = {"order_count": 0, "revenue": 0}
+        totals["order_count"] += order_count
+        totals["revenue"] = round(totals["revenue"] + revenue, 2)
@@ -1,36 +1,61 @@
+from datetime import datetime
+from classes.ApiClient import ApiClient
+from classes.Config import Config
+from classes.SalesSummary import SalesSummary
 from classes.SystemUtils import SystemUtils
 from classes.Validator import Validator 
 from classes.Reports import Reports
+from classes.WaitlistHandler import WaitlistHandler
+from classes.CustomerHandler import CustomerHandler
+from classes.ReceiptHandler import ReceiptHandler
 
 
 class StaffInterface:
     """
     A class to represent the staff interface of the system.
 
+    When Config.SERVER_URL is set, the sales, menu item and reservation reports
+    and the order lookup are requested from the API server with the staff PIN,
+    and the options that need the data files are only available on the server.
+
     Methods
     -------
-    display() -> None:
+    display(pin: str = "") -> None:
         Displays the staff dashboard and handles user input.
+    prompt_date_range() -> tuple:
+        Prompts for a From and To date and validates the range.
     """
 
     @staticmethod
-    def display() -> None:
+    def display(pin: str = "") -> None:
         """
         Displays the staff dashboard and handles user input.
 
         The method runs in a loop, showing the staff dashboard options and handling the 
         corresponding user inputs to export sales reports or manage reservations.
+
+        Parameters
+        ----------
+        pin : str, optional
+            The staff PIN entered at login, sent to the API server in client mode.
         """
         message = ""
         reports = Reports()
+        client = ApiClient() if Config.SERVER_URL else None
         while True:
             SystemUtils.clear_screen()
             SystemUtils.display_message(message)
             SystemUtils.heading("STAFF DASHBOARD")
             print("[1] Export Sales Report\n")
             print("[2] Export Menu Items Report\n")
-            print("[3] Manage Reservations\n")
-            print("[4] Shutdown the System\n")
+            print("[3] Export Sales Range Report\n")
+            print("[4] Export Analytics Report\n")
+            print("[5] Export Peak Demand Heatmap\n")
+            print("[6] Manage Reservations\n")
+            print("[7] Manage Waitlist\n")
+            print("[8] Customer Lookup\n")
+            print("[9] Order Lookup and Receipt Reprint\n")
+            print("[10] Shutdown the System\n")
             print("[E] Exit\n")
             user_input = input("Select an option: ").lower()
 
@@ -39,7 +64,17 @@ class StaffInterface:
             
             SystemUtils.clear_screen()
 
-            if user_input in ['1', '2', '3']:
+            if client and user_input in ['4', '5', '7', '8']:
+                message = "[ERROR] This option is only available on the server terminal."
+                continue
+
+            if client and user_input in ['1', '2', '3', '6']:
+                try:
+                    StaffInterface._display_from_server(client, user_input, pin)
+                except (ValueError, ConnectionError, PermissionError) as error:
+                    print(f"[ERROR] {error}")
+                input("\nPress ENTER to continue")
+            elif user_input in ['1', '2', '3', '4', '5', '6', '7', '8']:
                 if user_input == '1':
                     SystemUtils.heading("SALES REPORT")
                     temp = input("Date (DD/MM/YYYY) or [E] Exit: ")
@@ -59,12 +94,124 @@ class StaffInterface:
                     else:
                         print("Please enter a valid date in DD/MM/YYYY format.") 
                 elif user_input == '3':
+                    SystemUtils.heading("SALES RANGE REPORT")
+                    date_range = StaffInterface.prompt_date_range()
+                    if date_range is None:
+                        continue
+                    if date_range:
+                        reports.display_sales_range(*date_range)
+                elif user_input == '4':
+                    SystemUtils.heading("ANALYTICS REPORT")
+                    date_range = StaffInterface.prompt_date_range()
+                    if date_range is None:
+                        continue
+                    if date_range:
+                        if input("Refresh analytics from order history first? (Y/N): ").lower() == 'y':
+                            print(f"[SYSTEM] Exported {reports.refresh_analytics()} order lines.\n")
+                        reports.display_analytics(*date_range)
+                elif user_input == '5':
+                    SystemUtils.heading("PEAK DEMAND HEATMAP")
+                    date_range = StaffInterface.prompt_date_range()
+                    if date_range is None:
+                        continue
+                    if date_range:
+                        temp = input("Show [O] Orders or [I] Items per hour: ").lower()
+                        reports.display_heatmap(*date_range, "quantities" if temp == 'i' else "orders")
+                elif user_input == '6':
                     SystemUtils.heading("UPCOMING BOOKINGS")
-                    reports.display_reservations()
+                    temp = input("Date (DD/MM/YYYY), ENTER for All Upcoming or [E] Exit: ")
+                    if temp.lower() == 'e':
+                        continue
+                    if not temp:
+                        reports.display_reservations()
+                    elif Validator.validate_date(temp):
+                        reports.display_reservations(temp)
+                        reports.display_free_slots(temp)
+                        temp_action = input("\nSelect [A] Assign Tables, [C] Cancel a Reservation or ENTER to continue: ").lower()
+                        if temp_action == 'a':
+                            reports.assign_tables(temp)
+                            reports.display_reservations(temp)
+                        elif temp_action == 'c':
+                            reservations = reports.reservation_book.on_date(datetime.strptime(temp, "%d/%m/%Y").date())
+                            temp_row = input(f"Reservation Number (1-{len(reservations)}): ")
+                            if temp_row.isdigit() and 1 <= int(temp_row) <= len(reservations):
+                                print(WaitlistHandler.handle_cancellation(reservations[int(temp_row) - 1]))
+                            else:
+                                print("Please enter a valid reservation number.")
+                    else:
+                        print("Please enter a valid date in DD/MM/YYYY format.")
+                elif user_input == '7':
+                    SystemUtils.heading("WAITLIST")
+                    WaitlistHandler.display_queue()
+                    if input("\nSelect [F] Table Freed or ENTER to continue: ").lower() == 'f':
+                        print(WaitlistHandler.handle_table_freed())
+                elif user_input == '8':
+                    SystemUtils.heading("CUSTOMER LOOKUP")
+                    CustomerHandler.handle_lookup()
                 input("\nPress ENTER to continue")
-            elif user_input == '4':
+            elif user_input == '9':
+                SystemUtils.heading("ORDER LOOKUP")
+                ReceiptHandler.handle_reprint(pin)
+            elif user_input == '10':
                 SystemUtils.heading("SYSTEM SHUTDOWN CONFIRMATION")
                 SystemUtils.shutdown()
             else:
                 message = "Please select a valid option."
-                continue
\ No newline at end of file
+                continue
+
+    @staticmethod
+    def _display_from_server(client: ApiClient, option: str, pin: str) -> None:
+        """
+        Displays a sales, menu item or reservation report requested from the API server.
+
+        Parameters
+        ----------
+        client : ApiClient
+            The client of the API server.
+        option : str
+            The dashboard option: '1' sales, '2' menu items, '3' sales range or
+            '6' reservations.
+        pin : str
+            The staff PIN.
+        """
+        headings = {'1': "SALES REPORT", '2': "MENU ITEM REPORT", '3': "SALES RANGE REPORT", '6': "BOOKINGS"}
+        SystemUtils.heading(headings[option])
+        if option == '3':
+            date_range = StaffInterface.prompt_date_range()
+            if date_range:
+                Reports.display_sales_summary(SalesSummary.from_dict(client.sales_report(*date_range, pin)), *date_range)
+            return
+
+        temp = input("Date (DD/MM/YYYY) or [E] Exit: ")
+        if temp.lower() == 'e':
+            return
+        if not Validator.validate_date(temp):
+            print("Please enter a valid date in DD/MM/YYYY format.")
+        elif option == '1':
+            Reports.display_sales_summary(SalesSummary.from_dict(client.sales_report(temp, temp, pin)), temp, temp)
+        elif option == '2':
+            Reports.display_item_quantities(client.sales_report(temp, temp, pin)["items"], temp)
+        else:
+            Reports.display_reservation_table(client.reservations_report(temp, pin))
+
+    @staticmethod
+    def prompt_date_range() -> tuple:
+        """
+        Prompts for a From and To date and validates the range.
+
+        Returns
+        -------
+        tuple
+            The From and To dates (DD/MM/YYYY), an empty tuple if the range is
+            invalid, or None if the user chose to exit.
+        """
+        from_date = input("From Date (DD/MM/YYYY) or [E] Exit: ")
+        if from_date.lower() == 'e':
+            return None
+        to_date = input("To Date (DD/MM/YYYY) or [E] Exit: ")
+        if to_date.lower() == 'e':
+            return None
+        if Validator.validate_date_range(from_date, to_date):
+            return from_date, to_date
+        print("Please enter valid dates in DD/MM/YYYY format, with the From Date first.")
+        return ()
@@ -52,6 +52,12 @@ class SystemUtils:
 
     @staticmethod
     def shutdown() -> None:
+        """
+        Shuts the system down after confirmation and the staff PIN.
+
+        Orders still queued for the background writer are committed first.
+        """
+        from classes.CommitQueue import CommitQueue
         from classes.PinValidator import PinValidator
         message = ""
         while True:
@@ -63,7 +69,7 @@ class SystemUtils:
             
             if user_input == 'y':
                 if PinValidator.check_pin():
-                    print
+                    CommitQueue.close_all()
                     exit()
             elif user_input == 'n':
                 return
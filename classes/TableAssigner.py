@@ -0,0 +1,193 @@
+from bisect import bisect_left, insort
+from datetime import date
+from classes.Config import Config
+from classes.ReservationBook import ReservationBook
+from classes.TableLayout import TableLayout
+
+
+class TableAssigner:
+    """
+    A class to assign the tables of the layout to a day's reservations.
+
+    The reservations of each service are packed largest party first, which
+    favours seating the most covers, and each party gets the smallest free
+    seating (single table or combination) that fits, which keeps the number of
+    wasted seats low. A seating is free when none of its tables has a booking
+    overlapping the party's dining window; every table keeps its bookings as a
+    sorted list of intervals, so that check is a binary search per table.
+
+    Attributes
+    ----------
+    layout : TableLayout
+        The tables that can be assigned.
+    reservation_book : ReservationBook
+        The reservations the tables are assigned to.
+    dining_minutes : int
+        The time a party occupies its tables.
+
+    Methods
+    -------
+    service(reservation: dict) -> str:
+        Returns the name of the service a reservation belongs to.
+    assign(reservations: list) -> list:
+        Chooses the tables for each reservation.
+    assign_day(day: date) -> dict:
+        Assigns tables to the reservations on a day and stores them on the records.
+    """
+
+    SERVICES = {"Lunch": ("09:00", "15:00"), "Dinner": ("15:00", "24:00")}
+
+    def __init__(self, layout: TableLayout = None, reservation_book: ReservationBook = None,
+                 dining_minutes: int = None):
+        """
+        Constructs all the necessary attributes for the TableAssigner object.
+
+        Parameters
+        ----------
+        layout : TableLayout, optional
+            The tables that can be assigned (default is a new TableLayout).
+        reservation_book : ReservationBook, optional
+            The reservations to assign (default is a new ReservationBook).
+        dining_minutes : int, optional
+            The dining duration (default is Config.DINING_MINUTES).
+        """
+        self.layout = layout or TableLayout()
+        self.reservation_book = reservation_book or ReservationBook()
+        self.dining_minutes = Config.DINING_MINUTES if dining_minutes is None else dining_minutes
+
+    @staticmethod
+    def service(reservation: dict) -> str:
+        """
+        Returns the name of the service a reservation belongs to.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation record.
+
+        Returns
+        -------
+        str
+            The name of the service whose hours contain the start time.
+        """
+        start_time = ReservationBook.starts_at(reservation)[11:]
+        for name, (opening, closing) in TableAssigner.SERVICES.items():
+            if opening <= start_time < closing:
+                return name
+        return list(TableAssigner.SERVICES)[-1]
+
+    def assign(self, reservations: list) -> list:
+        """
+        Chooses the tables for each reservation.
+
+        Parameters
+        ----------
+        reservations : list
+            The reservations of one day.
+
+        Returns
+        -------
+        list
+            The sorted table ids assigned to each reservation, in the order of
+            the reservations. The list is empty for a party that cannot be seated.
+        """
+        services = list(TableAssigner.SERVICES)
+        order = sorted(
+            range(len(reservations)),
+            key=lambda i: (
+                services.index(self.service(reservations[i])),
+                -int(reservations[i]["party_size"]),
+                ReservationBook.starts_at(reservations[i])
+            )
+        )
+        seatings = self.layout.seatings()
+        bookings = {table_id: [] for table_id in self.layout.tables}
+        assignments = [[] for _ in reservations]
+
+        for i in order:
+            party_size = int(reservations[i]["party_size"])
+            start = self._minutes(ReservationBook.starts_at(reservations[i]))
+            end = start + self.dining_minutes
+            for seats, tables in seatings[bisect_left(seatings, (party_size,)):]:
+                if all(self._is_free(bookings[table_id], start, end) for table_id in tables):
+                    for table_id in tables:
+                        insort(bookings[table_id], (start, end))
+                    assignments[i] = list(tables)
+                    break
+        return assignments
+
+    def assign_day(self, day: date) -> dict:
+        """
+        Assigns tables to the reservations on a day and stores them on the records.
+
+        Each reservation record gets a "tables" list, which is empty if the party
+        could not be seated.
+
+        Parameters
+        ----------
+        day : date
+            The day of the reservations.
+
+        Returns
+        -------
+        dict
+            The number of parties "seated" and "unseated", the "covers" seated and
+            the "wasted_seats" at the assigned tables.
+        """
+        summary = {"seated": 0, "unseated": 0, "covers": 0, "wasted_seats": 0}
+
+        def apply(reservations: list) -> list:
+            for reservation, tables in zip(reservations, self.assign(reservations)):
+                reservation["tables"] = tables
+                if tables:
+                    party_size = int(reservation["party_size"])
+                    summary["seated"] += 1
+                    summary["covers"] += party_size
+                    summary["wasted_seats"] += sum(self.layout.tables[table_id] for table_id in tables) - party_size
+                else:
+                    summary["unseated"] += 1
+            return reservations
+
+        self.reservation_book.update_day(day, apply)
+        return summary
+
+    @staticmethod
+    def _is_free(bookings: list, start: int, end: int) -> bool:
+        """
+        Checks whether a table has no booking overlapping a time window.
+
+        Parameters
+        ----------
+        bookings : list
+            The sorted, non-overlapping (start, end) intervals booked on the table.
+        start : int
+            The start of the window in minutes after midnight.
+        end : int
+            The end of the window in minutes after midnight.
+
+        Returns
+        -------
+        bool
+            True if the window is free, False otherwise.
+        """
+        position = bisect_left(bookings, (start,))
+        if position < len(bookings) and bookings[position][0] < end:
+            return False
+        return position == 0 or bookings[position - 1][1] <= start
+
+    @staticmethod
+    def _minutes(starts_at: str) -> int:
+        """
+        Returns the start time of a reservation in minutes after midnight.
+
+        Parameters
+        ----------
+        starts_at : str
+            The start key of the reservation ("YYYY-MM-DD HH:MM").
+
+        Returns
+        -------
+        int
+            The number of minutes after midnight.
+        """
+        return int(starts_at[11:13]) * 60 + int(starts_at[14:16])
@@ -0,0 +1,108 @@
+from classes.Config import Config
+from classes.DatabaseFactory import DatabaseFactory
+
+
+class TableLayout:
+    """
+    A class to represent the dining room's tables.
+
+    Every table has an id, a number of seats and the ids of the neighbouring
+    tables it can be pushed together with. The seatings of the layout are the
+    single tables plus every group of up to MAX_COMBINED connected tables, each
+    with its total number of seats. If no layout file exists, a layout of
+    Config.TABLE_CAPACITY equal tables sharing Config.SEAT_CAPACITY seats is used.
+
+    Attributes
+    ----------
+    tables : dict
+        The number of seats of every table, keyed by table id.
+    combinable : dict
+        The ids of the tables each table can be combined with.
+
+    Methods
+    -------
+    table_ids() -> list:
+        Returns the ids of every table in ascending order.
+    has_table(table_id: str | int) -> bool:
+        Checks whether a table exists.
+    seatings() -> list:
+        Returns every single table and combination of tables with its seats.
+    """
+
+    LAYOUT_PATH = "./tables.json"
+    MAX_COMBINED = 3
+
+    def __init__(self, layout: list = None):
+        """
+        Constructs all the necessary attributes for the TableLayout object.
+
+        Parameters
+        ----------
+        layout : list, optional
+            The table records (default is the contents of TableLayout.LAYOUT_PATH).
+        """
+        layout = DatabaseFactory.create(TableLayout.LAYOUT_PATH).read() if layout is None else layout
+        if not layout:
+            seats = max(1, Config.SEAT_CAPACITY // max(1, Config.TABLE_CAPACITY))
+            layout = [
+                {"id": table_id, "seats": seats, "combinable_with": []}
+                for table_id in range(1, Config.TABLE_CAPACITY + 1)
+            ]
+        self.tables = {int(table["id"]): int(table["seats"]) for table in layout}
+        self.combinable = {
+            int(table["id"]): [int(other) for other in table.get("combinable_with", []) if int(other) in self.tables]
+            for table in layout
+        }
+
+    def table_ids(self) -> list:
+        """
+        Returns the ids of every table in ascending order.
+
+        Returns
+        -------
+        list
+            The table ids.
+        """
+        return sorted(self.tables)
+
+    def has_table(self, table_id: str | int) -> bool:
+        """
+        Checks whether a table exists.
+
+        Parameters
+        ----------
+        table_id : str | int
+            The table id, e.g. as entered by the user.
+
+        Returns
+        -------
+        bool
+            True if the table is part of the layout, False otherwise.
+        """
+        return str(table_id).isdigit() and int(table_id) in self.tables
+
+    def seatings(self) -> list:
+        """
+        Returns every single table and combination of tables with its seats.
+
+        Returns
+        -------
+        list
+            Tuples of the total seats and the sorted tuple of table ids, ordered
+            by seats and then by the number of tables.
+        """
+        groups = {(table_id,) for table_id in self.tables}
+        frontier = set(groups)
+        for _ in range(TableLayout.MAX_COMBINED - 1):
+            frontier = {
+                tuple(sorted(group + (other,)))
+                for group in frontier
+                for table_id in group
+                for other in self.combinable[table_id]
+                if other not in group
+            }
+            groups |= frontier
+        return sorted(
+            ((sum(self.tables[table_id] for table_id in group), group) for group in groups),
+            key=lambda seating: (seating[0], len(seating[1]), seating[1])
+        )
@@ -0,0 +1,79 @@
+import os
+import threading
+from datetime import date
+from classes.Config import Config
+from classes.Database import Database
+
+
+class TicketCounter:
+    """
+    A class to hand out short ticket numbers for the kitchen, restarting every day.
+
+    The last reserved ticket number and its day are kept in a small JSON file
+    that is updated under an exclusive lock, so concurrent processes never hand
+    out the same number. Each process reserves Config.TICKET_BLOCK_SIZE numbers
+    at a time and hands them out from memory. With the default block of one
+    number, tickets are numbered in sequence across all terminals; with larger
+    blocks the terminals' numbers interleave and numbers left in a block when a
+    process stops are skipped.
+
+    Methods
+    -------
+    next(day: date = None) -> int:
+        Returns the next ticket number of a day.
+    """
+
+    COUNTER_PATH = "./order_history/tickets.json"
+
+    _block = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def next(day: date = None) -> int:
+        """
+        Returns the next ticket number of a day.
+
+        Parameters
+        ----------
+        day : date, optional
+            The day of the ticket (default is today).
+
+        Returns
+        -------
+        int
+            The ticket number, starting at 1 every day.
+        """
+        day = (day or date.today()).isoformat()
+        with TicketCounter._lock:
+            block = TicketCounter._block
+            if block.get("date") != day or block["next"] > block["last"]:
+                block = TicketCounter._block = TicketCounter._reserve(day, max(1, Config.TICKET_BLOCK_SIZE))
+            ticket = block["next"]
+            block["next"] += 1
+            return ticket
+
+    @staticmethod
+    def _reserve(day: str, size: int) -> dict:
+        """
+        Reserves the next block of ticket numbers of a day in the counter file.
+
+        Parameters
+        ----------
+        day : str
+            The day of the tickets (YYYY-MM-DD).
+        size : int
+            The number of tickets to reserve.
+
+        Returns
+        -------
+        dict
+            The day, the first ticket ("next") and the last ticket of the block.
+        """
+        def increment(counter: dict) -> dict:
+            if not counter or counter.get("date") != day:
+                return {"date": day, "last": size}
+            return {"date": day, "last": counter["last"] + size}
+
+        os.makedirs(os.path.dirname(TicketCounter.COUNTER_PATH), exist_ok=True)
+        last = Database(TicketCounter.COUNTER_PATH).update(increment)["last"]
+        return {"date": day, "next": last - size + 1, "last": last}
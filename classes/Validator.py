@@ -15,6 +15,8 @@ class Validator:
         Validates that is in the specified format.
     validate_future_date(date_str: str, date_format: str = "%d/%m/%Y") -> bool:
         Validates that the date is in the future and in the specified format.
+    validate_date_range(from_date_str: str, to_date_str: str, date_format: str = "%d/%m/%Y") -> bool:
+        Validates that both dates are valid and the range is not reversed.
     validate_time(time_str: str, start_time: str = "09:00", end_time: str = "21:00") -> bool:
         Validates that the time is within the specified range.
     validate_mobile_number(mobile_number: str) -> bool:
@@ -29,8 +31,8 @@ class Validator:
         Validates that the CVV has 3 or 4 digits.
     validate_postal_code(postal_code: str) -> bool:
         Validates that the postal code has 4 digits.
-    validate_table_number(table_number: str) -> bool:
-        Validates that the table number is between 1 and 100.
+    validate_table_number(table_number: str, table_ids: list = None) -> bool:
+        Validates that the table number exists in the layout, or is between 1 and 100.
     validate_party_size(party_size: str) -> bool:
         Validates that the party size is between 1 and 20.
     """
@@ -98,6 +100,32 @@ class Validator:
         except ValueError:
             return False
 
+    @staticmethod
+    def validate_date_range(from_date_str: str, to_date_str: str, date_format: str = "%d/%m/%Y") -> bool:
+        """
+        Validates that both dates are valid and the range is not reversed.
+
+        Parameters
+        ----------
+        from_date_str : str
+            The first date of the range.
+        to_date_str : str
+            The last date of the range.
+        date_format : str, optional
+            The format of the date strings (default is "%d/%m/%Y").
+
+        Returns
+        -------
+        bool
+            True if the date range is valid, False otherwise.
+        """
+        try:
+            from_date = datetime.strptime(from_date_str, date_format).date()
+            to_date = datetime.strptime(to_date_str, date_format).date()
+            return from_date <= to_date
+        except ValueError:
+            return False
+
     @staticmethod
     def validate_time(time_str: str, start_time: str = "09:00", end_time: str = "21:00") -> bool:
         """
@@ -234,21 +262,27 @@ class Validator:
         return bool(re.match(r"^\d{4}$", postal_code))
 
     @staticmethod
-    def validate_table_number(table_number: str) -> bool:
+    def validate_table_number(table_number: str, table_ids: list = None) -> bool:
         """
-        Validates that the table number is between 1 and 100.
+        Validates that the table number exists in the layout, or is between 1 and 100.
 
         Parameters
         ----------
         table_number : str
             The table number to be validated.
+        table_ids : list, optional
+            The ids of the tables in the layout (default is any number from 1 to 100).
 
         Returns
         -------
         bool
             True if the table number is valid, False otherwise.
         """
-        return table_number.isdigit() and 1 <= int(table_number) <= 100
+        if not table_number.isdigit():
+            return False
+        if table_ids is not None:
+            return int(table_number) in table_ids
+        return 1 <= int(table_number) <= 100
 
     @staticmethod
     def validate_party_size(party_size: str) -> bool:
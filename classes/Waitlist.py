@@ -0,0 +1,436 @@
+import heapq
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.Config import Config
+from classes.Database import Database
+from classes.DatabaseFactory import DatabaseFactory
+from classes.FileLock import FileLock
+from classes.ReservationBook import ReservationBook
+
+
+class Waitlist:
+    """
+    A class to queue parties waiting for a fully booked time slot.
+
+    Waiting parties are ordered by their requested time and then by their time of
+    arrival. The queue is held in a heap, and every requested slot also keeps a
+    heap per party size, with the requested slots in a sorted list, so the
+    best-fitting party for a freed slot is found with a binary search for the
+    slots around it and by reading the top of each party size's heap. Joins and
+    departures are appended to a journal file, and each process replays only
+    the journal lines added since it last looked. Departed entries are removed
+    from the heaps lazily when they reach the top, and the heaps are rebuilt once
+    departed entries outnumber the waiting parties.
+
+    Attributes
+    ----------
+    journal_path : str
+        The path to the waitlist journal.
+    reservation_book : ReservationBook
+        The reservations waiting parties are promoted into.
+
+    Methods
+    -------
+    join(reservation: dict) -> dict:
+        Adds a party to the waitlist.
+    leave(waitlist_id: str) -> bool:
+        Removes a party from the waitlist.
+    queue() -> list:
+        Returns the waiting parties in queue order.
+    best_fit(day: date, time: str, seats: int = None, engine: AvailabilityEngine = None) -> dict | None:
+        Returns the waiting party that best fits the free capacity around a freed slot.
+    promote(day: date, time: str, seats: int = None) -> dict | None:
+        Books the best-fitting waiting party for a slot and removes it from the queue.
+    estimated_wait(entry: dict, engine: AvailabilityEngine = None) -> int | None:
+        Estimates how many minutes after its requested time a party can be seated.
+    compact() -> int:
+        Rewrites the journal with only the parties still waiting for a future slot.
+    """
+
+    JOURNAL_PATH = "./waitlist.jsonl"
+    MAX_PARTY_SIZE = 20
+
+    _states = {}
+    _lock = threading.RLock()
+
+    def __init__(self, journal_path: str = None, reservation_book: ReservationBook = None):
+        """
+        Constructs all the necessary attributes for the Waitlist object.
+
+        Parameters
+        ----------
+        journal_path : str, optional
+            The path to the waitlist journal (default is Waitlist.JOURNAL_PATH).
+        reservation_book : ReservationBook, optional
+            The reservations to promote into (default is a new ReservationBook).
+        """
+        self.journal_path = journal_path or Waitlist.JOURNAL_PATH
+        self.reservation_book = reservation_book or ReservationBook()
+
+    def join(self, reservation: dict) -> dict:
+        """
+        Adds a party to the waitlist.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation details of the party, including its requested date
+            (DD/MM/YYYY), time (HH:MM) and party size.
+
+        Returns
+        -------
+        dict
+            The waitlist entry, with its waitlist_id, starts_at and arrived_at keys.
+        """
+        entry = dict(reservation)
+        entry["waitlist_id"] = str(uuid4())
+        entry["starts_at"] = ReservationBook.starts_at(entry)
+        entry["arrived_at"] = datetime.now().isoformat(sep=" ")
+        DatabaseFactory.create(self.journal_path).append({"event": "join", "entry": entry})
+        return entry
+
+    def leave(self, waitlist_id: str) -> bool:
+        """
+        Removes a party from the waitlist.
+
+        Parameters
+        ----------
+        waitlist_id : str
+            The ID of the waitlist entry.
+
+        Returns
+        -------
+        bool
+            True if the party was waiting, False otherwise.
+        """
+        with self._promote_lock():
+            return self._leave(waitlist_id)
+
+    def queue(self) -> list:
+        """
+        Returns the waiting parties in queue order.
+
+        The order is sorted once per change to the waitlist and reused until the
+        next join or departure.
+
+        Returns
+        -------
+        list
+            The waitlist entries ordered by requested time and then arrival.
+        """
+        with Waitlist._lock:
+            state = self._state()
+            if state["ordered"] is None:
+                state["ordered"] = [
+                    state["entries"][waitlist_id]
+                    for _, _, waitlist_id in sorted(state["queue"])
+                    if waitlist_id in state["entries"]
+                ]
+            return list(state["ordered"])
+
+    def best_fit(self, day: date, time: str, seats: int = None, engine: AvailabilityEngine = None) -> dict | None:
+        """
+        Returns the waiting party that best fits the free capacity around a freed slot.
+
+        Parties waiting for any time whose dining window overlaps the freed slot's
+        are considered, each at its requested time. Larger parties are preferred,
+        so the freed seats are filled as fully as possible, then parties whose
+        requested time is closest to the freed slot, then earlier arrivals. The
+        day's availability index is built once for all candidate times.
+
+        Parameters
+        ----------
+        day : date
+            The day of the freed slot.
+        time : str
+            The start time of the freed slot (HH:MM).
+        seats : int, optional
+            The largest party that may be seated (default is Waitlist.MAX_PARTY_SIZE).
+        engine : AvailabilityEngine, optional
+            The availability engine to use (default is a new AvailabilityEngine).
+
+        Returns
+        -------
+        dict | None
+            The waitlist entry, or None if no waiting party fits.
+        """
+        engine = engine or AvailabilityEngine(self.reservation_book)
+        freed = datetime.combine(day, datetime.strptime(time, "%H:%M").time())
+        window = timedelta(minutes=engine.dining_minutes)
+        low = (freed - window).strftime(ReservationBook.KEY_FORMAT)
+        high = (freed + window).strftime(ReservationBook.KEY_FORMAT)
+        limit = min(seats or Waitlist.MAX_PARTY_SIZE, Waitlist.MAX_PARTY_SIZE)
+
+        candidates = []
+        with Waitlist._lock:
+            state = self._state()
+            keys = state["slot_keys"]
+            for starts_at in keys[bisect_right(keys, low):bisect_left(keys, high)]:
+                if starts_at[:10] != day.isoformat():
+                    continue
+                for party_size, heap in state["slots"][starts_at].items():
+                    while heap and heap[0][1] not in state["entries"]:
+                        heapq.heappop(heap)
+                    if heap and party_size <= limit:
+                        candidates.append((party_size, starts_at, heap[0]))
+        if not candidates:
+            return None
+
+        largest = engine.largest_parties(day, sorted({starts_at[11:] for _, starts_at, _ in candidates}))
+        fitting = [candidate for candidate in candidates if candidate[0] <= largest[candidate[1][11:]]]
+        if not fitting:
+            return None
+        freed_key = freed.strftime(ReservationBook.KEY_FORMAT)
+        _, _, (_, waitlist_id) = min(fitting, key=lambda candidate: (
+            -candidate[0],
+            abs((datetime.strptime(candidate[1], ReservationBook.KEY_FORMAT) - freed).total_seconds()),
+            candidate[1] > freed_key,
+            candidate[2]
+        ))
+        with Waitlist._lock:
+            return self._state()["entries"].get(waitlist_id)
+
+    def promote(self, day: date, time: str, seats: int = None) -> dict | None:
+        """
+        Books the best-fitting waiting party for a slot and removes it from the queue.
+
+        The choice, the booking and the departure are made under an exclusive
+        lock on the waitlist, so promotions and departures in other processes
+        cannot book the same party twice. The booking is checked against the
+        capacity again by ReservationBook.add().
+
+        Parameters
+        ----------
+        day : date
+            The day of the freed slot.
+        time : str
+            The start time of the freed slot (HH:MM).
+        seats : int, optional
+            The largest party that may be seated (default is Waitlist.MAX_PARTY_SIZE).
+
+        Returns
+        -------
+        dict | None
+            The reservation that was made, or None if no waiting party fits.
+        """
+        engine = AvailabilityEngine(self.reservation_book)
+        with self._promote_lock():
+            entry = self.best_fit(day, time, seats, engine)
+            if entry is None:
+                return None
+
+            reservation = {
+                key: value for key, value in entry.items()
+                if key not in ("waitlist_id", "arrived_at", "starts_at")
+            }
+            reservation["reservation_id"] = str(uuid4())
+            try:
+                self.reservation_book.add(reservation, engine)
+            except ValueError:
+                return None
+            self._leave(entry["waitlist_id"])
+            return reservation
+
+    def estimated_wait(self, entry: dict, engine: AvailabilityEngine = None) -> int | None:
+        """
+        Estimates how many minutes after its requested time a party can be seated.
+
+        Parameters
+        ----------
+        entry : dict
+            The waitlist entry.
+        engine : AvailabilityEngine, optional
+            The availability engine to use (default is a new AvailabilityEngine).
+
+        Returns
+        -------
+        int | None
+            The minutes until the first free slot of the requested day, or None
+            if the party cannot be seated that day.
+        """
+        engine = engine or AvailabilityEngine(self.reservation_book)
+        requested = datetime.strptime(entry["starts_at"], ReservationBook.KEY_FORMAT)
+        for free_time in engine.free_slots(requested.date(), int(entry["party_size"])):
+            free_at = datetime.combine(requested.date(), datetime.strptime(free_time, "%H:%M").time())
+            if free_at >= requested:
+                return int((free_at - requested).total_seconds() // 60)
+        return None
+
+    def compact(self) -> int:
+        """
+        Rewrites the journal with only the parties still waiting for a future slot.
+
+        Returns
+        -------
+        int
+            The number of parties still waiting.
+        """
+        now = datetime.now().strftime(ReservationBook.KEY_FORMAT)
+        with self._promote_lock():
+            waiting = [
+                {"event": "join", "entry": entry}
+                for entry in self.queue() if entry["starts_at"] >= now
+            ]
+            DatabaseFactory.create(self.journal_path).write(waiting)
+        return len(waiting)
+
+    def _leave(self, waitlist_id: str) -> bool:
+        """
+        Removes a party from the waitlist while the promote lock is held.
+
+        Parameters
+        ----------
+        waitlist_id : str
+            The ID of the waitlist entry.
+
+        Returns
+        -------
+        bool
+            True if the party was waiting, False otherwise.
+        """
+        if waitlist_id not in self._state()["entries"]:
+            return False
+        DatabaseFactory.create(self.journal_path).append({"event": "leave", "waitlist_id": waitlist_id})
+        self._state()
+        return True
+
+    def _promote_lock(self) -> FileLock:
+        """
+        Creates the exclusive lock taken to promote or remove waiting parties.
+
+        Returns
+        -------
+        FileLock
+            The lock, to be used as a context manager.
+        """
+        return FileLock(f"{self.journal_path}.promote", True, Config.LOCK_TIMEOUT)
+
+    def _state(self) -> dict:
+        """
+        Returns the in-memory waitlist after replaying any new journal lines.
+
+        With the "sqlite" storage backend the journal is replayed in full.
+
+        Returns
+        -------
+        dict
+            The live "entries" keyed by waitlist_id, the "queue" heap, the
+            per-slot, per-party-size "slots" heaps, the sorted "slot_keys", the
+            number of "stale" heap entries and the cached "ordered" queue.
+        """
+        with Waitlist._lock:
+            if Config.STORAGE_BACKEND != "json":
+                state = self._empty_state(None)
+                for event in DatabaseFactory.create(self.journal_path).read():
+                    self._apply(state, event)
+                return state
+
+            Database(self.journal_path).migrate()
+            state = Waitlist._states.get(self.journal_path)
+            try:
+                file = open(self.journal_path, 'rb')
+            except FileNotFoundError:
+                Waitlist._states.pop(self.journal_path, None)
+                return self._empty_state(None)
+
+            with file:
+                inode = os.fstat(file.fileno()).st_ino
+                if state is None or state["inode"] != inode:
+                    state = self._empty_state(inode)
+                    Waitlist._states[self.journal_path] = state
+
+                file.seek(state["position"])
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    state["position"] += len(line)
+                    try:
+                        self._apply(state, json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+            return state
+
+    @staticmethod
+    def _empty_state(inode: int | None) -> dict:
+        """
+        Creates an empty in-memory waitlist.
+
+        Parameters
+        ----------
+        inode : int | None
+            The inode of the journal file the state is read from.
+
+        Returns
+        -------
+        dict
+            The empty state.
+        """
+        return {
+            "inode": inode, "position": 0, "entries": {}, "queue": [], "slots": {}, "slot_keys": [],
+            "stale": 0, "ordered": None
+        }
+
+    @staticmethod
+    def _apply(state: dict, event: dict) -> None:
+        """
+        Applies a journal event to the in-memory waitlist.
+
+        Departed entries stay in the heaps until they reach the top, or until they
+        outnumber the waiting parties, when the heaps are rebuilt.
+
+        Parameters
+        ----------
+        state : dict
+            The in-memory waitlist.
+        event : dict
+            The "join" or "leave" event.
+        """
+        if event.get("event") == "join":
+            entry = event["entry"]
+            waitlist_id = entry["waitlist_id"]
+            state["entries"][waitlist_id] = entry
+            heapq.heappush(state["queue"], (entry["starts_at"], entry["arrived_at"], waitlist_id))
+            if entry["starts_at"] not in state["slots"]:
+                state["slots"][entry["starts_at"]] = {}
+                insort(state["slot_keys"], entry["starts_at"])
+            heapq.heappush(
+                state["slots"][entry["starts_at"]].setdefault(int(entry["party_size"]), []),
+                (entry["arrived_at"], waitlist_id)
+            )
+            state["ordered"] = None
+        elif event.get("event") == "leave" and state["entries"].pop(event["waitlist_id"], None) is not None:
+            state["stale"] += 1
+            state["ordered"] = None
+            if state["stale"] > len(state["entries"]):
+                Waitlist._rebuild_heaps(state)
+
+    @staticmethod
+    def _rebuild_heaps(state: dict) -> None:
+        """
+        Rebuilds the heaps of the in-memory waitlist from the waiting parties only.
+
+        Parameters
+        ----------
+        state : dict
+            The in-memory waitlist.
+        """
+        state["queue"] = [item for item in state["queue"] if item[2] in state["entries"]]
+        heapq.heapify(state["queue"])
+        for starts_at in list(state["slots"]):
+            slot = {}
+            for party_size, heap in state["slots"][starts_at].items():
+                heap = [item for item in heap if item[1] in state["entries"]]
+                if heap:
+                    heapq.heapify(heap)
+                    slot[party_size] = heap
+            if slot:
+                state["slots"][starts_at] = slot
+            else:
+                del state["slots"][starts_at]
+        state["slot_keys"] = sorted(state["slots"])
+        state["stale"] = 0
@@ -0,0 +1,98 @@
+from datetime import datetime
+from tabulate import tabulate
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.ReservationBook import ReservationBook
+from classes.Validator import Validator
+from classes.Waitlist import Waitlist
+
+
+class WaitlistHandler:
+    """
+    A class to handle waitlist-related operations.
+
+    Methods
+    -------
+    display_queue() -> None:
+        Displays the waiting parties with their estimated wait times.
+    handle_cancellation(reservation: dict) -> str:
+        Cancels a reservation and promotes the best-fitting waiting party.
+    handle_table_freed() -> str:
+        Prompts for a freed slot and promotes the best-fitting waiting party.
+    """
+
+    @staticmethod
+    def display_queue() -> None:
+        """
+        Displays the waiting parties with their estimated wait times.
+        """
+        waitlist = Waitlist()
+        queue = waitlist.queue()
+        if not queue:
+            print("No parties are waiting.")
+            return
+
+        engine = AvailabilityEngine(waitlist.reservation_book)
+        table_data = []
+        for position, entry in enumerate(queue, start=1):
+            wait = waitlist.estimated_wait(entry, engine)
+            table_data.append([
+                position,
+                entry['date'],
+                entry['time'],
+                entry['name'],
+                entry['mobile_number'],
+                entry['party_size'],
+                entry['arrived_at'][:19],
+                "Fully booked" if wait is None else f"{wait} min"
+            ])
+
+        headers = ["#", "Date", "Time", "Name", "Mobile Number", "Party Size", "Waiting Since", "Estimated Wait"]
+        print(tabulate(table_data, headers, tablefmt="grid"))
+
+    @staticmethod
+    def handle_cancellation(reservation: dict) -> str:
+        """
+        Cancels a reservation and promotes the best-fitting waiting party.
+
+        Parameters
+        ----------
+        reservation : dict
+            The reservation to cancel.
+
+        Returns
+        -------
+        str
+            A message describing the result.
+        """
+        waitlist = Waitlist()
+        if not waitlist.reservation_book.cancel(reservation):
+            return "Reservation not found."
+
+        starts_at = datetime.strptime(ReservationBook.starts_at(reservation), ReservationBook.KEY_FORMAT)
+        promoted = waitlist.promote(starts_at.date(), starts_at.strftime("%H:%M"), int(reservation['party_size']))
+        if promoted:
+            return f"Reservation Cancelled. {promoted['name']} (party of {promoted['party_size']}) was booked from the waitlist."
+        return "Reservation Cancelled."
+
+    @staticmethod
+    def handle_table_freed() -> str:
+        """
+        Prompts for a freed slot and promotes the best-fitting waiting party.
+
+        Returns
+        -------
+        str
+            A message describing the result.
+        """
+        on_date = input("Date (DD/MM/YYYY) or [E] Exit: ")
+        if on_date.lower() == 'e':
+            return ""
+        time = input("Time (HH:MM): ")
+        seats = input("Seats Freed: ")
+        if not (Validator.validate_date(on_date) and Validator.validate_time(time) and seats.isdigit()):
+            return "Please enter a valid date, time and number of seats."
+
+        promoted = Waitlist().promote(datetime.strptime(on_date, "%d/%m/%Y").date(), time, int(seats))
+        if promoted:
+            return f"{promoted['name']} (party of {promoted['party_size']}) was booked from the waitlist."
+        return "No waiting party fits the freed table."
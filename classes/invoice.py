@@ -1,5 +1,9 @@
 from classes.Payment import Payment
-from classes.Database import Database
+from classes.CommitQueue import CommitQueue
+from classes.KitchenQueue import KitchenQueue
+from classes.OrderHistory import OrderHistory
+from classes.SalesRollup import SalesRollup
+from classes.TicketCounter import TicketCounter
 from datetime import datetime
 
 
@@ -7,24 +11,35 @@ class Invoice:
     """
     A class to represent an invoice.
 
+    Creating an invoice commits its order: the order is queued on the shared
+    commit queue, whose background writer sends batches of orders to the KDS
+    spool and stores them in the order history and sales rollups together.
+    Depending on Config.COMMIT_DURABILITY the constructor returns once the order
+    is on disk or as soon as it is queued.
+
     Attributes
     ----------
     order_data : dict
         A dictionary containing the order details.
+    commit_sequence : int
+        The sequence number of the order on the commit queue, or None for an
+        invoice rebuilt from a stored order.
 
     Methods
     -------
-    __init__(payment: Payment):
+    __init__(payment: Payment, wait: bool = True):
         Constructs all the necessary attributes for the Invoice object and initializes the order data.
+    from_order_data(order_data: dict) -> Invoice:
+        Rebuilds the invoice of a stored order, e.g. to reprint its receipt.
     display_invoice() -> None:
         Displays the invoice details.
-    send_to_kds() -> None:
-        Sends the order data to the kitchen display system (KDS).
-    update_order_history() -> None:
-        Updates the order history in the database.
+    commit_orders(orders: list, progress: dict = None) -> None:
+        Sends a batch of orders to the KDS and stores them in the order history.
     """
 
-    def __init__(self, payment: Payment):
+    commit_queue = CommitQueue(lambda orders, progress: Invoice.commit_orders(orders, progress))
+
+    def __init__(self, payment: Payment, wait: bool = True):
         """
         Constructs all the necessary attributes for the Invoice object and initializes the order data.
 
@@ -32,10 +47,21 @@ class Invoice:
         ----------
         payment : Payment
             An instance of the Payment class containing the payment details.
+        wait : bool, optional
+            Whether to wait in "fsync" mode until the order is committed (default
+            is True). Otherwise the caller confirms the commit_sequence later.
+
+        Raises
+        ------
+        TimeoutError
+            If in "fsync" mode the order could not be committed in time. It stays
+            queued and is committed once storage is available.
         """
+        now = datetime.now()
         self.order_data = {
-            "date_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date_time": now.strftime("%Y-%m-%d %H:%M:%S"),
             "order_id": payment.order.order_id,
+            "ticket_number": TicketCounter.next(now.date()),
             "order_type": payment.order.order_type,
             "items": [
                 {
@@ -73,8 +99,29 @@ class Invoice:
         elif payment.order.order_type == "Dine-In":
             self.order_data["table_number"] = payment.order.table_number
 
-        self.send_to_kds()
-        self.update_order_history()
+        self.commit_sequence = Invoice.commit_queue.submit(self.order_data, wait)
+
+    @classmethod
+    def from_order_data(cls, order_data: dict) -> 'Invoice':
+        """
+        Rebuilds the invoice of a stored order, e.g. to reprint its receipt.
+
+        The order is not sent to the KDS or written to the order history again.
+
+        Parameters
+        ----------
+        order_data : dict
+            The stored order record.
+
+        Returns
+        -------
+        Invoice
+            The invoice of the order.
+        """
+        invoice = cls.__new__(cls)
+        invoice.order_data = order_data
+        invoice.commit_sequence = None
+        return invoice
 
     def display_invoice(self) -> None:
         """
@@ -82,6 +129,8 @@ class Invoice:
         """
         print(f"Date Time: {self.order_data['date_time']}")
         print(f"Order ID: {self.order_data['order_id']}")
+        if self.order_data.get("ticket_number"):
+            print(f"Ticket Number: {self.order_data['ticket_number']}")
         print(f"Order Type: {self.order_data['order_type']}\n")
         print("Items:")
         for i, item in enumerate(self.order_data["items"], start=1):
@@ -104,18 +153,26 @@ class Invoice:
             print(f"\nTable Number: {self.order_data['table_number']}")
         print(f"\nNote: {self.order_data['payment_info']['note']}")
         print(f"\n[SYSTEM] A copy of your receipt has been sent to your email")
-        input("\nPress ENTER to continue")
 
-    def send_to_kds(self) -> None:
-        """
-        Sends the order data to the kitchen display system (KDS).
+    @staticmethod
+    def commit_orders(orders: list, progress: dict = None) -> None:
         """
-        db = Database(f"./invoices/{self.order_data['order_id']}.txt")
-        db.write(self.order_data)
+        Sends a batch of orders to the KDS and stores them in the order history.
 
-    def update_order_history(self) -> None:
-        """
-        Updates the order history in the database.
+        The tickets are appended to the KDS spool, and the orders to the history
+        and the daily sales rollups, with one write per file for the whole batch.
+        Completed steps are recorded in progress, so when the commit queue
+        retries a failed batch no ticket or order is written twice.
+
+        Parameters
+        ----------
+        orders : list
+            The order records to be committed, in checkout order.
+        progress : dict, optional
+            The steps already completed for this batch, updated in place.
         """
-        db = Database("./order_history.json")
-        db.append(self.order_data)
\ No newline at end of file
+        progress = {} if progress is None else progress
+        if "kds" not in progress:
+            progress["kds"] = KitchenQueue().publish_many(orders)
+        OrderHistory().append_many(orders, progress.setdefault("history", {}))
+        SalesRollup().record_many(orders)
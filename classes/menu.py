@@ -1,4 +1,9 @@
-from classes.Database import Database
+import re
+import threading
+from bisect import bisect_left
+from classes.ApiClient import ApiClient
+from classes.Config import Config
+from classes.DatabaseFactory import DatabaseFactory
 from classes.MenuItem import MenuItem
 
 
@@ -6,12 +11,24 @@ class Menu:
     """
     A class to represent the menu using the Singleton pattern.
 
+    When the menu is loaded, it is indexed by item id, by category and by the
+    words of each item's name, description and category, so looking up an item,
+    listing a category and searching the menu never scan the menu items.
+
+    The instance is created under a lock and only published once it is fully
+    loaded, and a reload builds the new menu aside and swaps it in at once, so
+    threads never see a partly loaded menu.
+
     Attributes
     ----------
     _instance : Menu
         A single instance of the Menu class.
     menu_items : list
         A list of MenuItem objects representing the items in the menu.
+    items_by_id : dict
+        The menu items keyed by item id.
+    items_by_category : dict
+        The menu items of each category, in menu order.
 
     Methods
     -------
@@ -19,15 +36,26 @@ class Menu:
         Creates and returns a single instance of the Menu class.
     load_menu() -> None:
         Loads the menu items from the database.
+    reload() -> None:
+        Reloads the menu items, e.g. after the menu file was changed.
     __len__() -> int:
         Returns the number of items in the menu.
     __getitem__(index: int) -> MenuItem:
         Returns the menu item at the specified index.
-    display_menu() -> None:
+    get(item_id: int) -> MenuItem | None:
+        Returns the menu item with the specified id.
+    categories() -> list:
+        Returns the menu categories in menu order.
+    in_category(category: str) -> list:
+        Returns the menu items of a category.
+    search(query: str, category: str = None) -> list:
+        Returns the menu items matching every word of a search query.
+    display_menu(items: list = None) -> None:
         Displays the menu items.
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> 'Menu':
         """
@@ -39,17 +67,45 @@ class Menu:
             A single instance of the Menu class.
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.menu_items = []
-            cls._instance.load_menu()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._reset()
+                    instance.load_menu()
+                    cls._instance = instance
         return cls._instance
 
+    def reload(self) -> None:
+        """
+        Reloads the menu items, e.g. after the menu file was changed.
+        """
+        fresh = object.__new__(Menu)
+        fresh._reset()
+        fresh.load_menu()
+        with Menu._lock:
+            self.__dict__.update(fresh.__dict__)
+
+    def _reset(self) -> None:
+        """
+        Empties the menu items and indexes.
+        """
+        self.menu_items = []
+        self.items_by_id = {}
+        self.items_by_category = {}
+        self._positions = {}
+        self._tokens = {}
+        self._sorted_tokens = []
+
     def load_menu(self) -> None:
         """
-        Loads the menu items from the database.
+        Loads the menu items from the database and builds the menu indexes.
+
+        When Config.SERVER_URL is set, the menu is loaded from the API server.
         """
-        db = Database("./menu.json")
-        menu_data = db.read()
+        if Config.SERVER_URL:
+            menu_data = ApiClient().menu_items()
+        else:
+            menu_data = DatabaseFactory.create("./menu.json").read()
         for item_data in menu_data:
             if item_data['availability'] and item_data['active']:
                 item = MenuItem(
@@ -61,7 +117,9 @@ class Menu:
                     item_data['availability'],
                     item_data['active']
                 )
+                self._index(item)
                 self.menu_items.append(item)
+        self._sorted_tokens = sorted(self._tokens)
 
     def __len__(self) -> int:
         """
@@ -90,10 +148,125 @@ class Menu:
         """
         return self.menu_items[index]
 
-    def display_menu(self) -> None:
+    def get(self, item_id: int) -> MenuItem | None:
+        """
+        Returns the menu item with the specified id.
+
+        Parameters
+        ----------
+        item_id : int
+            The id of the menu item.
+
+        Returns
+        -------
+        MenuItem | None
+            The menu item, or None if no item on the menu has that id.
+        """
+        return self.items_by_id.get(item_id)
+
+    def categories(self) -> list:
+        """
+        Returns the menu categories in menu order.
+
+        Returns
+        -------
+        list
+            The category names.
+        """
+        return list(self.items_by_category)
+
+    def in_category(self, category: str) -> list:
+        """
+        Returns the menu items of a category.
+
+        Parameters
+        ----------
+        category : str
+            The category name.
+
+        Returns
+        -------
+        list
+            The menu items of the category in menu order.
+        """
+        return list(self.items_by_category.get(category, []))
+
+    def search(self, query: str, category: str = None) -> list:
+        """
+        Returns the menu items matching every word of a search query.
+
+        A word matches an item when it is the start of a word in the item's name,
+        description or category, so "spag" finds "Spaghetti Bolognese".
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        category : str, optional
+            The category to search in (default is every category).
+
+        Returns
+        -------
+        list
+            The matching menu items in menu order.
+        """
+        item_ids = None
+        for word in self._words(query):
+            matches = set()
+            position = bisect_left(self._sorted_tokens, word)
+            while position < len(self._sorted_tokens) and self._sorted_tokens[position].startswith(word):
+                matches |= self._tokens[self._sorted_tokens[position]]
+                position += 1
+            item_ids = matches if item_ids is None else item_ids & matches
+            if not item_ids:
+                return []
+
+        if item_ids is None:
+            return self.in_category(category) if category else list(self.menu_items)
+        items = sorted((self.items_by_id[item_id] for item_id in item_ids), key=lambda item: self._positions[item.id])
+        return [item for item in items if category is None or item.category == category]
+
+    def display_menu(self, items: list = None) -> None:
         """
         Displays the menu items.
+
+        Parameters
+        ----------
+        items : list, optional
+            The menu items to display (default is the whole menu).
         """
-        for index, item in enumerate(self.menu_items, start=1):
-            print(f"{index}. \033[1m{item.name}\033[0m - ${item.price:.2f}\n")
+        for item in self.menu_items if items is None else items:
+            print(f"{item.id}. \033[1m{item.name}\033[0m - ${item.price:.2f}\n")
             print(f"      \x1B[3m{item.description}\x1B[0m\n")
+
+    def _index(self, item: MenuItem) -> None:
+        """
+        Adds a menu item to the id, category and word indexes.
+
+        Parameters
+        ----------
+        item : MenuItem
+            The menu item.
+        """
+        self.items_by_id[item.id] = item
+        self.items_by_category.setdefault(item.category, []).append(item)
+        self._positions[item.id] = len(self.menu_items)
+        for word in self._words(f"{item.name} {item.description} {item.category}"):
+            self._tokens.setdefault(word, set()).add(item.id)
+
+    @staticmethod
+    def _words(text: str) -> list:
+        """
+        Splits text into lowercase words for the search index.
+
+        Parameters
+        ----------
+        text : str
+            The text to split.
+
+        Returns
+        -------
+        list
+            The words.
+        """
+        return re.findall(r"[a-z0-9]+", text.lower())
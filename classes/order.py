@@ -1,33 +1,44 @@
 from classes.Menu import Menu
 from classes.OrderItem import OrderItem
-from uuid import uuid4
+from classes.OrderId import OrderId
 
 
 class Order:
     """
     A class to represent an order.
 
+    The order lines are kept in a dictionary keyed by menu item id, and the
+    subtotal is kept as a running total in integer cents that every cart
+    operation updates, so adding, removing and changing the quantity of an item
+    take constant time and the totals never need to be recalculated.
+
     Attributes
     ----------
     menu : Menu
         An instance of the Menu class representing the menu.
     order_id : str
-        The unique identifier for the order.
-    order_items : list
-        A list of OrderItem objects representing the items in the order.
-    subtotal : float
-        The subtotal amount of the order.
-    order_total : float
-        The total amount of the order, including any additional fees.
+        The unique, time-ordered identifier for the order.
+    items : dict
+        The OrderItem objects in the order, keyed by menu item id in the order they were added.
+    subtotal_cents : int
+        The subtotal amount of the order in cents.
 
     Methods
     -------
     __init__(menu: Menu):
         Constructs all the necessary attributes for the Order object.
-    add_item(item_index: int, quantity: int) -> None:
+    order_items -> list:
+        The OrderItem objects in the order, in the order they were added.
+    subtotal -> float:
+        The subtotal amount of the order.
+    order_total -> float:
+        The total amount of the order, including any additional fees.
+    add_item(item_id: int, quantity: int) -> None:
         Adds an item to the order.
-    calculate_totals() -> None:
-        Calculates the subtotal and total amounts for the order.
+    remove_item(item_id: int, quantity: int = None) -> None:
+        Removes some or all of an item from the order.
+    set_quantity(item_id: int, quantity: int) -> None:
+        Sets the quantity of an item in the order.
     display_order() -> str:
         Displays the order details.
     """
@@ -42,40 +53,144 @@ class Order:
             An instance of the Menu class representing the menu.
         """
         self.menu = menu
-        self.order_id = str(uuid4())
-        self.order_items = []
-        self.subtotal = 0
-        self.order_total = 0
+        self.order_id = OrderId.new()
+        self.items = {}
+        self.subtotal_cents = 0
+
+    @property
+    def order_items(self) -> list:
+        """
+        The OrderItem objects in the order, in the order they were added.
+
+        Returns
+        -------
+        list
+            The order items.
+        """
+        return list(self.items.values())
+
+    @property
+    def subtotal(self) -> float:
+        """
+        The subtotal amount of the order.
 
-    def add_item(self, item_index: int, quantity: int) -> None:
+        Returns
+        -------
+        float
+            The subtotal in dollars.
+        """
+        return self.subtotal_cents / 100
+
+    @property
+    def order_total(self) -> float:
+        """
+        The total amount of the order, including any additional fees.
+
+        Returns
+        -------
+        float
+            The total in dollars.
+        """
+        return (self.subtotal_cents + round(getattr(self, 'delivery_fee', 0) * 100)) / 100
+
+    def add_item(self, item_id: int, quantity: int) -> None:
         """
         Adds an item to the order.
 
         Parameters
         ----------
-        item_index : int
-            The index of the item in the menu to be added to the order.
+        item_id : int
+            The menu item id of the item to be added to the order.
         quantity : int
             The quantity of the item to be added.
+
+        Raises
+        ------
+        ValueError
+            If no item on the menu has that id.
         """
-        menu_item = self.menu[item_index - 1]
-        order_item = next((item for item in self.order_items if item.menu_item == menu_item), None)
-        if order_item:
-            order_item.quantity += quantity
+        menu_item = self.menu.get(item_id)
+        if menu_item is None:
+            raise ValueError(f"Menu item {item_id} is not on the menu.")
+        order_item = self.items.get(menu_item.id)
+        if order_item is None:
+            self.items[menu_item.id] = OrderItem(menu_item, quantity)
         else:
-            self.order_items.append(OrderItem(menu_item, quantity))
+            order_item.quantity += quantity
+        self.subtotal_cents += OrderItem.to_cents(menu_item.price) * quantity
 
-    def calculate_totals(self) -> None:
+    def remove_item(self, item_id: int, quantity: int = None) -> None:
         """
-        Calculates the subtotal and total amounts for the order.
+        Removes some or all of an item from the order.
+
+        Parameters
+        ----------
+        item_id : int
+            The menu item id of the item to be removed.
+        quantity : int, optional
+            The quantity to remove (default is all of it).
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the order or the quantity is not between 1 and
+            the quantity ordered.
         """
-        self.subtotal = sum(item.calculate_total_price() for item in self.order_items)
-        self.order_total = self.subtotal
-        if hasattr(self, 'order_type') and self.order_type == "Delivery":
-            self.order_total += self.delivery_fee
+        order_item = self._order_item(item_id)
+        if quantity is None:
+            quantity = order_item.quantity
+        if not 1 <= quantity <= order_item.quantity:
+            raise ValueError(f"Quantity must be between 1 and {order_item.quantity}.")
+        self.set_quantity(item_id, order_item.quantity - quantity)
+
+    def set_quantity(self, item_id: int, quantity: int) -> None:
+        """
+        Sets the quantity of an item in the order.
+
+        Parameters
+        ----------
+        item_id : int
+            The menu item id of the item.
+        quantity : int
+            The new quantity, or 0 to remove the item.
 
-        self.subtotal = round(self.subtotal, 2)
-        self.order_total = round(self.order_total, 2)
+        Raises
+        ------
+        ValueError
+            If the item is not in the order or the quantity is negative.
+        """
+        order_item = self._order_item(item_id)
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative.")
+        self.subtotal_cents += order_item.price_cents * (quantity - order_item.quantity)
+        if quantity == 0:
+            del self.items[item_id]
+        else:
+            order_item.quantity = quantity
+
+    def _order_item(self, item_id: int) -> OrderItem:
+        """
+        Returns the order line of a menu item.
+
+        Parameters
+        ----------
+        item_id : int
+            The menu item id.
+
+        Returns
+        -------
+        OrderItem
+            The order line.
+
+        Raises
+        ------
+        ValueError
+            If the item is not in the order.
+        """
+        order_item = self.items.get(item_id)
+        if order_item is None:
+            raise ValueError(f"Menu item {item_id} is not in the order.")
+        return order_item
 
     def display_order(self) -> str:
         """
@@ -89,16 +204,14 @@ class Order:
         print(f"Order Type: {self.order_type}\n")
         print(f"Order ID: {self.order_id}\n")
         
-        if self.order_items:
+        if self.items:
             print("Your Order:")
-            for i, order_item in enumerate(self.order_items, start=1):
+            for i, order_item in enumerate(self.items.values(), start=1):
                 item_total = order_item.calculate_total_price()
                 print(f"\n{i}. {order_item.menu_item.name} - {order_item.quantity} x ${order_item.menu_item.price:.2f} = ${item_total:.2f}")
         else:
             print("Your order is empty.")
 
-        self.calculate_totals()
-
         if hasattr(self, 'order_type') and self.order_type == "Delivery":
             print(f"\nDelivery Fee: ${self.delivery_fee:.2f}")
 
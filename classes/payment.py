@@ -1,6 +1,7 @@
 from classes.SystemUtils import SystemUtils
 from classes.Order import Order
 from classes.Validator import Validator
+from classes.TableLayout import TableLayout
 
 
 class Payment:
@@ -28,12 +29,46 @@ class Payment:
     -------
     enter_payment_details() -> None:
         Prompts the user to enter payment details.
+    required_details() -> list:
+        Returns the details needed to pay for the order, in the order they are entered.
+    missing_details() -> list:
+        Returns the required details that have not been entered yet.
+    get_detail(field: str) -> str:
+        Returns an entered payment, contact, address or table detail.
+    set_detail(field: str, value: str) -> None:
+        Validates and stores a payment, contact, address or table detail.
     finalize_payment() -> bool:
         Finalizes the payment process.
     is_payment_info_complete() -> bool:
         Checks if the payment information is complete.
     """
 
+    CARD_FIELDS = ["card_number", "expiration_date", "cvv", "cardholder_name"]
+    CONTACT_FIELDS = ["name", "mobile_number", "email"]
+    ADDRESS_FIELDS = ["address", "suburb", "postal_code"]
+    DETAILS = {
+        "card_number": ("Card Number", Validator.validate_card_number, None, "Invalid Input. Card number invalid."),
+        "expiration_date": ("Expiration Date (MM/YY)", Validator.validate_expiration_date, None, "Invalid Input. Date invalid."),
+        "cvv": ("CVV", Validator.validate_cvv, None, "Invalid Input. CVV invalid."),
+        "cardholder_name": (
+            "Cardholder Name", Validator.validate_name, lambda value: ' '.join(value.title().split()),
+            "Invalid Input. Name must contain only letters and spaces."
+        ),
+        "name": (
+            "Name", Validator.validate_name, lambda value: ' '.join(value.title().split()),
+            "Invalid Input. Name must contain only letters and spaces."
+        ),
+        "mobile_number": (
+            "Mobile Number", Validator.validate_mobile_number, None,
+            "Invalid Input. Mobile number must start with 04 and only contain 10 digits."
+        ),
+        "email": ("Email", Validator.validate_email, None, "Invalid Input. Email must be valid."),
+        "address": ("Address", str.strip, lambda value: value.strip().title(), "Invalid Input. Address cannot be empty."),
+        "suburb": ("Suburb", str.strip, lambda value: value.strip().title(), "Invalid Input. Suburb cannot be empty."),
+        "postal_code": ("Postal Code", Validator.validate_postal_code, None, "Invalid Input. Postal code must be 4 digits."),
+        "table_number": ("Table Number", None, None, "Invalid Input. Please enter a valid table number ({first}-{last}).")
+    }
+
     def __init__(self, order: Order):
         """
         Constructs all the necessary attributes for the Payment object.
@@ -66,146 +101,103 @@ class Payment:
             print("Complete your order. Enter [E] to Exit Anytime.:\n")
             self.message = SystemUtils.display_message(self.message)
 
-            print("Payment Method:")
+            section = None
+            for field, label, heading in self.required_details():
+                if heading != section:
+                    print(heading)
+                    section = heading
+                if self.get_detail(field):
+                    print(f"{label}: {self.get_detail(field)}")
+                    continue
 
-            if not self.card_number:
-                temp = input("Card Number: ")
+                temp = input(f"{label}: ")
                 if temp.lower() == 'e':
                     return False
-                if Validator.validate_card_number(temp):
-                    self.card_number = temp
-                else:
-                    self.message = "Invalid Input. Card number invalid."
-                continue
-            else:
-                print(f"Card Number: {self.card_number}")
+                try:
+                    self.set_detail(field, temp)
+                except ValueError as error:
+                    self.message = str(error)
+                break
 
-            if not self.expiration_date:
-                temp = input("Expiration Date (MM/YY): ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_expiration_date(temp):
-                    self.expiration_date = temp
-                else:
-                    self.message = "Invalid Input. Date invalid."
-                continue
-            else:
-                print(f"Expiration Date: {self.expiration_date}")
+        self.note = input("Note (if any): ")
+        return True
 
-            if not self.cvv:
-                temp = input("CVV: ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_cvv(temp):
-                    self.cvv = temp
-                else:
-                    self.message = "Invalid Input. CVV invalid."
-                continue
-            else:
-                print(f"CVV: {self.cvv}")
+    def required_details(self) -> list:
+        """
+        Returns the details needed to pay for the order, in the order they are entered.
 
-            if not self.cardholder_name:
-                temp = input("Cardholder Name: ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_name(temp):
-                    self.cardholder_name = ' '.join(temp.title().split())
-                else:
-                    self.message = "Invalid Input. Name must contain only letters and spaces."
-                continue
-            else:
-                print(f"Cardholder Name: {self.cardholder_name}")
+        Returns
+        -------
+        list
+            (field, label, heading) tuples.
+        """
+        details = [(field, Payment.DETAILS[field][0], "Payment Method:") for field in Payment.CARD_FIELDS]
+        if self.order.order_type in ['Takeaway', 'Delivery']:
+            fields = Payment.CONTACT_FIELDS
+            if self.order.order_type == "Delivery":
+                fields = fields + Payment.ADDRESS_FIELDS
+            details += [(field, Payment.DETAILS[field][0], "\nContact Information") for field in fields]
+        else:
+            details.append(("table_number", Payment.DETAILS["table_number"][0], "\nTable Information:"))
+        return details
 
-            if self.order.order_type in ['Takeaway', 'Delivery']:
-                print("\nContact Information")
-                if not self.order.name:
-                    temp = input("Name: ")
-                    if temp.lower() == 'e':
-                        return False
-                    if Validator.validate_name(temp):
-                        self.order.name = ' '.join(temp.title().split())
-                    else:
-                        self.message = "Invalid Input. Name must contain only letters and spaces."
-                    continue
-                else:
-                    print(f"Name: {self.order.name}")
-
-                if not self.order.mobile_number:
-                    temp = input("Mobile Number: ")
-                    if temp.lower() == 'e':
-                        return False
-                    if Validator.validate_mobile_number(temp):
-                        self.order.mobile_number = temp
-                    else:
-                        self.message = "Invalid Input. Mobile number must start with 04 and only contain 10 digits."
-                    continue
-                else:
-                    print(f"Mobile Number: {self.order.mobile_number}")
-
-                if not self.order.email:
-                    temp = input("Email: ")
-                    if temp.lower() == 'e':
-                        return False
-                    if Validator.validate_email(temp):
-                        self.order.email = temp
-                    else:
-                        self.message = "Invalid Input. Email must be valid."
-                    continue
-                else:
-                    print(f"Email: {self.order.email}")
+    def missing_details(self) -> list:
+        """
+        Returns the required details that have not been entered yet.
 
-                if self.order.order_type == "Delivery":
-                    if not self.order.address:
-                        temp = input("Address: ")
-                        if temp.lower() == 'e':
-                            return False
-                        if temp.strip():
-                            self.order.address = temp.strip().title()
-                        else:
-                            self.message = "Invalid Input. Address cannot be empty."
-                        continue
-                    else:
-                        print(f"Address: {self.order.address}")
-
-                    if not self.order.suburb:
-                        temp = input("Suburb: ")
-                        if temp.lower() == 'e':
-                            return False
-                        if temp.strip():
-                            self.order.suburb = temp.strip().title()
-                        else:
-                            self.message = "Invalid Input. Suburb cannot be empty."
-                        continue
-                    else:
-                        print(f"Suburb: {self.order.suburb}")
-
-                    if not self.order.postal_code:
-                        temp = input("Postal Code: ")
-                        if temp.lower() == 'e':
-                            return False
-                        if Validator.validate_postal_code(temp):
-                            self.order.postal_code = temp
-                        else:
-                            self.message = "Invalid Input. Postal code must be 4 digits."
-                        continue
-                    else:
-                        print(f"Postal Code: {self.order.postal_code}")
-            else:
-                print("\nTable Information:")
-                if not self.order.table_number:
-                    temp = input("Table Number: ")
-                    if temp.lower() == 'e':
-                        return False
-                    if Validator.validate_table_number(temp):
-                        self.order.table_number = temp
-                    else:
-                        self.message = "Invalid Input. Please enter a valid table number (1-100)."
-                    continue
-                else:
-                    print(f"Table Number: {self.order.table_number}")
+        Returns
+        -------
+        list
+            The field names.
+        """
+        return [field for field, _, _ in self.required_details() if not self.get_detail(field)]
 
-        self.note = input("Note (if any): ")
-        return True
+    def get_detail(self, field: str) -> str:
+        """
+        Returns an entered payment, contact, address or table detail.
+
+        Parameters
+        ----------
+        field : str
+            The field name, e.g. "card_number" or "table_number".
+
+        Returns
+        -------
+        str
+            The entered value, or an empty string.
+        """
+        target = self if field in Payment.CARD_FIELDS else self.order
+        return getattr(target, field, "")
+
+    def set_detail(self, field: str, value: str) -> None:
+        """
+        Validates and stores a payment, contact, address or table detail.
+
+        Card details are stored on the payment and the other details on the order.
+
+        Parameters
+        ----------
+        field : str
+            The field name, e.g. "card_number" or "table_number".
+        value : str
+            The value entered.
+
+        Raises
+        ------
+        ValueError
+            If the field is unknown or the value is invalid, with a message for the user.
+        """
+        if field not in Payment.DETAILS:
+            raise ValueError(f"Unknown payment detail: {field}.")
+        _, validate, normalize, message = Payment.DETAILS[field]
+        if field == "table_number":
+            table_ids = TableLayout().table_ids()
+            if not Validator.validate_table_number(value, table_ids):
+                raise ValueError(message.format(first=table_ids[0], last=table_ids[-1]))
+        elif not validate(value):
+            raise ValueError(message)
+        target = self if field in Payment.CARD_FIELDS else self.order
+        setattr(target, field, normalize(value) if normalize else value)
 
     def finalize_payment(self) -> bool:
         """
@@ -265,19 +257,4 @@ class Payment:
         bool
             True if payment information is complete, False otherwise.
         """
-        if self.order.order_type == "Delivery":
-            return all([
-                self.card_number, self.expiration_date, self.cvv, self.cardholder_name,
-                self.order.name, self.order.mobile_number, self.order.email,
-                self.order.address, self.order.suburb, self.order.postal_code
-            ])
-        elif self.order.order_type == "Takeaway":
-            return all([
-                self.card_number, self.expiration_date, self.cvv, self.cardholder_name,
-                self.order.name, self.order.mobile_number, self.order.email
-            ])
-        else:
-            return all([
-                self.card_number, self.expiration_date, self.cvv, self.cardholder_name,
-                self.order.table_number
-            ])
\ No newline at end of file
+        return not self.missing_details()
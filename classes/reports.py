@@ -1,7 +1,13 @@
-from classes.Database import Database
+from classes.OrderHistory import OrderHistory
+from classes.SalesRollup import SalesRollup
+from classes.SalesSummary import SalesSummary
+from classes.DemandHeatmap import DemandHeatmap
+from classes.ReportExecutor import ReportExecutor
+from classes.ReservationBook import ReservationBook
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.TableAssigner import TableAssigner
 from datetime import datetime
 from tabulate import tabulate
-from collections import Counter
 
 class Reports:
     """
@@ -9,10 +15,14 @@ class Reports:
 
     Attributes
     ----------
-    order_history_file : str
-        The file path for the order history data.
-    reservations_file : str
-        The file path for the reservations data.
+    order_history : OrderHistory
+        The day-sharded order history data.
+    sales_rollup : SalesRollup
+        The materialized daily sales totals.
+    report_executor : ReportExecutor
+        The executor that builds date-range aggregates, in parallel when large.
+    reservation_book : ReservationBook
+        The date and time ordered reservations.
 
     Methods
     -------
@@ -20,49 +30,54 @@ class Reports:
         Displays the sales report from specified date.
     display_menuitems() -> None:
         Displays the sold menu item report from specified date.
-    display_reservations() -> None:
-        Displays the reservations report.
+    display_item_quantities(items: dict, on_date: str) -> None:
+        Displays the total sold quantity of each menu item.
+    summarize_sales(from_date: str, to_date: str) -> SalesSummary:
+        Aggregates the sales between two dates in a single pass.
+    display_sales_range(from_date: str, to_date: str) -> None:
+        Displays the sales report between two dates.
+    display_sales_summary(summary: SalesSummary, from_date: str, to_date: str) -> None:
+        Displays a sales summary with a daily breakdown and totals per order type and item.
+    summarize_demand(from_date: str, to_date: str) -> DemandHeatmap:
+        Buckets the orders between two dates by weekday and hour in a single pass.
+    display_heatmap(from_date: str, to_date: str, measure: str) -> None:
+        Displays the weekday by hour peak demand heatmap between two dates.
+    refresh_analytics() -> int:
+        Rebuilds the columnar analytics store from the order history.
+    display_analytics(from_date: str, to_date: str) -> None:
+        Displays the sales analytics between two dates from the columnar store.
+    display_reservations(on_date: str = None) -> None:
+        Displays the upcoming reservations, or those on a specified date.
+    display_reservation_table(sorted_reservations: list) -> None:
+        Displays reservations as a numbered table.
+    display_free_slots(on_date: str, party_size: int = 2) -> None:
+        Displays the times on a specified date at which a party can still be seated.
+    assign_tables(on_date: str) -> None:
+        Assigns tables to the reservations on a specified date and displays the result.
     """
 
     def __init__(self):
         """
         Constructs all the necessary attributes for the Reports object.
         """
-        self.order_history_file = "./order_history.json"
-        self.reservations_file = "./reservations.json"
+        self.order_history = OrderHistory()
+        self.sales_rollup = SalesRollup(self.order_history)
+        self.report_executor = ReportExecutor(order_history=self.order_history)
+        self.reservation_book = ReservationBook()
 
     def display_sales(self, on_date: str) -> None:
         """
         Displays the sales report on specified date.
         """
-        db = Database(self.order_history_file)
-        sales = db.read()
-
-        if not sales:
-            print("No sales found.")
-            return
-
-        for sale in sales:
-            sale['datetime'] = datetime.strptime(sale['date_time'], "%Y-%m-%d %H:%M:%S")
-
-        sorted_sales = sorted(sales, key=lambda x: x['datetime'])
-
         on_date_dt = datetime.strptime(on_date, "%d/%m/%Y").date()
+        sales = self.order_history.read_day(on_date_dt)
 
-        # logic to show data only if it equals to input date
-        filtered_sales = []
-        for sale in sales:
-            sale_datetime = datetime.strptime(sale['date_time'], "%Y-%m-%d %H:%M:%S")
-            sale_date = sale_datetime.date()
-            if sale_date == on_date_dt:
-                sale['datetime'] = sale_datetime
-                filtered_sales.append(sale)
-
-        if not filtered_sales:
+        if not sales:
             print(f"No sales found on {on_date}.")
             return
 
-        sorted_sales = sorted(filtered_sales, key=lambda x: x['datetime'])
+        # date_time is stored as "YYYY-MM-DD HH:MM:SS", so it sorts chronologically
+        sorted_sales = sorted(sales, key=lambda x: x['date_time'])
 
         table_data = []
         for sale in sorted_sales:
@@ -84,73 +99,284 @@ class Reports:
 
         print(tabulate(table_data, headers, tablefmt="grid"))
 
+        rollup = self.sales_rollup.read_day(on_date_dt)
+        summary_data = [
+            [order_type, totals['order_count'], f"${totals['revenue']:.2f}"]
+            for order_type, totals in rollup['order_types'].items()
+        ]
+        summary_data.append(["Total", rollup['order_count'], f"${rollup['revenue']:.2f}"])
+        print(f"\nDelivery Fees: ${rollup['delivery_fee_total']:.2f}")
+        print(tabulate(summary_data, ["Order Type", "Orders", "Revenue"], tablefmt="grid"))
+
     def display_menuitems(self, on_date: str) -> None:
         """
         Displays the total sold quantity of each menu item ordered from specific date
         """
-        db = Database(self.order_history_file)
-        sales = db.read()
+        on_date_dt = datetime.strptime(on_date, "%d/%m/%Y").date()
+        Reports.display_item_quantities(self.sales_rollup.read_day(on_date_dt)['items'], on_date)
 
-        if not sales:
-            print("No sales found.")
-            return
+    @staticmethod
+    def display_item_quantities(items: dict, on_date: str) -> None:
+        """
+        Displays the total sold quantity of each menu item.
 
-        item_counter = Counter()
-        on_date_dt = datetime.strptime(on_date, "%d/%m/%Y").date()
-        
-        for sale in sales:
-            sale_date = datetime.strptime(sale['date_time'], "%Y-%m-%d %H:%M:%S").date()
-            if sale_date == on_date_dt:
-                for item in sale['items']:
-                    item_counter[item['name']] += item['quantity']
-
-        if not item_counter:
+        Parameters
+        ----------
+        items : dict
+            The name and quantity per menu item id, from a rollup or SalesSummary.
+        on_date : str
+            The date the items were sold on (DD/MM/YYYY).
+        """
+        if not items:
             print("No menu items sold on " + on_date)
             return
 
         table_data = [
-            [item_name, quantity]
-            for item_name, quantity in item_counter.items()
+            [totals['name'], totals['quantity']]
+            for totals in items.values()
         ]
 
         headers = ["Item Name", "Quantity Ordered"]
 
         print(tabulate(table_data, headers, tablefmt="grid"))
 
-    def display_reservations(self) -> None:
+    def summarize_sales(self, from_date: str, to_date: str) -> SalesSummary:
         """
-        Displays the reservations report.
+        Aggregates the sales between two dates in a single pass.
+
+        The orders are streamed from the day shards in the range, so only the
+        running totals are held in memory. Large ranges are split across worker
+        processes and the partial totals merged.
+
+        Parameters
+        ----------
+        from_date : str
+            The first day to include (DD/MM/YYYY).
+        to_date : str
+            The last day to include (DD/MM/YYYY).
+
+        Returns
+        -------
+        SalesSummary
+            The aggregated sales.
         """
-        db = Database(self.reservations_file)
-        reservations = db.read()
+        return self.report_executor.run(
+            SalesSummary,
+            datetime.strptime(from_date, "%d/%m/%Y").date(),
+            datetime.strptime(to_date, "%d/%m/%Y").date()
+        )
 
-        if not reservations:
-            print("No reservations found.")
+    def display_sales_range(self, from_date: str, to_date: str) -> None:
+        """
+        Displays the sales report between two dates, with a daily breakdown and
+        totals per order type and per menu item.
+        """
+        Reports.display_sales_summary(self.summarize_sales(from_date, to_date), from_date, to_date)
+
+    @staticmethod
+    def display_sales_summary(summary: SalesSummary, from_date: str, to_date: str) -> None:
+        """
+        Displays a sales summary with a daily breakdown and totals per order type
+        and per menu item.
+
+        Parameters
+        ----------
+        summary : SalesSummary
+            The summary, e.g. built locally or returned by the API server.
+        from_date : str
+            The first day of the summary (DD/MM/YYYY).
+        to_date : str
+            The last day of the summary (DD/MM/YYYY).
+        """
+        if not summary.order_count:
+            print(f"No sales found from {from_date} to {to_date}.")
+            return
+
+        daily_data = [
+            [datetime.strptime(day, "%Y-%m-%d").strftime("%d/%m/%Y"), totals['order_count'], f"${totals['revenue']:.2f}"]
+            for day, totals in sorted(summary.days.items())
+        ]
+        print(tabulate(daily_data, ["Date", "Orders", "Revenue"], tablefmt="grid"))
+
+        order_type_data = [
+            [order_type, totals['order_count'], f"${totals['revenue']:.2f}"]
+            for order_type, totals in summary.order_types.items()
+        ]
+        print(tabulate(order_type_data, ["Order Type", "Orders", "Revenue"], tablefmt="grid"))
+
+        item_data = [
+            [totals['name'], totals['quantity'], f"${totals['revenue']:.2f}"]
+            for totals in sorted(summary.items.values(), key=lambda x: x['quantity'], reverse=True)
+        ]
+        print(tabulate(item_data, ["Item Name", "Quantity Ordered", "Revenue"], tablefmt="grid"))
+
+        print(f"\nTotal Orders: {summary.order_count}")
+        print(f"Delivery Fees: ${summary.delivery_fee_total:.2f}")
+        print(f"Total Revenue: ${summary.revenue:.2f}")
+
+    def summarize_demand(self, from_date: str, to_date: str) -> DemandHeatmap:
+        """
+        Buckets the orders between two dates by weekday and hour in a single pass.
+
+        Parameters
+        ----------
+        from_date : str
+            The first day to include (DD/MM/YYYY).
+        to_date : str
+            The last day to include (DD/MM/YYYY).
+
+        Returns
+        -------
+        DemandHeatmap
+            The orders and item quantities per order type, weekday and hour.
+        """
+        return self.report_executor.run(
+            DemandHeatmap,
+            datetime.strptime(from_date, "%d/%m/%Y").date(),
+            datetime.strptime(to_date, "%d/%m/%Y").date()
+        )
+
+    def display_heatmap(self, from_date: str, to_date: str, measure: str) -> None:
+        """
+        Displays the weekday by hour peak demand heatmap between two dates, for all
+        orders and for each order type. The measure is "orders" or "quantities".
+        """
+        heatmap = self.summarize_demand(from_date, to_date)
+        grid = heatmap.grid(measure)
+
+        if not any(any(row) for row in grid):
+            print(f"No sales found from {from_date} to {to_date}.")
             return
 
-        current_datetime = datetime.now()
+        # always show opening hours, plus any hour with orders outside them
+        hours = [
+            hour for hour in range(DemandHeatmap.HOURS)
+            if 9 <= hour <= 21 or any(row[hour] for row in grid)
+        ]
+        headers = ["Day"] + [f"{hour:02d}" for hour in hours]
+        for order_type in [None] + DemandHeatmap.ORDER_TYPES:
+            type_grid = grid if order_type is None else heatmap.grid(measure, order_type)
+            table_data = [
+                [weekday] + [row[hour] or "" for hour in hours]
+                for weekday, row in zip(DemandHeatmap.WEEKDAYS, type_grid)
+            ]
+            print(f"\n{order_type or 'All Orders'} ({'Orders' if measure == 'orders' else 'Items'} per Hour)")
+            print(tabulate(table_data, headers, tablefmt="grid"))
 
-        for reservation in reservations:
-            reservation['datetime'] = datetime.strptime(
-                f"{reservation['date']} {reservation['time']}", "%d/%m/%Y %H:%M"
-            )
+    def refresh_analytics(self) -> int:
+        """
+        Rebuilds the columnar analytics store from the order history. Requires NumPy.
+        """
+        from classes.AnalyticsStore import AnalyticsStore
 
-        future_reservations = [r for r in reservations if r['datetime'] >= current_datetime]
+        return AnalyticsStore().refresh(self.order_history)
 
-        sorted_reservations = sorted(future_reservations, key=lambda x: x['datetime'])
+    def display_analytics(self, from_date: str, to_date: str) -> None:
+        """
+        Displays the sales analytics between two dates from the columnar store,
+        grouped by day, order type, menu item and hour of day. Requires NumPy.
+        """
+        from classes.AnalyticsStore import AnalyticsStore
+
+        store = AnalyticsStore()
+        columns = store.select(
+            datetime.strptime(from_date, "%d/%m/%Y").date(),
+            datetime.strptime(to_date, "%d/%m/%Y").date()
+        )
+
+        if not len(columns['timestamp']):
+            print(f"No analytics found from {from_date} to {to_date}. Refresh the analytics store first.")
+            return
+
+        days, day_cents = AnalyticsStore.group_by(columns, "day")
+        daily_data = [
+            [AnalyticsStore.day_to_date(day).strftime("%d/%m/%Y"), f"${cents / 100:.2f}"]
+            for day, cents in zip(days, day_cents)
+        ]
+        print(tabulate(daily_data, ["Date", "Item Revenue"], tablefmt="grid"))
+
+        order_types, order_type_cents = AnalyticsStore.group_by(columns, "order_type")
+        order_type_data = [
+            [AnalyticsStore.ORDER_TYPES[code] if code >= 0 else "Other", f"${cents / 100:.2f}"]
+            for code, cents in zip(order_types, order_type_cents)
+        ]
+        print(tabulate(order_type_data, ["Order Type", "Item Revenue"], tablefmt="grid"))
+
+        names = store.item_names()
+        item_ids, quantities = AnalyticsStore.group_by(columns, "item_id", "quantity")
+        _, item_cents = AnalyticsStore.group_by(columns, "item_id")
+        item_data = [
+            [names.get(int(item_id), f"Item {item_id}"), quantity, f"${cents / 100:.2f}"]
+            for item_id, quantity, cents in zip(item_ids, quantities, item_cents)
+        ]
+        print(tabulate(item_data, ["Item Name", "Quantity Ordered", "Revenue"], tablefmt="grid"))
+
+        hours, hour_quantities = AnalyticsStore.group_by(columns, "hour", "quantity")
+        hour_data = [[f"{hour:02d}:00", quantity] for hour, quantity in zip(hours, hour_quantities)]
+        print(tabulate(hour_data, ["Hour", "Items Ordered"], tablefmt="grid"))
+
+    def display_reservations(self, on_date: str = None) -> None:
+        """
+        Displays the upcoming reservations, or those on a specified date.
+        """
+        if on_date:
+            sorted_reservations = self.reservation_book.on_date(datetime.strptime(on_date, "%d/%m/%Y").date())
+        else:
+            sorted_reservations = self.reservation_book.upcoming()
+        Reports.display_reservation_table(sorted_reservations)
+
+    @staticmethod
+    def display_reservation_table(sorted_reservations: list) -> None:
+        """
+        Displays reservations as a numbered table.
+
+        Parameters
+        ----------
+        sorted_reservations : list
+            The reservations in date and time order.
+        """
+        if not sorted_reservations:
+            print("No reservations found.")
+            return
 
         table_data = []
-        for reservation in sorted_reservations:
+        for number, reservation in enumerate(sorted_reservations, start=1):
             table_data.append([
+                number,
                 reservation['date'],
                 reservation['time'],
                 reservation['name'],
                 reservation['mobile_number'],
                 reservation['email'],
                 reservation['party_size'],
+                ", ".join(str(table_id) for table_id in reservation.get('tables') or []) or "-",
                 reservation['accommodations'] if reservation['accommodations'] else "None"
             ])
 
-        headers = ["Date", "Time", "Name", "Mobile Number", "Email", "Party Size", "Accommodations"]
+        headers = ["#", "Date", "Time", "Name", "Mobile Number", "Email", "Party Size", "Tables", "Accommodations"]
 
-        print(tabulate(table_data, headers, tablefmt="grid"))
\ No newline at end of file
+        print(tabulate(table_data, headers, tablefmt="grid"))
+
+    def display_free_slots(self, on_date: str, party_size: int = 2) -> None:
+        """
+        Displays the times on a specified date at which a party can still be seated.
+        """
+        free_slots = AvailabilityEngine(self.reservation_book).free_slots(
+            datetime.strptime(on_date, "%d/%m/%Y").date(), party_size
+        )
+        if free_slots:
+            print(f"\nFree times for a party of {party_size} on {on_date}: {', '.join(free_slots)}")
+        else:
+            print(f"\nNo free times for a party of {party_size} on {on_date}.")
+
+    def assign_tables(self, on_date: str) -> None:
+        """
+        Assigns tables to the reservations on a specified date and displays the result.
+        """
+        summary = TableAssigner(reservation_book=self.reservation_book).assign_day(
+            datetime.strptime(on_date, "%d/%m/%Y").date()
+        )
+        print(
+            f"\nSeated {summary['seated']} parties ({summary['covers']} covers) with "
+            f"{summary['wasted_seats']} empty seats. {summary['unseated']} parties could not be seated."
+        )
@@ -1,5 +1,11 @@
+from datetime import datetime
+from uuid import uuid4
 from classes.SystemUtils import SystemUtils
-from classes.Database import Database
+from classes.ApiClient import ApiClient
+from classes.Config import Config
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.ReservationBook import ReservationBook
+from classes.Waitlist import Waitlist
 from classes.Validator import Validator
 
 
@@ -25,17 +31,38 @@ class Reservation:
         The size of the party for the reservation.
     accommodations : str
         Any additional accommodations for the reservation.
+    full_time : str
+        The last requested time that was fully booked.
+    waitlist : bool
+        True if the party joins the waitlist for full_time instead of booking.
 
     Methods
     -------
     enter_reservation_details() -> bool:
         Prompts the user to enter reservation details.
+    missing_details() -> list:
+        Returns the required details that have not been entered yet.
+    set_detail(field: str, value: str) -> None:
+        Validates and stores a reservation detail.
+    join_waitlist() -> None:
+        Switches the reservation to a waitlist entry for the last fully booked time.
+    check_availability() -> str:
+        Checks the requested slot against capacity and clears the time if it is full.
     confirm_reservation() -> str:
         Confirms the reservation details with the user.
-    make_reservation() -> None:
-        Saves the reservation details to the database.
+    make_reservation() -> dict:
+        Saves the reservation details to the database, or adds the party to the waitlist.
     """
 
+    FIELDS = [
+        ("date", "Date (DD/MM/YYYY)"),
+        ("time", "Time (HH:MM)"),
+        ("name", "Name"),
+        ("mobile_number", "Mobile Number"),
+        ("email", "Email"),
+        ("party_size", "Party Size (1-20)")
+    ]
+
     def __init__(self):
         """
         Constructs all the necessary attributes for the Reservation object.
@@ -48,6 +75,8 @@ class Reservation:
         self.email = ""
         self.party_size = ""
         self.accommodations = ""
+        self.full_time = ""
+        self.waitlist = False
 
     def enter_reservation_details(self) -> bool:
         """
@@ -58,86 +87,121 @@ class Reservation:
         bool
             True if reservation details are successfully entered, False if the process is exited.
         """
-        while not (self.date and self.time and self.name and self.mobile_number and self.email and self.party_size):
+        while self.missing_details():
             SystemUtils.clear_screen()
             SystemUtils.heading("RESERVATION")
             print("Make a Reservation. Enter [E] to Exit Anytime.\n")
             self.message = SystemUtils.display_message(self.message)
 
-            if not self.date:
-                temp = input("Date (DD/MM/YYYY): ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_future_date(temp):
-                    self.date = temp
-                else:
-                    self.message = "Please enter a valid date in the future in DD/MM/YYYY format."
-                continue
-            else:
-                print(f"Date (DD/MM/YYYY): {self.date}")
+            for field, label in Reservation.FIELDS:
+                if getattr(self, field):
+                    print(f"{label}: {getattr(self, field)}")
+                    continue
 
-            if not self.time:
-                temp = input("Time (HH:MM): ")
+                offer_waitlist = field == "time" and self.full_time
+                temp = input(f"{label} or [W] Join Waitlist for {self.full_time}: " if offer_waitlist else f"{label}: ")
                 if temp.lower() == 'e':
                     return False
-                if Validator.validate_time(temp):
-                    self.time = temp
-                else:
-                    self.message = "Please enter a time between opening hours (09:00 - 21:00)."
-                continue
-            else:
-                print(f"Time (HH:MM): {self.time}")
+                if offer_waitlist and temp.lower() == 'w':
+                    self.join_waitlist()
+                    self.message = ""
+                    break
+                try:
+                    self.set_detail(field, temp)
+                except ValueError as error:
+                    self.message = str(error)
+                    break
+                if field in ("time", "party_size") and self.time and self.party_size:
+                    self.message = self.check_availability()
+                break
 
-            if not self.name:
-                temp = input("Name: ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_name(temp):
-                    self.name = ' '.join(temp.title().split())
-                else:
-                    self.message = "Please enter a valid name."
-                continue
-            else:
-                print(f"Name: {self.name}")
+        self.accommodations = input("Accommodations (optional): ")
+        return True
 
-            if not self.mobile_number:
-                temp = input("Mobile Number: ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_mobile_number(temp):
-                    self.mobile_number = temp
-                else:
-                    self.message = "Please enter a valid mobile number starting with 04."
-                continue
-            else:
-                print(f"Mobile Number: {self.mobile_number}")
+    def missing_details(self) -> list:
+        """
+        Returns the required details that have not been entered yet.
 
-            if not self.email:
-                temp = input("Email: ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_email(temp):
-                    self.email = temp
-                else:
-                    self.message = "Please enter a valid email address."
-                continue
-            else:
-                print(f"Email: {self.email}")
+        Returns
+        -------
+        list
+            The field names.
+        """
+        return [field for field, _ in Reservation.FIELDS if not getattr(self, field)]
 
-            if not self.party_size:
-                temp = input("Party Size (1-20): ")
-                if temp.lower() == 'e':
-                    return False
-                if Validator.validate_party_size(temp):
-                    self.party_size = int(temp)
-                else:
-                    self.message = "Please enter a valid party size (1-20)."
-                continue
-            else:
-                print(f"Party Size (1-20): {self.party_size}")
+    def set_detail(self, field: str, value: str) -> None:
+        """
+        Validates and stores a reservation detail.
 
-        self.accommodations = input("Accommodations (optional): ")
-        return True
+        Parameters
+        ----------
+        field : str
+            The field name, e.g. "date" or "party_size".
+        value : str
+            The value entered.
+
+        Raises
+        ------
+        ValueError
+            If the field is unknown or the value is invalid, with a message for the user.
+        """
+        if field == "accommodations":
+            self.accommodations = value
+        elif field == "date":
+            if not Validator.validate_future_date(value):
+                raise ValueError("Please enter a valid date in the future in DD/MM/YYYY format.")
+            self.date = value
+        elif field == "time":
+            if not Validator.validate_time(value):
+                raise ValueError("Please enter a time between opening hours (09:00 - 21:00).")
+            self.time = value
+        elif field == "name":
+            if not Validator.validate_name(value):
+                raise ValueError("Please enter a valid name.")
+            self.name = ' '.join(value.title().split())
+        elif field == "mobile_number":
+            if not Validator.validate_mobile_number(value):
+                raise ValueError("Please enter a valid mobile number starting with 04.")
+            self.mobile_number = value
+        elif field == "email":
+            if not Validator.validate_email(value):
+                raise ValueError("Please enter a valid email address.")
+            self.email = value
+        elif field == "party_size":
+            if not Validator.validate_party_size(str(value)):
+                raise ValueError("Please enter a valid party size (1-20).")
+            self.party_size = int(value)
+        else:
+            raise ValueError(f"Unknown reservation detail: {field}.")
+
+    def join_waitlist(self) -> None:
+        """
+        Switches the reservation to a waitlist entry for the last fully booked time.
+        """
+        self.time = self.full_time
+        self.waitlist = True
+
+    def check_availability(self) -> str:
+        """
+        Checks the requested slot against capacity and clears the time if it is full.
+
+        Returns
+        -------
+        str
+            A message suggesting alternative times if the slot is full, otherwise
+            an empty string.
+        """
+        engine = ApiClient() if Config.SERVER_URL else AvailabilityEngine()
+        day = datetime.strptime(self.date, "%d/%m/%Y").date()
+        if engine.is_available(day, self.time, self.party_size):
+            return ""
+
+        suggestions = engine.suggest(day, self.time, self.party_size)
+        self.full_time = self.time
+        self.time = ""
+        if suggestions:
+            return f"{self.full_time} is fully booked for {self.party_size}. Available times: {', '.join(suggestions)}."
+        return f"{day.strftime('%d/%m/%Y')} is fully booked for {self.party_size}. Please join the waitlist or enter [E] to exit."
 
     def confirm_reservation(self) -> str:
         """
@@ -152,7 +216,10 @@ class Reservation:
             SystemUtils.clear_screen()
             SystemUtils.heading("RESERVATION")
             self.message = SystemUtils.display_message(self.message)
-            print("Reservation Confirmation. Please ensure that all details are correct.\n")
+            if self.waitlist:
+                print("Waitlist Confirmation. You will be booked if a table frees up.\n")
+            else:
+                print("Reservation Confirmation. Please ensure that all details are correct.\n")
             print(f"Date (DD/MM/YYYY): {self.date}")
             print(f"Time (HH:MM): {self.time}")
             print(f"Name: {self.name}")
@@ -162,19 +229,28 @@ class Reservation:
             print(f"Accommodations (optional): {self.accommodations}")
             user_input = input("\nSelect [C] Confirm Reservation or [E] Exit: ").lower()
             if user_input == 'c':
-                self.make_reservation()
-                return "Reservation Created."
+                try:
+                    self.make_reservation()
+                except (ValueError, ConnectionError) as error:
+                    self.message = f"Reservation Failed. {error}"
+                    continue
+                return "Added to Waitlist." if self.waitlist else "Reservation Created."
             elif user_input == 'e':
                 return "Reservation Cancelled."
             else:
                 self.message = "Invalid Input. Please try again."
 
-    def make_reservation(self) -> None:
+    def make_reservation(self) -> dict:
         """
-        Saves the reservation details to the database.
-        """
-        db = Database("./reservations.json")
+        Saves the reservation details to the database, or adds the party to the waitlist.
+
+        When Config.SERVER_URL is set, the reservation is made on the API server.
 
+        Returns
+        -------
+        dict
+            The stored reservation or waitlist entry.
+        """
         new_reservation = {
             "date": self.date,
             "time": self.time,
@@ -185,4 +261,11 @@ class Reservation:
             "accommodations": self.accommodations
         }
 
-        db.append(new_reservation)
\ No newline at end of file
+        if Config.SERVER_URL:
+            client = ApiClient()
+            return client.join_waitlist(new_reservation) if self.waitlist else client.reserve(new_reservation)
+        if self.waitlist:
+            return Waitlist().join(new_reservation)
+        new_reservation["reservation_id"] = str(uuid4())
+        ReservationBook().add(new_reservation)
+        return new_reservation
\ No newline at end of file
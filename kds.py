@@ -0,0 +1,16 @@
+import sys
+from classes.KitchenConsumer import KitchenConsumer
+from classes.KitchenDisplay import KitchenDisplay
+
+if __name__ == '__main__':
+    """
+    Shows the open kitchen tickets and bumps them when they are cooked.
+
+    Each named display keeps its own committed offset, e.g. one for the grill
+    and one for the pass.
+
+    Usage:
+        python kds.py [name]
+    """
+    name = sys.argv[1] if len(sys.argv) > 1 else "kitchen"
+    KitchenDisplay(KitchenConsumer(name)).run()
@@ -0,0 +1,60 @@
+import sys
+from classes.Config import Config
+from classes.OrderHistory import OrderHistory
+from classes.ReservationBook import ReservationBook
+from classes.Waitlist import Waitlist
+from classes.CustomerIndex import CustomerIndex
+from classes.SalesRollup import SalesRollup
+from classes.SQLiteDatabase import SQLiteDatabase
+
+DATA_FILES = ["./menu.json", "./tables.json", "./reservations.jsonl", "./reservations_archive.jsonl"]
+
+if __name__ == '__main__':
+    """
+    Migrates the data files to a newer storage layout.
+
+    Usage:
+        python migrate.py shards                 Splits the legacy order history into day shards.
+        python migrate.py index                  Rebuilds the order history index.
+        python migrate.py rollups                Rebuilds the daily sales rollups.
+        python migrate.py analytics              Refreshes the columnar analytics store.
+        python migrate.py customers              Rebuilds the customer index.
+        python migrate.py archive                Moves past reservations into the archive and compacts the waitlist.
+        python migrate.py sqlite [database path] Imports the JSON data files into SQLite.
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "shards":
+        count = OrderHistory("json").split_legacy()
+        print(f"[SYSTEM] Moved {count} orders into {OrderHistory.SHARD_DIR}")
+    elif command == "index":
+        count = OrderHistory("json").rebuild_index()
+        print(f"[SYSTEM] Indexed {count} orders")
+    elif command == "rollups":
+        count = SalesRollup().rebuild()
+        print(f"[SYSTEM] Rebuilt sales rollups for {count} days")
+    elif command == "analytics":
+        from classes.AnalyticsStore import AnalyticsStore
+        count = AnalyticsStore().refresh()
+        print(f"[SYSTEM] Exported {count} order lines into {AnalyticsStore.ANALYTICS_DIR}")
+    elif command == "customers":
+        reservations = [
+            dict(reservation, starts_at=ReservationBook.starts_at(reservation))
+            for reservation in ReservationBook().between()
+        ]
+        count = CustomerIndex().rebuild(OrderHistory().iter_orders(), reservations)
+        print(f"[SYSTEM] Indexed {count} customer contacts")
+    elif command == "archive":
+        count = ReservationBook().archive()
+        print(f"[SYSTEM] Archived {count} past reservations into {ReservationBook.ARCHIVE_PATH}")
+        count = Waitlist().compact()
+        print(f"[SYSTEM] Compacted the waitlist to {count} waiting parties")
+    elif command == "sqlite":
+        db_path = sys.argv[2] if len(sys.argv) > 2 else Config.SQLITE_PATH
+        for file_path in DATA_FILES:
+            count = SQLiteDatabase.import_json(file_path, db_path)
+            print(f"[SYSTEM] Imported {count} records from {file_path} into {db_path}")
+        orders = list(OrderHistory("json").iter_orders())
+        SQLiteDatabase(OrderHistory.LEGACY_PATH, db_path).write(orders)
+        print(f"[SYSTEM] Imported {len(orders)} orders into {db_path}")
+    else:
+        print("Usage: python migrate.py shards | index | rollups | analytics | customers | archive | sqlite [database path]")
@@ -0,0 +1,15 @@
+import sys
+from classes.ApiServer import ApiServer
+
+if __name__ == '__main__':
+    """
+    Serves the restaurant system over a local HTTP/JSON API.
+
+    Terminals run main.py with RIS_SERVER_URL set to the server's URL to use it
+    instead of their own copy of the data files.
+
+    Usage:
+        python server.py [port]
+    """
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    ApiServer(port=port).run()
@@ -0,0 +1,37 @@
+import os
+import shutil
+import pytest
+from classes.CustomerIndex import CustomerIndex
+from classes.Database import Database
+from classes.Menu import Menu
+from classes.OrderIndex import OrderIndex
+from classes.ReservationBook import ReservationBook
+from classes.SQLiteDatabase import SQLiteDatabase
+from classes.TicketCounter import TicketCounter
+from classes.Waitlist import Waitlist
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILES = ["menu.json", "tables.json"]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """
+    Runs a test in an empty data directory holding a copy of the menu and tables.
+
+    The data files are opened through relative paths, so the per-path caches of
+    the storage classes are cleared as well.
+    """
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(REPO_DIR, name), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    Database.clear_cache()
+    Menu._instance = None
+    for states in (OrderIndex._states, CustomerIndex._states, Waitlist._states, ReservationBook._indexes,
+                   ReservationBook._archived_on):
+        states.clear()
+    SQLiteDatabase._initialized.clear()
+    TicketCounter._block = {}
+    yield tmp_path
+    Database.clear_cache()
+    Menu._instance = None
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from classes.ApiServer import ApiServer
+from classes.CommitQueue import CommitQueue
+from classes.Invoice import Invoice
+from classes.OrderHistory import OrderHistory
+from classes.PinValidator import PinValidator
+
+STAFF = {"x-staff-pin": PinValidator.PIN_CODE}
+
+
+def make_order() -> dict:
+    return {
+        "order_id": "order-1",
+        "date_time": datetime.now().strftime(OrderHistory.DATE_TIME_FORMAT),
+        "order_type": "Takeaway",
+        "subtotal": 8.99,
+        "order_total": 8.99,
+        "items": [{"id": 1, "name": "Caesar Salad", "quantity": 1, "total_price": 8.99}],
+        "payment_info": {"card_number": "4111111111111111"},
+        "contact_information": {"name": "Jo", "mobile_number": "0412345678", "email": "jo@example.com"}
+    }
+
+
+def test_order_lookup_requires_the_staff_pin(workdir):
+    OrderHistory().append(make_order())
+    server = ApiServer()
+    try:
+        status, payload = asyncio.run(server.dispatch("GET", "/orders/order-1", {}, {}, b""))
+        assert status == 401 and "payment_info" not in payload
+
+        status, payload = asyncio.run(server.dispatch("GET", "/orders/order-1", {}, STAFF, b""))
+        assert status == 200 and payload["order_id"] == "order-1"
+    finally:
+        server.storage_executor.shutdown()
+        server.report_executor.shutdown()
+
+
+def test_reports_do_not_wait_for_the_storage_thread(workdir):
+    OrderHistory().append(make_order())
+    server = ApiServer()
+    release = threading.Event()
+    server.storage_executor.submit(release.wait, 10)
+    today = datetime.now().strftime("%d/%m/%Y")
+    try:
+        status, payload = asyncio.run(asyncio.wait_for(
+            server.dispatch("GET", "/reports/sales", {"from": today, "to": today}, STAFF, b""), 5
+        ))
+        assert status == 200 and payload["order_count"] == 1
+    finally:
+        release.set()
+        server.storage_executor.shutdown()
+        server.report_executor.shutdown()
+
+
+def test_concurrent_orders_share_commit_batches(workdir, monkeypatch):
+    batches = []
+
+    def commit(orders, progress):
+        batches.append(len(orders))
+        time.sleep(0.02)
+        Invoice.commit_orders(orders, progress)
+
+    commit_queue = CommitQueue(commit, durability="fsync")
+    monkeypatch.setattr(Invoice, "commit_queue", commit_queue)
+    body = json.dumps({
+        "order_type": "Takeaway",
+        "items": {"1": 1},
+        "details": {
+            "card_number": "4111111111111111", "expiration_date": "12/40", "cvv": "123",
+            "cardholder_name": "Jo Lee", "name": "Jo Lee", "mobile_number": "0412345678", "email": "jo@example.com"
+        }
+    }).encode()
+    server = ApiServer()
+
+    async def place_orders():
+        return await asyncio.gather(*(server.dispatch("POST", "/orders", {}, {}, body) for _ in range(40)))
+
+    try:
+        responses = asyncio.run(place_orders())
+    finally:
+        server.storage_executor.shutdown()
+        server.report_executor.shutdown()
+        commit_queue.close()
+
+    assert [status for status, _ in responses] == [201] * 40
+    assert sum(batches) == 40
+    assert len(batches) < 40
+    assert len(list(OrderHistory().iter_orders())) == 40
@@ -0,0 +1,56 @@
+import random
+from datetime import date
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.Database import Database
+from classes.ReservationBook import ReservationBook
+from classes.TableAssigner import TableAssigner
+from classes.TableLayout import TableLayout
+
+
+def test_capacity_defaults_to_the_table_layout(workdir):
+    Database(TableLayout.LAYOUT_PATH).write([
+        {"id": 1, "seats": 2, "combinable_with": [2]},
+        {"id": 2, "seats": 4, "combinable_with": [1]},
+        {"id": 3, "seats": 6, "combinable_with": []}
+    ])
+
+    engine = AvailabilityEngine(ReservationBook("json"))
+
+    assert (engine.seats, engine.tables) == (12, 3)
+
+
+def test_full_slot_is_unavailable(workdir):
+    book = ReservationBook("json")
+    engine = AvailabilityEngine(book, TableLayout([
+        {"id": 1, "seats": 2, "combinable_with": [2]},
+        {"id": 2, "seats": 2, "combinable_with": [1]}
+    ]), dining_minutes=60)
+    book.add({
+        "date": "01/06/2030", "time": "18:00", "name": "Guest", "mobile_number": "0400000000",
+        "email": "guest@example.com", "party_size": 4, "accommodations": ""
+    }, engine)
+
+    assert not engine.is_available(date(2030, 6, 1), "18:30", 1)
+    assert engine.is_available(date(2030, 6, 1), "19:00", 4)
+    assert "18:00" not in engine.free_slots(date(2030, 6, 1), 1)
+
+
+def test_every_accepted_booking_is_seated(workdir):
+    for seed in range(1, 6):
+        random.seed(seed)
+        book = ReservationBook("json")
+        engine = AvailabilityEngine(book)
+        day = date(2030, 6, 1 + seed)
+        for number in range(40):
+            try:
+                book.add({
+                    "date": day.strftime("%d/%m/%Y"), "time": random.choice(["18:00", "18:30", "19:00", "19:30", "20:00"]),
+                    "name": "Guest", "mobile_number": f"04000000{number:02d}", "email": "guest@example.com",
+                    "party_size": random.randint(1, 10), "accommodations": ""
+                }, engine)
+            except ValueError:
+                pass
+
+        summary = TableAssigner(reservation_book=book).assign_day(day)
+        assert summary["seated"] > 0
+        assert summary["unseated"] == 0
@@ -0,0 +1,97 @@
+import threading
+from datetime import date
+import pytest
+from classes.CommitQueue import CommitQueue
+from classes.Invoice import Invoice
+from classes.KitchenQueue import KitchenQueue
+from classes.OrderHistory import OrderHistory
+from classes.OrderIndex import OrderIndex
+from classes.SalesRollup import SalesRollup
+
+DAY = date(2024, 5, 1)
+
+
+def make_order(number: int) -> dict:
+    return {
+        "order_id": f"order-{number}",
+        "date_time": f"{DAY.isoformat()} 12:00:0{number}",
+        "order_type": "Takeaway",
+        "order_total": 10.0,
+        "items": [{"id": 1, "name": "Burger", "quantity": 1, "total_price": 10.0}],
+        "payment_info": {"note": ""},
+        "contact_information": {"name": "Sam", "mobile_number": "0412345678", "email": "sam@example.com"}
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(CommitQueue, "RETRY_SECONDS", 0.01)
+
+
+def test_failed_batch_is_retried_with_its_progress(workdir):
+    calls = []
+
+    def commit(records, progress):
+        calls.append((list(records), dict(progress)))
+        if len(calls) == 1:
+            progress["first_step"] = True
+            raise OSError("disk full")
+
+    commit_queue = CommitQueue(commit, durability="enqueue")
+    for number in range(3):
+        commit_queue.submit(number)
+    assert commit_queue.flush(5)
+    commit_queue.close()
+
+    assert calls[1] == (calls[0][0], {"first_step": True})
+    assert sorted(record for records, _ in calls[1:] for record in records) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("failing", [
+    (OrderIndex, "add_many"),
+    (SalesRollup, "record_many"),
+])
+def test_retry_does_not_duplicate_orders_or_tickets(workdir, monkeypatch, failing):
+    owner, name = failing
+    original = getattr(owner, name)
+    failures = []
+
+    def fail_once(*args, **kwargs):
+        if not failures:
+            failures.append(True)
+            raise OSError("disk full")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, fail_once)
+    orders = [make_order(number) for number in range(1, 4)]
+    commit_queue = CommitQueue(Invoice.commit_orders, batch_size=10, durability="enqueue")
+    for order_data in orders:
+        commit_queue.submit(order_data)
+    assert commit_queue.flush(5)
+    commit_queue.close()
+
+    assert failures
+    history = OrderHistory("json")
+    assert [order_data["order_id"] for order_data in history.iter_orders()] == ["order-1", "order-2", "order-3"]
+    assert history.find("order-2")["order_id"] == "order-2"
+    assert KitchenQueue().last_sequence() == 3
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 3
+
+
+def test_fsync_submit_times_out_and_keeps_the_record(workdir):
+    release = threading.Event()
+    committed = []
+
+    def commit(records, progress):
+        release.wait(5)
+        committed.extend(records)
+
+    commit_queue = CommitQueue(commit, durability="fsync", timeout=0.05)
+    with pytest.raises(TimeoutError):
+        commit_queue.submit("order")
+    assert commit_queue.pending() == 1
+
+    release.set()
+    assert commit_queue.flush(5)
+    commit_queue.close()
+    assert committed == ["order"]
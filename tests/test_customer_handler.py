@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+from classes.CustomerHandler import CustomerHandler
+from classes.Menu import Menu
+from classes.OrderFactory import OrderFactory
+from classes.OrderHistory import OrderHistory
+from classes.ReservationBook import ReservationBook
+
+MOBILE = "0412345678"
+EMAIL = "jo@example.com"
+
+
+def make_order() -> dict:
+    return {
+        "order_id": "order-1",
+        "date_time": datetime.now().strftime(OrderHistory.DATE_TIME_FORMAT),
+        "order_type": "Delivery",
+        "subtotal": 8.99,
+        "order_total": 8.99,
+        "items": [{"id": 1, "name": "Caesar Salad", "quantity": 2, "total_price": 17.98}],
+        "contact_information": {"name": "Jo", "mobile_number": MOBILE, "email": EMAIL},
+        "delivery_address": {"address": "1 Main St", "suburb": "Carlton", "postal_code": "3053"}
+    }
+
+
+def test_bookings_need_both_mobile_and_email(workdir):
+    ReservationBook("json").add({
+        "reservation_id": "reservation-1",
+        "date": (datetime.now() + timedelta(days=7)).strftime("%d/%m/%Y"),
+        "time": "18:00", "name": "Jo", "mobile_number": MOBILE, "email": EMAIL,
+        "party_size": 2, "accommodations": ""
+    })
+
+    assert len(CustomerHandler.find_reservations(MOBILE, email="JO@example.com")) == 1
+    assert CustomerHandler.find_reservations(MOBILE, email="someone@example.com") == []
+
+
+def test_orders_need_both_mobile_and_email(workdir):
+    OrderHistory("json").append(make_order())
+
+    assert [order["order_id"] for order in CustomerHandler.find_orders(MOBILE, limit=1, email=EMAIL)] == ["order-1"]
+    assert CustomerHandler.find_orders(MOBILE, limit=1, email="someone@example.com") == []
+
+
+def test_reorder_copies_items_only(workdir):
+    order = OrderFactory.create_reorder(make_order(), Menu())
+
+    assert [(item.menu_item.id, item.quantity) for item in order.items.values()] == [(1, 2)]
+    assert order.mobile_number == ""
+    assert not getattr(order, "address", "")
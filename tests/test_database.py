@@ -0,0 +1,61 @@
+import copy
+import pickle
+import pytest
+from classes.Database import Database, FrozenDict
+
+
+def test_read_missing_file_returns_empty_tuple(workdir):
+    assert Database("./missing.json").read() == ()
+    assert Database("./missing.jsonl").read() == ()
+
+
+def test_read_returns_read_only_records(workdir):
+    Database("./records.json").write([{"id": 1, "tags": ["a"]}])
+    record = Database("./records.json").read()[0]
+
+    assert isinstance(record, FrozenDict)
+    with pytest.raises(TypeError):
+        record["id"] = 2
+    with pytest.raises(TypeError):
+        record |= {"id": 2}
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda data: pickle.loads(pickle.dumps(data))])
+def test_frozen_records_copy_to_plain_dicts(workdir, clone):
+    Database("./records.json").write([{"id": 1, "nested": {"name": "x"}}])
+    record = clone(Database("./records.json").read()[0])
+
+    assert type(record) is dict
+    assert record == {"id": 1, "nested": {"name": "x"}}
+    record["id"] = 2
+
+
+def test_journal_append_many_returns_line_locations(workdir):
+    database = Database("./records.jsonl")
+    database.append({"id": 0})
+    locations = database.append_many([{"id": 1}, {"id": 2}])
+
+    assert [database.read_at(offset, length) for offset, length in locations] == [{"id": 1}, {"id": 2}]
+    assert [record["id"] for record in database.read()] == [0, 1, 2]
+
+
+def test_update_is_applied_under_the_lock(workdir):
+    database = Database("./counter.json")
+    for _ in range(5):
+        database.update(lambda counter: {"value": (counter or {"value": 0})["value"] + 1})
+
+    assert database.read() == {"value": 5}
+
+
+def test_append_after_torn_line_keeps_the_new_record(workdir):
+    database = Database("./records.jsonl")
+    database.append_many([{"id": 1}, {"id": 2}])
+    with open("./records.jsonl", 'ab') as file:
+        file.write(b'{"id": 3, "na')
+
+    locations = database.append_many([{"id": 4}])
+
+    assert [record["id"] for record in database.read()] == [1, 2, 4]
+    assert database.read_at(*locations[0]) == {"id": 4}
+    with open("./records.jsonl", 'rb') as file:
+        assert file.read().endswith(b'\n')
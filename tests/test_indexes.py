@@ -0,0 +1,66 @@
+from datetime import date
+from classes.CustomerIndex import CustomerIndex
+from classes.Database import Database
+from classes.OrderHistory import OrderHistory
+from classes.OrderIndex import OrderIndex
+
+DAY = date(2024, 5, 1)
+
+
+def make_order(number: int, day: date = DAY, mobile_number: str = "0412345678") -> dict:
+    return {
+        "order_id": f"order-{number}",
+        "date_time": f"{day.isoformat()} 12:00:0{number % 10}",
+        "order_type": "Takeaway",
+        "order_total": 10.0,
+        "items": [{"id": 1, "name": "Burger", "quantity": 1, "total_price": 10.0}],
+        "contact_information": {"name": "Sam", "mobile_number": mobile_number, "email": "Sam@Example.com"}
+    }
+
+
+def test_order_index_finds_appended_orders(workdir):
+    history = OrderHistory("json")
+    history.append_many([make_order(1), make_order(2), make_order(3, date(2024, 5, 2))])
+
+    index = OrderIndex()
+    assert index.find("order-2")["order_id"] == "order-2"
+    assert index.find("order-9") is None
+    assert [order_data["order_id"] for order_data in index.orders_on(DAY)] == ["order-1", "order-2"]
+    assert [order_data["order_id"] for order_data in index.orders_on(date(2024, 5, 2))] == ["order-3"]
+
+
+def test_order_index_loads_entries_added_by_other_instances(workdir):
+    history = OrderHistory("json")
+    reader = OrderIndex()
+    history.append_many([make_order(1)])
+    assert reader.find("order-1") is not None
+
+    history.append_many([make_order(2)])
+    assert reader.find("order-2") is not None
+
+
+def test_order_index_rebuild_and_covers(workdir):
+    history = OrderHistory("json")
+    history.append_many([make_order(1), make_order(2)])
+    shard_path = OrderHistory.shard_path(DAY)
+
+    assert OrderIndex().rebuild([shard_path]) == 2
+    assert OrderIndex().covers(shard_path)
+    assert OrderIndex().find("order-1")["order_id"] == "order-1"
+
+    Database(shard_path).append(make_order(3))
+    assert not OrderIndex().covers(shard_path)
+
+
+def test_customer_index_normalizes_contacts(workdir):
+    assert CustomerIndex.normalize(" Sam@Example.COM ") == "email:sam@example.com"
+    assert CustomerIndex.normalize("+61 412 345 678") == "mobile:0412345678"
+    assert CustomerIndex.normalize("") is None
+
+
+def test_customer_index_returns_newest_orders_first(workdir):
+    OrderHistory("json").append_many([make_order(1), make_order(2), make_order(3, mobile_number="0499999999")])
+
+    assert CustomerIndex().orders("0412 345 678") == ["order-2", "order-1"]
+    assert CustomerIndex().orders("sam@example.com") == ["order-3", "order-2", "order-1"]
+    assert CustomerIndex().orders("0400000000") == []
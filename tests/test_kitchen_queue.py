@@ -0,0 +1,87 @@
+import os
+from classes.Config import Config
+from classes.KitchenConsumer import KitchenConsumer
+from classes.KitchenQueue import KitchenQueue
+
+
+def make_order(number: int) -> dict:
+    return {
+        "order_id": f"order-{number}",
+        "ticket_number": number,
+        "date_time": "2024-05-01 12:00:00",
+        "order_type": "Dine-In",
+        "table_number": 3,
+        "items": [{"id": 1, "name": "Burger", "quantity": 1}],
+        "payment_info": {"note": ""}
+    }
+
+
+def publish(kitchen_queue: KitchenQueue, start: int, count: int) -> list:
+    return kitchen_queue.publish_many([make_order(number) for number in range(start, start + count)])
+
+
+def test_consumer_reads_every_ticket_across_segments(workdir, monkeypatch):
+    monkeypatch.setattr(Config, "KDS_SEGMENT_TICKETS", 3)
+    kitchen_queue = KitchenQueue()
+    consumer = KitchenConsumer(kitchen_queue=kitchen_queue)
+    for start in range(1, 11):
+        publish(kitchen_queue, start, 1)
+
+    assert [record["sequence"] for record in consumer.poll(limit=4)] == [1, 2, 3, 4]
+    assert [record["sequence"] for record in consumer.poll()] == [5, 6, 7, 8, 9, 10]
+    assert consumer.poll() == []
+    assert consumer.skipped == 0
+
+
+def test_restarted_consumer_resumes_after_its_committed_offset(workdir):
+    kitchen_queue = KitchenQueue()
+    publish(kitchen_queue, 1, 5)
+    KitchenConsumer(kitchen_queue=kitchen_queue).commit(3)
+    KitchenConsumer(kitchen_queue=kitchen_queue).commit(2)
+
+    consumer = KitchenConsumer(kitchen_queue=kitchen_queue)
+    assert consumer.committed() == 3
+    assert [record["ticket"]["order_id"] for record in consumer.poll()] == ["order-4", "order-5"]
+
+
+def test_rotation_keeps_segments_a_consumer_has_not_handled(workdir, monkeypatch, capsys):
+    monkeypatch.setattr(Config, "KDS_SEGMENT_TICKETS", 2)
+    monkeypatch.setattr(Config, "KDS_RETAINED_SEGMENTS", 2)
+    kitchen_queue = KitchenQueue()
+    KitchenConsumer(kitchen_queue=kitchen_queue).commit(1)
+    for start in range(1, 11):
+        publish(kitchen_queue, start, 1)
+    consumer = KitchenConsumer(kitchen_queue=kitchen_queue)
+
+    assert kitchen_queue.segments()[0][0] == 1
+    assert "kitchen has only handled tickets up to 1" in capsys.readouterr().err
+    assert [record["sequence"] for record in consumer.poll()] == list(range(2, 11))
+
+    consumer.commit(10)
+    publish(kitchen_queue, 11, 1)
+    assert [first for first, _ in kitchen_queue.segments()] == [9, 11]
+
+
+def test_missing_tickets_are_counted_and_reported(workdir, monkeypatch, capsys):
+    monkeypatch.setattr(Config, "KDS_SEGMENT_TICKETS", 2)
+    kitchen_queue = KitchenQueue()
+    publish(kitchen_queue, 1, 6)
+    publish(kitchen_queue, 7, 1)
+    oldest = kitchen_queue.segments()[0][1]
+    os.remove(oldest)
+
+    consumer = KitchenConsumer(kitchen_queue=kitchen_queue)
+    assert [record["sequence"] for record in consumer.poll()] == [7]
+    assert consumer.skipped == 6
+    assert "6 kitchen tickets from 1" in capsys.readouterr().err
+
+
+def test_rotation_without_consumers_keeps_the_retained_segments(workdir, monkeypatch, capsys):
+    monkeypatch.setattr(Config, "KDS_SEGMENT_TICKETS", 2)
+    monkeypatch.setattr(Config, "KDS_RETAINED_SEGMENTS", 2)
+    kitchen_queue = KitchenQueue()
+    for start in range(1, 11):
+        publish(kitchen_queue, start, 1)
+
+    assert [first for first, _ in kitchen_queue.segments()] == [7, 9]
+    assert capsys.readouterr().err == ""
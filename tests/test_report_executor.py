@@ -0,0 +1,28 @@
+from datetime import date, timedelta
+from classes.OrderHistory import OrderHistory
+from classes.ReportExecutor import ReportExecutor
+from classes.SalesSummary import SalesSummary
+
+START = date(2024, 5, 1)
+
+
+def test_parallel_and_serial_totals_match(workdir):
+    history = OrderHistory("json")
+    history.append_many([
+        {
+            "order_id": f"order-{number}",
+            "date_time": f"{(START + timedelta(days=number)).isoformat()} 12:00:00",
+            "order_type": "Pick-Up",
+            "order_total": 12.5,
+            "items": [{"id": 2, "name": "Fries", "quantity": 2, "total_price": 12.5}]
+        }
+        for number in range(30)
+    ])
+    end = START + timedelta(days=29)
+
+    parallel = ReportExecutor(workers=2, order_history=history).run(SalesSummary, START, end)
+    serial = ReportExecutor(workers=1, order_history=history).run(SalesSummary, START, end)
+
+    assert parallel.order_count == serial.order_count == 30
+    assert parallel.revenue == serial.revenue == 375.0
+    assert parallel.items == serial.items
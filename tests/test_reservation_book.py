@@ -0,0 +1,145 @@
+import threading
+from datetime import date, datetime
+import pytest
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.Database import Database
+from classes.ReservationBook import ReservationBook
+from classes.TableLayout import TableLayout
+
+
+def make_reservation(number: int, day: str = "01/06/2030", time: str = "18:00", party_size: int = 2) -> dict:
+    return {
+        "reservation_id": f"reservation-{number}",
+        "date": day,
+        "time": time,
+        "name": f"Guest {number}",
+        "mobile_number": f"04000000{number:02d}",
+        "email": f"guest{number}@example.com",
+        "party_size": party_size,
+        "accommodations": ""
+    }
+
+
+def two_tops(count: int, combinable: bool = True) -> TableLayout:
+    return TableLayout([
+        {"id": table_id, "seats": 2,
+         "combinable_with": [other for other in (table_id - 1, table_id + 1) if combinable and 1 <= other <= count]}
+        for table_id in range(1, count + 1)
+    ])
+
+
+def test_add_appends_and_reads_in_start_order(workdir):
+    book = ReservationBook("json")
+    book.add(make_reservation(1, time="20:00"))
+    book.add(make_reservation(2, time="17:00"))
+    book.add(make_reservation(3, day="31/05/2030", time="19:00"))
+
+    stored = [item["reservation_id"] for item in Database(ReservationBook.HOT_PATH).read()]
+    assert stored == ["reservation-1", "reservation-2", "reservation-3"]
+    assert [item["reservation_id"] for item in book.between()] == ["reservation-3", "reservation-2", "reservation-1"]
+    assert [item["reservation_id"] for item in book.on_date(date(2030, 6, 1))] == ["reservation-2", "reservation-1"]
+
+
+def test_cancel_and_update_day_keep_other_days(workdir):
+    book = ReservationBook("json")
+    book.add(make_reservation(1, time="20:00"))
+    book.add(make_reservation(2, day="02/06/2030"))
+
+    assert book.cancel(make_reservation(1, time="20:00"))
+    assert not book.cancel(make_reservation(1, time="20:00"))
+    assert [item["reservation_id"] for item in book.between()] == ["reservation-2"]
+
+
+def test_archive_moves_past_reservations(workdir):
+    book = ReservationBook("json")
+    for number, day in enumerate(["01/06/2030", "02/06/2030", "03/06/2030"], start=1):
+        book.add(make_reservation(number, day=day))
+
+    assert book.archive(datetime(2030, 6, 3)) == 2
+    assert [item["reservation_id"] for item in Database(ReservationBook.ARCHIVE_PATH).read()] == [
+        "reservation-1", "reservation-2"
+    ]
+    assert [item["reservation_id"] for item in Database(ReservationBook.HOT_PATH).read()] == ["reservation-3"]
+    assert [item["reservation_id"] for item in book.between()] == ["reservation-1", "reservation-2", "reservation-3"]
+    assert [item["reservation_id"] for item in book.upcoming(datetime(2030, 6, 3))] == ["reservation-3"]
+
+
+def test_first_booking_of_the_day_archives_past_days(workdir):
+    Database(ReservationBook.HOT_PATH).append_many([
+        {**make_reservation(1, day="01/06/2020"), "starts_at": "2020-06-01 18:00"},
+        {**make_reservation(2, day="02/06/2020"), "starts_at": "2020-06-02 18:00"}
+    ])
+    book = ReservationBook("json")
+    book.add(make_reservation(3))
+
+    assert [item["reservation_id"] for item in Database(ReservationBook.HOT_PATH).read()] == ["reservation-3"]
+    assert len(Database(ReservationBook.ARCHIVE_PATH).read()) == 2
+    assert [item["reservation_id"] for item in book.on_date(date(2020, 6, 2))] == ["reservation-2"]
+
+
+def test_appended_bookings_are_inserted_without_sorting_again(workdir, monkeypatch):
+    book = ReservationBook("json")
+    for number, time in enumerate(["20:00", "18:00", "19:00"], start=1):
+        book.add(make_reservation(number, time=time))
+    book.between()
+
+    sorts = []
+    sorted_method = ReservationBook._sorted
+    monkeypatch.setattr(ReservationBook, "_sorted", lambda self, data: sorts.append(len(data)) or sorted_method(self, data))
+    book.add(make_reservation(4, time="18:30"))
+    book.add(make_reservation(5, time="17:00"))
+
+    assert sorts == []
+    assert [item["time"] for item in book.on_date(date(2030, 6, 1))] == ["17:00", "18:00", "18:30", "19:00", "20:00"]
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_add_rechecks_capacity_under_the_lock(workdir, backend):
+    book = ReservationBook(backend)
+    engine = AvailabilityEngine(book, two_tops(2), dining_minutes=90)
+    book.add(make_reservation(1, party_size=3), engine)
+
+    with pytest.raises(ValueError, match="fully booked"):
+        book.add(make_reservation(2, time="18:30", party_size=2), engine)
+    book.add(make_reservation(3, time="20:00", party_size=2), engine)
+
+    assert [item["reservation_id"] for item in book.between()] == ["reservation-1", "reservation-3"]
+
+
+def test_concurrent_bookings_cannot_overbook(workdir):
+    book = ReservationBook("json")
+    engine = AvailabilityEngine(book, two_tops(5, combinable=False), dining_minutes=90)
+    failures = []
+
+    def reserve(number: int) -> None:
+        try:
+            book.add(make_reservation(number, party_size=2), engine)
+        except ValueError:
+            failures.append(number)
+
+    threads = [threading.Thread(target=reserve, args=(number,)) for number in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(book.between()) == 5
+    assert len(failures) == 7
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_add_checks_the_table_sizes_not_the_total_seats(workdir, backend):
+    layout = TableLayout([
+        {"id": 1, "seats": 2, "combinable_with": []},
+        {"id": 2, "seats": 2, "combinable_with": []},
+        {"id": 3, "seats": 2, "combinable_with": []},
+        {"id": 4, "seats": 10, "combinable_with": []}
+    ])
+    book = ReservationBook(backend)
+    engine = AvailabilityEngine(book, layout, dining_minutes=90)
+    book.add(make_reservation(1, party_size=8), engine)
+
+    with pytest.raises(ValueError, match="fully booked"):
+        book.add(make_reservation(2, party_size=4), engine)
+    book.add(make_reservation(3, party_size=2), engine)
+    assert engine.largest_parties(date(2030, 6, 1), ["18:00", "20:00"]) == {"18:00": 2, "20:00": 10}
@@ -0,0 +1,108 @@
+import os
+from datetime import date
+from classes.Database import Database
+from classes.OrderHistory import OrderHistory
+from classes.SalesRollup import SalesRollup
+
+DAY = date(2024, 5, 1)
+
+
+def make_order(number: int, day: date = DAY) -> dict:
+    return {
+        "order_id": f"order-{number}",
+        "date_time": f"{day.isoformat()} 12:00:0{number % 10}",
+        "order_type": "Dine-In",
+        "subtotal": 10.0,
+        "order_total": 10.0,
+        "items": [{"id": 1, "name": "Burger", "quantity": 1, "price": 10.0, "total_price": 10.0}]
+    }
+
+
+def test_missing_rollup_is_seeded_from_the_shard(workdir):
+    history = OrderHistory("json")
+    history.append_many([make_order(1), make_order(2), make_order(3)])
+
+    fourth = make_order(4)
+    history.append_many([fourth])
+    SalesRollup(history).record_many([fourth])
+
+    rollup = SalesRollup(history).read_day(DAY)
+    assert rollup["order_count"] == 4
+    assert rollup["revenue"] == 40.0
+    assert rollup["items"]["1"]["quantity"] == 4
+
+
+def test_record_many_is_idempotent(workdir):
+    history = OrderHistory("json")
+    orders = [make_order(1), make_order(2)]
+    history.append_many(orders)
+
+    SalesRollup(history).record_many(orders)
+    SalesRollup(history).record_many(orders)
+
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 2
+
+
+def test_read_day_catches_up_with_orders_not_yet_recorded(workdir):
+    history = OrderHistory("json")
+    history.append_many([make_order(1)])
+    SalesRollup(history).record_many([make_order(1)])
+    history.append_many([make_order(2)])
+
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 2
+
+
+def test_empty_days_are_written(workdir):
+    rollup = SalesRollup(OrderHistory("json")).read_day(DAY)
+
+    assert rollup["order_count"] == 0
+    assert os.path.exists(SalesRollup.rollup_path(DAY))
+
+
+def test_split_legacy_does_not_double_count(workdir):
+    history = OrderHistory("json")
+    Database(OrderHistory.LEGACY_PATH).append_many([make_order(1), make_order(2)])
+    history.append_many([make_order(3)])
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 3
+
+    history.split_legacy()
+
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 3
+
+
+def test_rebuild_matches_the_history(workdir):
+    history = OrderHistory("json")
+    history.append_many([make_order(1), make_order(2), make_order(3, date(2024, 5, 2))])
+
+    assert SalesRollup(history).rebuild() == 2
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 2
+    assert SalesRollup(history).read_day(date(2024, 5, 2))["order_count"] == 1
+
+
+def test_sqlite_rollup_reads_only_new_rows(workdir, monkeypatch):
+    history = OrderHistory("sqlite")
+    history.append_many([make_order(1), make_order(2)])
+    SalesRollup(history).record_many([make_order(1)])
+
+    after = []
+    iter_rows_after = history.iter_rows_after
+    monkeypatch.setattr(history, "iter_rows_after", lambda day, rowid: after.append(rowid) or iter_rows_after(day, rowid))
+    history.append_many([make_order(3)])
+    SalesRollup(history).record_many([make_order(3)])
+
+    assert after == [2]
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 3
+
+
+def test_sqlite_read_day_picks_up_orders_written_elsewhere(workdir):
+    history = OrderHistory("sqlite")
+    history.append_many([make_order(1)])
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 1
+
+    OrderHistory("sqlite").append_many([make_order(2)])
+    assert SalesRollup(history).read_day(DAY)["order_count"] == 2
+
+    OrderHistory("sqlite").append_many([make_order(2)])
+    rollup = SalesRollup(history).read_day(DAY)
+    assert rollup["order_count"] == 2
+    assert rollup["revenue"] == 20.0
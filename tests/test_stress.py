@@ -0,0 +1,90 @@
+import threading
+from datetime import date
+from classes.Database import Database
+from classes.Invoice import Invoice
+from classes.KitchenQueue import KitchenQueue
+from classes.Menu import Menu
+from classes.OrderHistory import OrderHistory
+from classes.OrderIndex import OrderIndex
+from classes.OrderService import OrderService
+from classes.SalesRollup import SalesRollup
+
+THREADS = 8
+ROUNDS = 25
+
+
+def run_threads(target, count: int = THREADS) -> None:
+    errors = []
+
+    def guarded(number):
+        try:
+            target(number)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=guarded, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_updates_and_appends_lose_nothing(workdir):
+    def work(number):
+        for round_number in range(ROUNDS):
+            Database("./counter.json").update(lambda count: (count or 0) + 1)
+            Database("./records.jsonl").append({"thread": number, "round": round_number})
+
+    run_threads(work)
+
+    assert Database("./counter.json").read() == THREADS * ROUNDS
+    records = Database("./records.jsonl").read()
+    assert len(records) == THREADS * ROUNDS
+    assert len({(record["thread"], record["round"]) for record in records}) == THREADS * ROUNDS
+
+
+def test_menu_is_built_once_and_reloads_atomically(workdir):
+    instances = []
+    sizes = set()
+
+    def work(number):
+        instances.append(Menu())
+        for _ in range(ROUNDS):
+            if number % 2:
+                Menu().reload()
+            else:
+                menu = Menu()
+                sizes.add(len(menu))
+                assert menu.get(1) is not None
+
+    run_threads(work)
+
+    assert len({id(instance) for instance in instances}) == 1
+    assert sizes == {len(Menu())}
+
+
+def test_concurrent_orders_are_committed_exactly_once(workdir):
+    service = OrderService(Menu())
+    order_ids = []
+
+    def work(number):
+        for _ in range(ROUNDS):
+            invoice = service.place_order(
+                "Takeaway", {1: 1, 3: 2},
+                card_number="4111111111111111", expiration_date="12/40", cvv="123",
+                cardholder_name="Sam Lee", name="Sam Lee",
+                mobile_number=f"04123456{number:02d}", email="sam@example.com"
+            )
+            order_ids.append(invoice.order_data["order_id"])
+
+    run_threads(work)
+    assert Invoice.commit_queue.flush(10)
+
+    assert len(set(order_ids)) == THREADS * ROUNDS
+    history = OrderHistory("json")
+    stored = [order_data["order_id"] for order_data in history.iter_orders()]
+    assert sorted(stored) == sorted(order_ids)
+    assert all(OrderIndex().find(order_id) is not None for order_id in order_ids)
+    assert KitchenQueue().last_sequence() == THREADS * ROUNDS
+    assert SalesRollup(history).read_day(date.today())["order_count"] == THREADS * ROUNDS
@@ -0,0 +1,20 @@
+from datetime import date
+from classes.TicketCounter import TicketCounter
+
+DAY = date(2024, 5, 1)
+
+
+def test_tickets_are_sequential_across_processes(workdir):
+    numbers = []
+    for _ in range(3):
+        numbers.append(TicketCounter.next(DAY))
+        TicketCounter._block = {}
+
+    assert numbers == [1, 2, 3]
+
+
+def test_tickets_restart_every_day(workdir):
+    TicketCounter.next(DAY)
+    TicketCounter.next(DAY)
+
+    assert TicketCounter.next(date(2024, 5, 2)) == 1
@@ -0,0 +1,106 @@
+import threading
+from datetime import date
+from classes.AvailabilityEngine import AvailabilityEngine
+from classes.ReservationBook import ReservationBook
+from classes.TableLayout import TableLayout
+from classes.Waitlist import Waitlist
+
+DAY = date(2030, 6, 1)
+
+
+def make_request(number: int, time: str = "18:00", party_size: int = 2) -> dict:
+    return {
+        "date": "01/06/2030",
+        "time": time,
+        "name": f"Guest {number}",
+        "mobile_number": f"04000000{number:02d}",
+        "email": f"guest{number}@example.com",
+        "party_size": party_size,
+        "accommodations": ""
+    }
+
+
+def two_tops(count: int, combinable: bool = True) -> TableLayout:
+    return TableLayout([
+        {"id": table_id, "seats": 2,
+         "combinable_with": [other for other in (table_id - 1, table_id + 1) if combinable and 1 <= other <= count]}
+        for table_id in range(1, count + 1)
+    ])
+
+
+def test_queue_orders_by_time_then_arrival_and_drops_departures(workdir):
+    waitlist = Waitlist()
+    late = waitlist.join(make_request(1, time="19:00"))
+    first = waitlist.join(make_request(2))
+    second = waitlist.join(make_request(3))
+
+    assert [entry["waitlist_id"] for entry in waitlist.queue()] == [
+        first["waitlist_id"], second["waitlist_id"], late["waitlist_id"]
+    ]
+    assert waitlist.leave(first["waitlist_id"])
+    assert not waitlist.leave(first["waitlist_id"])
+    assert [entry["waitlist_id"] for entry in waitlist.queue()] == [second["waitlist_id"], late["waitlist_id"]]
+
+
+def test_departed_entries_are_removed_from_the_heaps(workdir):
+    waitlist = Waitlist()
+    entries = [waitlist.join(make_request(number)) for number in range(10)]
+    for entry in entries[:8]:
+        waitlist.leave(entry["waitlist_id"])
+
+    state = waitlist._state()
+    assert len(state["queue"]) <= 2 * len(state["entries"]) + 1
+    assert [entry["waitlist_id"] for entry in waitlist.queue()] == [entry["waitlist_id"] for entry in entries[8:]]
+
+
+def test_best_fit_prefers_the_largest_party_that_fits(workdir):
+    waitlist = Waitlist()
+    waitlist.join(make_request(1, party_size=2))
+    large = waitlist.join(make_request(2, party_size=4))
+    waitlist.join(make_request(3, party_size=30))
+
+    assert waitlist.best_fit(DAY, "18:00")["waitlist_id"] == large["waitlist_id"]
+    assert waitlist.best_fit(DAY, "18:00", seats=3)["party_size"] == 2
+
+
+def test_promote_considers_parties_waiting_near_the_freed_slot(workdir):
+    waitlist = Waitlist()
+    nearby = waitlist.join(make_request(1, time="18:30"))
+    waitlist.join(make_request(2, time="12:00"))
+
+    reservation = waitlist.promote(DAY, "18:00", 2)
+
+    assert reservation["name"] == nearby["name"]
+    assert [item["name"] for item in ReservationBook().on_date(DAY)] == ["Guest 1"]
+    assert [entry["name"] for entry in waitlist.queue()] == ["Guest 2"]
+
+
+def test_concurrent_promotions_book_each_party_once(workdir):
+    waitlist = Waitlist()
+    for number in range(3):
+        waitlist.join(make_request(number))
+    promoted = []
+
+    def promote() -> None:
+        reservation = Waitlist().promote(DAY, "18:00", 2)
+        if reservation:
+            promoted.append(reservation["name"])
+
+    threads = [threading.Thread(target=promote) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(promoted) == ["Guest 0", "Guest 1", "Guest 2"]
+    assert len(ReservationBook().on_date(DAY)) == 3
+    assert Waitlist().queue() == []
+
+
+def test_largest_parties_uses_one_index(workdir):
+    engine = AvailabilityEngine(ReservationBook(), two_tops(5), dining_minutes=60)
+    largest = engine.largest_parties(DAY, ["18:00", "23:00"], [
+        {"starts_at": "2030-06-01 18:00", "party_size": 6}
+    ])
+
+    assert largest == {"18:00": 4, "23:00": 0}